@@ -0,0 +1,37 @@
+"""Add asset image metadata columns
+
+Revision ID: a3f9c1d2e4b7
+Revises: 883ac57e0870
+Create Date: 2026-10-19 09:12:31.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f9c1d2e4b7'
+down_revision: Union[str, Sequence[str], None] = '883ac57e0870'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assets', sa.Column('image_width', sa.Integer(), nullable=True))
+    op.add_column('assets', sa.Column('image_height', sa.Integer(), nullable=True))
+    op.add_column('assets', sa.Column('image_aspect_ratio', sa.Float(), nullable=True))
+    op.add_column('assets', sa.Column('image_has_transparency', sa.Boolean(), nullable=True))
+    op.add_column('assets', sa.Column('image_color_depth', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('assets') as batch_op:
+        batch_op.drop_column('image_color_depth')
+        batch_op.drop_column('image_has_transparency')
+        batch_op.drop_column('image_aspect_ratio')
+        batch_op.drop_column('image_height')
+        batch_op.drop_column('image_width')
@@ -0,0 +1,28 @@
+"""Add asset listing index
+
+Revision ID: a7c2e9d4f1b3
+Revises: f1d3b8e6a2c9
+Create Date: 2026-10-19 17:42:05.118364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e9d4f1b3'
+down_revision: Union[str, Sequence[str], None] = 'f1d3b8e6a2c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_assets_user_id_uploaded_at', 'assets', ['user_id', 'uploaded_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_assets_user_id_uploaded_at', table_name='assets')
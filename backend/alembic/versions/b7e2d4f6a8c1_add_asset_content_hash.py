@@ -0,0 +1,31 @@
+"""Add asset content hash for upload deduplication
+
+Revision ID: b7e2d4f6a8c1
+Revises: a3f9c1d2e4b7
+Create Date: 2026-10-19 11:02:47.918364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4f6a8c1'
+down_revision: Union[str, Sequence[str], None] = 'a3f9c1d2e4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assets', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('idx_assets_user_id_content_hash', 'assets', ['user_id', 'content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_assets_user_id_content_hash', table_name='assets')
+    with op.batch_alter_table('assets') as batch_op:
+        batch_op.drop_column('content_hash')
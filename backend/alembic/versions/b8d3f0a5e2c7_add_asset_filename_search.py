@@ -0,0 +1,69 @@
+"""Add asset filename search
+
+Revision ID: b8d3f0a5e2c7
+Revises: a7c2e9d4f1b3
+Create Date: 2026-10-19 18:21:47.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d3f0a5e2c7'
+down_revision: Union[str, Sequence[str], None] = 'a7c2e9d4f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    
+    if dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE assets_fts USING fts5(
+                filename, user_key, asset_key, asset_id UNINDEXED,
+                prefix='2 3 4 5 6', detail='column', columnsize=0
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER assets_fts_insert AFTER INSERT ON assets BEGIN
+                INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+                VALUES (new.filename, replace(new.user_id, '-', ''), replace(new.id, '-', ''), new.id);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER assets_fts_delete AFTER DELETE ON assets BEGIN
+                DELETE FROM assets_fts WHERE assets_fts MATCH 'asset_key : ' || replace(old.id, '-', '');
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER assets_fts_update AFTER UPDATE OF filename, user_id ON assets BEGIN
+                DELETE FROM assets_fts WHERE assets_fts MATCH 'asset_key : ' || replace(old.id, '-', '');
+                INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+                VALUES (new.filename, replace(new.user_id, '-', ''), replace(new.id, '-', ''), new.id);
+            END
+        """)
+        op.execute("""
+            INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+            SELECT filename, replace(user_id, '-', ''), replace(id, '-', ''), id FROM assets
+        """)
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX idx_assets_filename_trgm ON assets USING gin (filename gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS assets_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS assets_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS assets_fts_insert")
+        op.execute("DROP TABLE IF EXISTS assets_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_assets_filename_trgm")
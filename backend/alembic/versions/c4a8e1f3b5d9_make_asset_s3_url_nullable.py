@@ -0,0 +1,31 @@
+"""Make asset s3_url nullable (URLs are generated on read)
+
+Revision ID: c4a8e1f3b5d9
+Revises: b7e2d4f6a8c1
+Create Date: 2026-10-19 12:31:05.662190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e1f3b5d9'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d4f6a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('assets') as batch_op:
+        batch_op.alter_column('s3_url', existing_type=sa.String(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE assets SET s3_url = '' WHERE s3_url IS NULL")
+    with op.batch_alter_table('assets') as batch_op:
+        batch_op.alter_column('s3_url', existing_type=sa.String(), nullable=False)
@@ -0,0 +1,31 @@
+"""Add asset text excerpt
+
+Revision ID: c9e4a1b6d3f8
+Revises: b8d3f0a5e2c7
+Create Date: 2026-10-19 19:05:12.684207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e4a1b6d3f8'
+down_revision: Union[str, Sequence[str], None] = 'b8d3f0a5e2c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assets', sa.Column('text_excerpt', sa.Text(), nullable=True))
+    op.add_column('assets', sa.Column('text_word_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('assets') as batch_op:
+        batch_op.drop_column('text_word_count')
+        batch_op.drop_column('text_excerpt')
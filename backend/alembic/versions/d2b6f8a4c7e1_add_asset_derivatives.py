@@ -0,0 +1,29 @@
+"""Add asset derivatives (email-optimized renditions)
+
+Revision ID: d2b6f8a4c7e1
+Revises: c4a8e1f3b5d9
+Create Date: 2026-10-19 14:02:47.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b6f8a4c7e1'
+down_revision: Union[str, Sequence[str], None] = 'c4a8e1f3b5d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assets', sa.Column('derivatives', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('assets') as batch_op:
+        batch_op.drop_column('derivatives')
@@ -0,0 +1,92 @@
+"""Replace duplicate single-column indexes with composite query indexes
+
+Revision ID: d8f2a6c4e1b9
+Revises: c9e4a1b6d3f8
+Create Date: 2026-10-19 21:14:52.406188
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f2a6c4e1b9'
+down_revision: Union[str, Sequence[str], None] = 'c9e4a1b6d3f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite indexes for the hot queries (filter column first, then sort/range column)
+    op.create_index('idx_campaigns_advertiser_id_created_at', 'campaigns', ['advertiser_id', 'created_at'], unique=False)
+    op.create_index('idx_campaigns_status_created_at', 'campaigns', ['status', 'created_at'], unique=False)
+    op.create_index('idx_campaigns_status_reviewed_at', 'campaigns', ['status', 'reviewed_at'], unique=False)
+    op.create_index('idx_performance_metrics_type_recorded_at', 'performance_metrics', ['metric_type', 'recorded_at'], unique=False)
+    op.create_index('idx_system_health_component_checked_at', 'system_health', ['component', 'checked_at'], unique=False)
+
+    # users.email keeps a single index, which enforces uniqueness
+    op.drop_index('idx_users_email', table_name='users')
+    op.create_index('idx_users_email', 'users', ['email'], unique=True)
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+
+    # Duplicates of the idx_* indexes (index=True on the column)
+    op.drop_index(op.f('ix_users_role'), table_name='users')
+    op.drop_index(op.f('ix_assets_category'), table_name='assets')
+    op.drop_index(op.f('ix_assets_uploaded_at'), table_name='assets')
+    op.drop_index(op.f('ix_assets_user_id'), table_name='assets')
+    op.drop_index(op.f('ix_campaigns_advertiser_id'), table_name='campaigns')
+    op.drop_index(op.f('ix_campaigns_created_at'), table_name='campaigns')
+    op.drop_index(op.f('ix_campaigns_reviewed_by'), table_name='campaigns')
+    op.drop_index(op.f('ix_campaigns_status'), table_name='campaigns')
+    op.drop_index(op.f('ix_campaign_assets_asset_id'), table_name='campaign_assets')
+    op.drop_index(op.f('ix_campaign_assets_campaign_id'), table_name='campaign_assets')
+    op.drop_index(op.f('ix_performance_metrics_metric_type'), table_name='performance_metrics')
+    op.drop_index(op.f('ix_performance_metrics_recorded_at'), table_name='performance_metrics')
+    op.drop_index(op.f('ix_system_health_checked_at'), table_name='system_health')
+    op.drop_index(op.f('ix_system_health_component'), table_name='system_health')
+
+    # Prefixes of a composite index or unique constraint
+    op.drop_index('idx_assets_user_id', table_name='assets')
+    op.drop_index('idx_campaigns_advertiser_id', table_name='campaigns')
+    op.drop_index('idx_campaigns_status', table_name='campaigns')
+    op.drop_index('idx_campaign_assets_campaign_id', table_name='campaign_assets')
+    op.drop_index('idx_performance_metrics_type', table_name='performance_metrics')
+    op.drop_index('idx_system_health_component', table_name='system_health')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_system_health_component', 'system_health', ['component'], unique=False)
+    op.create_index('idx_performance_metrics_type', 'performance_metrics', ['metric_type'], unique=False)
+    op.create_index('idx_campaign_assets_campaign_id', 'campaign_assets', ['campaign_id'], unique=False)
+    op.create_index('idx_campaigns_status', 'campaigns', ['status'], unique=False)
+    op.create_index('idx_campaigns_advertiser_id', 'campaigns', ['advertiser_id'], unique=False)
+    op.create_index('idx_assets_user_id', 'assets', ['user_id'], unique=False)
+
+    op.create_index(op.f('ix_system_health_component'), 'system_health', ['component'], unique=False)
+    op.create_index(op.f('ix_system_health_checked_at'), 'system_health', ['checked_at'], unique=False)
+    op.create_index(op.f('ix_performance_metrics_recorded_at'), 'performance_metrics', ['recorded_at'], unique=False)
+    op.create_index(op.f('ix_performance_metrics_metric_type'), 'performance_metrics', ['metric_type'], unique=False)
+    op.create_index(op.f('ix_campaign_assets_campaign_id'), 'campaign_assets', ['campaign_id'], unique=False)
+    op.create_index(op.f('ix_campaign_assets_asset_id'), 'campaign_assets', ['asset_id'], unique=False)
+    op.create_index(op.f('ix_campaigns_status'), 'campaigns', ['status'], unique=False)
+    op.create_index(op.f('ix_campaigns_reviewed_by'), 'campaigns', ['reviewed_by'], unique=False)
+    op.create_index(op.f('ix_campaigns_created_at'), 'campaigns', ['created_at'], unique=False)
+    op.create_index(op.f('ix_campaigns_advertiser_id'), 'campaigns', ['advertiser_id'], unique=False)
+    op.create_index(op.f('ix_assets_user_id'), 'assets', ['user_id'], unique=False)
+    op.create_index(op.f('ix_assets_uploaded_at'), 'assets', ['uploaded_at'], unique=False)
+    op.create_index(op.f('ix_assets_category'), 'assets', ['category'], unique=False)
+    op.create_index(op.f('ix_users_role'), 'users', ['role'], unique=False)
+
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.drop_index('idx_users_email', table_name='users')
+    op.create_index('idx_users_email', 'users', ['email'], unique=False)
+
+    op.drop_index('idx_system_health_component_checked_at', table_name='system_health')
+    op.drop_index('idx_performance_metrics_type_recorded_at', table_name='performance_metrics')
+    op.drop_index('idx_campaigns_status_reviewed_at', table_name='campaigns')
+    op.drop_index('idx_campaigns_status_created_at', table_name='campaigns')
+    op.drop_index('idx_campaigns_advertiser_id_created_at', table_name='campaigns')
@@ -0,0 +1,32 @@
+"""Add id to the approval queue index
+
+Revision ID: e3a7c5f9b2d4
+Revises: d8f2a6c4e1b9
+Create Date: 2026-10-19 22:03:17.584210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7c5f9b2d4'
+down_revision: Union[str, Sequence[str], None] = 'd8f2a6c4e1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The queue is paginated on (created_at, id); with id in the index the
+    # cursor predicate and the tiebreak order are served without a sort
+    op.drop_index('idx_campaigns_status_created_at', table_name='campaigns')
+    op.create_index('idx_campaigns_status_created_at', 'campaigns', ['status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_campaigns_status_created_at', table_name='campaigns')
+    op.create_index('idx_campaigns_status_created_at', 'campaigns', ['status', 'created_at'], unique=False)
@@ -0,0 +1,38 @@
+"""Add s3_deletions outbox table
+
+Revision ID: e5c9a2d7b3f4
+Revises: d2b6f8a4c7e1
+Create Date: 2026-10-19 15:20:13.804551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c9a2d7b3f4'
+down_revision: Union[str, Sequence[str], None] = 'd2b6f8a4c7e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('s3_deletions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('s3_key', sa.String(length=1024), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_s3_deletions_next_attempt_at', 's3_deletions', ['next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_s3_deletions_next_attempt_at', table_name='s3_deletions')
+    op.drop_table('s3_deletions')
@@ -0,0 +1,28 @@
+"""Add asset s3_key index
+
+Revision ID: f1d3b8e6a2c9
+Revises: e5c9a2d7b3f4
+Create Date: 2026-10-19 16:08:31.270915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d3b8e6a2c9'
+down_revision: Union[str, Sequence[str], None] = 'e5c9a2d7b3f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_assets_s3_key', 'assets', ['s3_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_assets_s3_key', table_name='assets')
@@ -0,0 +1,135 @@
+"""Store UUID keys as 16-byte binary on SQLite and native uuid on PostgreSQL
+
+Revision ID: f4b8d2e6a1c3
+Revises: e3a7c5f9b2d4
+Create Date: 2026-10-19 23:02:37.915264
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8d2e6a1c3'
+down_revision: Union[str, Sequence[str], None] = 'e3a7c5f9b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Primary and foreign key columns holding UUIDs, by table
+UUID_COLUMNS = {
+    'users': ['id'],
+    'assets': ['id', 'user_id'],
+    'campaigns': ['id', 'advertiser_id', 'reviewed_by'],
+    'campaign_assets': ['id', 'campaign_id', 'asset_id'],
+    'performance_metrics': ['id'],
+    'system_health': ['id'],
+    's3_deletions': ['id'],
+}
+
+# (name, table, column, referenced table, ondelete); PostgreSQL's default names
+# for the constraints created by the initial schema
+FOREIGN_KEYS = [
+    ('assets_user_id_fkey', 'assets', 'user_id', 'users', 'CASCADE'),
+    ('campaigns_advertiser_id_fkey', 'campaigns', 'advertiser_id', 'users', 'CASCADE'),
+    ('campaigns_reviewed_by_fkey', 'campaigns', 'reviewed_by', 'users', None),
+    ('campaign_assets_campaign_id_fkey', 'campaign_assets', 'campaign_id', 'campaigns', 'CASCADE'),
+    ('campaign_assets_asset_id_fkey', 'campaign_assets', 'asset_id', 'assets', 'CASCADE'),
+]
+
+# assets_fts triggers (see b8d3f0a5e2c7); the *_key placeholders are filled
+# with the FTS token expression of the user or asset ID
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER assets_fts_insert AFTER INSERT ON assets BEGIN
+        INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+        VALUES (new.filename, {new_user_key}, {new_asset_key}, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER assets_fts_delete AFTER DELETE ON assets BEGIN
+        DELETE FROM assets_fts WHERE assets_fts MATCH 'asset_key : ' || {old_asset_key};
+    END
+    """,
+    """
+    CREATE TRIGGER assets_fts_update AFTER UPDATE OF filename, user_id ON assets BEGIN
+        DELETE FROM assets_fts WHERE assets_fts MATCH 'asset_key : ' || {old_asset_key};
+        INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+        VALUES (new.filename, {new_user_key}, {new_asset_key}, new.id);
+    END
+    """,
+]
+
+
+def _uuid_to_blob(value):
+    return None if value is None else uuid.UUID(value).bytes
+
+
+def _blob_to_uuid(value):
+    return None if value is None else str(uuid.UUID(bytes=value))
+
+
+def _rewrite_sqlite(function, new_type, old_type, token) -> None:
+    """Convert every UUID value with function, retype the columns and rebuild the filename search index."""
+    bind = op.get_bind()
+    bind.connection.driver_connection.create_function('convert_uuid', 1, function, deterministic=True)
+
+    for trigger in ('assets_fts_insert', 'assets_fts_delete', 'assets_fts_update'):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    for table, columns in UUID_COLUMNS.items():
+        assignments = ", ".join(f"{column} = convert_uuid({column})" for column in columns)
+        op.execute(f"UPDATE {table} SET {assignments}")
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, type_=new_type, existing_type=old_type)
+
+    for trigger in FTS_TRIGGERS:
+        op.execute(trigger.format(
+            new_user_key=token('new.user_id'),
+            new_asset_key=token('new.id'),
+            old_asset_key=token('old.id'),
+        ))
+    # Re-index in upload order, which searches rely on as rowid order
+    op.execute("DELETE FROM assets_fts")
+    op.execute(f"""
+        INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+        SELECT filename, {token('user_id')}, {token('id')}, id FROM assets ORDER BY uploaded_at, id
+    """)
+
+
+def _retype_postgresql(new_type, old_type, cast: str) -> None:
+    """Retype the UUID columns in place, with foreign keys dropped while their two ends differ."""
+    for name, table, _, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=new_type, existing_type=old_type, postgresql_using=f"{column}::{cast}")
+
+    for name, table, column, referenced_table, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referenced_table, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        _rewrite_sqlite(_uuid_to_blob, sa.LargeBinary(length=16), sa.String(), lambda column: f"hex({column})")
+    elif dialect == 'postgresql':
+        _retype_postgresql(postgresql.UUID(), sa.String(), 'uuid')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        _rewrite_sqlite(_blob_to_uuid, sa.String(), sa.LargeBinary(length=16), lambda column: f"replace({column}, '-', '')")
+    elif dialect == 'postgresql':
+        _retype_postgresql(sa.String(), postgresql.UUID(), 'text')
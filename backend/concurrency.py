@@ -0,0 +1,90 @@
+"""Thread pools keeping blocking calls off the event loop."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+import asyncio
+import contextvars
+import functools
+
+import anyio.to_thread
+from fastapi import HTTPException, status
+
+from config import settings
+
+T = TypeVar("T")
+
+
+class Bulkhead:
+    """
+    Dedicated thread pool for blocking calls to one dependency.
+    
+    Each slow dependency (object storage, OpenAI, the MJML compiler) gets its
+    own pool, so a dependency that stalls can only exhaust its own threads:
+    the event loop and the request thread pool serving other endpoints keep
+    running. Calls beyond max_workers wait in a queue of at most max_queue;
+    further calls are rejected with 503 instead of piling up.
+    """
+    
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """Initialize the bulkhead and its thread pool."""
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        # Only updated from the event loop thread
+        self.pending = 0
+        self.rejected = 0
+    
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function in the bulkhead's pool and await its result.
+        
+        Args:
+            fn: Blocking function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        
+        Returns:
+            The return value of fn (exceptions raised by fn propagate)
+        
+        Raises:
+            HTTPException: 503 if the bulkhead's queue is full
+        """
+        if self.pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"The {self.name} service is busy, please retry shortly"
+            )
+        
+        self.pending += 1
+        try:
+            call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        finally:
+            self.pending -= 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Current pool usage."""
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "running": min(self.pending, self.max_workers),
+            "queued": max(self.pending - self.max_workers, 0),
+            "rejected": self.rejected,
+        }
+
+
+def configure_request_thread_pool() -> None:
+    """
+    Size the thread pool FastAPI runs sync handlers and dependencies in.
+    
+    Must be called from the running event loop (e.g. in the lifespan handler).
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.REQUEST_THREAD_POOL_SIZE
+
+
+# Global bulkhead instances, one per blocking dependency
+storage_bulkhead = Bulkhead("storage", settings.STORAGE_THREAD_POOL_SIZE, settings.BULKHEAD_MAX_QUEUE)
+openai_bulkhead = Bulkhead("openai", settings.OPENAI_THREAD_POOL_SIZE, settings.BULKHEAD_MAX_QUEUE)
+mjml_bulkhead = Bulkhead("mjml", settings.MJML_THREAD_POOL_SIZE, settings.BULKHEAD_MAX_QUEUE)
@@ -9,12 +9,79 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./dev.db"
     
+    # Connection pool of each engine (the sync and async engines have one each)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Wait for a free connection before failing
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Replace connections older than this
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout and reconnect if stale
+    
+    # Read replicas (comma-separated URLs of streamed copies of DATABASE_URL).
+    # Read-only endpoints are spread round-robin over the replicas; a replica
+    # whose connection fails is ejected for DB_REPLICA_EJECT_SECONDS. Users read
+    # from the primary for DB_REPLICA_STICKY_SECONDS after a write, so they see
+    # their own changes despite replication lag
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_EJECT_SECONDS: float = 30.0
+    DB_REPLICA_STICKY_SECONDS: float = 5.0
+    
+    # SQLite pragmas applied to every connection (WAL journal mode is always on)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait for a write lock instead of "database is locked"
+    SQLITE_MMAP_SIZE_BYTES: int = 268435456  # 256MB of the database file memory-mapped
+    
+    # Asset storage backend: "s3" (AWS S3 or S3-compatible endpoint) or "local"
+    STORAGE_BACKEND: str = "s3"
+    
+    # Local filesystem storage (development and offline benchmarks)
+    LOCAL_STORAGE_ROOT: str = "./storage"
+    LOCAL_STORAGE_BASE_URL: str = "http://localhost:8000"  # Public URL of this API, used in signed URLs
+    # Secret signing local URLs and upload policies; when unset a random key is
+    # generated per process, so signed URLs stop working after a restart
+    LOCAL_STORAGE_SIGNING_KEY: Optional[str] = None
+    
     # AWS S3
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     # S3 Bucket: Use 'email-assets-dev-goico' for development, 'email-assets-prod-goico' for production
     AWS_S3_BUCKET: str = "email-assets-dev-goico"
     AWS_REGION: str = "us-east-2"
+    # Optional S3-compatible endpoint (MinIO, LocalStack, benchmark stand-ins)
+    AWS_S3_ENDPOINT_URL: Optional[str] = None
+    
+    # Pre-signed asset URLs are generated on read and cached in-process until
+    # their remaining validity drops below the minimum
+    PRESIGNED_URL_EXPIRATION_SECONDS: int = 604800  # 7 days (SigV4 maximum)
+    PRESIGNED_URL_MIN_REMAINING_SECONDS: int = 86400  # Re-sign when less than 1 day remains
+    PRESIGNED_URL_CACHE_SIZE: int = 100000
+    
+    # Worker processes used to render image derivatives (resize/recompress)
+    DERIVATIVE_WORKERS: int = 2
+    
+    # Worker processes used to extract text from copy documents (txt, docx, pdf)
+    TEXT_EXTRACTION_WORKERS: int = 2
+    
+    # Interval at which the S3 deletion outbox is polled for retries
+    S3_DELETION_POLL_SECONDS: float = 30.0
+    
+    # Threads running sync route handlers and the database work of async handlers
+    REQUEST_THREAD_POOL_SIZE: int = 40
+    
+    # Dedicated thread pools (bulkheads) for blocking calls to slow dependencies;
+    # calls beyond the pool size queue up to BULKHEAD_MAX_QUEUE, then get a 503
+    STORAGE_THREAD_POOL_SIZE: int = 16
+    OPENAI_THREAD_POOL_SIZE: int = 8
+    MJML_THREAD_POOL_SIZE: int = 4
+    BULKHEAD_MAX_QUEUE: int = 256
+    
+    # Event loop stalls longer than the threshold are recorded as event_loop_lag metrics
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS: float = 0.5
+    EVENT_LOOP_LAG_THRESHOLD_SECONDS: float = 0.1
+    
+    # Authenticated users (id, email, name, role) are cached per process; role
+    # changes made through the ORM invalidate the entry, changes made by other
+    # processes are picked up after the TTL. A TTL of 0 disables the cache
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_USER_CACHE_SIZE: int = 10000
     
     # OpenAI
     OPENAI_API_KEY: Optional[str] = None
@@ -1,25 +1,55 @@
 """CRUD operations for database queries."""
+from .asset import (
+    get_assets_page,
+    count_assets,
+    search_assets,
+    get_assets_by_ids,
+)
 from .campaign import (
-    get_campaigns_by_user,
-    get_campaigns_by_status,
-    get_campaign_with_assets,
     link_assets_to_campaign,
+    get_approval_queue_page,
+    transition_campaign_status,
+    get_campaigns_by_user_async,
+    get_campaigns_by_status_async,
+    get_campaign_with_assets_async,
+    link_assets_to_campaign_async,
+    get_approval_queue_page_async,
+    transition_campaign_status_async,
 )
 from .metrics import (
     record_metric,
     get_queue_depth,
     calculate_approval_rate,
     calculate_time_to_approval,
+    calculate_deduplication_savings,
+    record_metric_async,
+    get_queue_depth_async,
+    calculate_approval_rate_async,
+    calculate_deduplication_savings_async,
 )
 
 __all__ = [
-    "get_campaigns_by_user",
-    "get_campaigns_by_status",
-    "get_campaign_with_assets",
+    "get_assets_page",
+    "count_assets",
+    "search_assets",
+    "get_assets_by_ids",
     "link_assets_to_campaign",
+    "get_approval_queue_page",
+    "transition_campaign_status",
+    "get_campaigns_by_user_async",
+    "get_campaigns_by_status_async",
+    "get_campaign_with_assets_async",
+    "link_assets_to_campaign_async",
+    "get_approval_queue_page_async",
+    "transition_campaign_status_async",
     "record_metric",
     "get_queue_depth",
     "calculate_approval_rate",
     "calculate_time_to_approval",
+    "calculate_deduplication_savings",
+    "record_metric_async",
+    "get_queue_depth_async",
+    "calculate_approval_rate_async",
+    "calculate_deduplication_savings_async",
 ]
 
@@ -0,0 +1,196 @@
+"""CRUD operations for asset database queries."""
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import column, func, table, text
+from sqlalchemy.orm import Session
+
+from models.asset import Asset
+from crud.keyset import after_cursor, split_page, timestamp_value
+
+# Filename search terms are runs of letters and digits; "summer_sale-v2.png"
+# is indexed as summer, sale, v2 and png
+SEARCH_TERM_PATTERN = re.compile(r"[^\W_]+")
+
+# Maximum number of terms taken from a search query
+MAX_SEARCH_TERMS = 8
+
+# FTS5 table maintained by triggers on SQLite (see models/asset.py)
+assets_fts = table("assets_fts", column("asset_id"))
+
+
+def _asset_filters(
+    db: Session,
+    user_id: str,
+    category: Optional[str] = None,
+    file_type: Optional[str] = None,
+    uploaded_after: Optional[datetime] = None,
+    uploaded_before: Optional[datetime] = None
+) -> List[Any]:
+    """Build the WHERE clauses shared by the asset page and count queries."""
+    dialect_name = db.get_bind().dialect.name
+    filters = [Asset.user_id == user_id]
+    if category is not None:
+        filters.append(Asset.category == category)
+    if file_type is not None:
+        filters.append(Asset.file_type == file_type)
+    if uploaded_after is not None:
+        filters.append(Asset.uploaded_at >= timestamp_value(dialect_name, uploaded_after))
+    if uploaded_before is not None:
+        filters.append(Asset.uploaded_at < timestamp_value(dialect_name, uploaded_before))
+    return filters
+
+
+def get_assets_page(
+    db: Session,
+    user_id: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    category: Optional[str] = None,
+    file_type: Optional[str] = None,
+    uploaded_after: Optional[datetime] = None,
+    uploaded_before: Optional[datetime] = None
+) -> Tuple[List[Asset], Optional[str]]:
+    """
+    Get one page of a user's assets, newest first, using keyset pagination.
+    
+    Pages are ordered by (uploaded_at, id) descending and continue strictly
+    after the cursor position, so each page is an index range scan on
+    idx_assets_user_id_uploaded_at regardless of how deep the client pages.
+    
+    Args:
+        db: Database session
+        user_id: ID of the owning user
+        limit: Maximum number of assets in the page
+        cursor: Cursor returned with the previous page (None for the first page)
+        category: Only return assets in this category
+        file_type: Only return assets with this MIME type
+        uploaded_after: Only return assets uploaded at or after this time
+        uploaded_before: Only return assets uploaded before this time
+    
+    Returns:
+        Tuple of (assets, next_cursor) where next_cursor is None on the last page
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = db.query(Asset).filter(*_asset_filters(
+        db, user_id, category, file_type, uploaded_after, uploaded_before
+    ))
+    
+    if cursor is not None:
+        query = query.filter(after_cursor(Asset.uploaded_at, Asset.id, db.get_bind().dialect.name, cursor, descending=True))
+    
+    # Fetch one extra row to learn whether another page exists
+    assets = query.order_by(Asset.uploaded_at.desc(), Asset.id.desc()).limit(limit + 1).all()
+    return split_page(assets, limit, "uploaded_at")
+
+
+def count_assets(
+    db: Session,
+    user_id: str,
+    category: Optional[str] = None,
+    file_type: Optional[str] = None,
+    uploaded_after: Optional[datetime] = None,
+    uploaded_before: Optional[datetime] = None
+) -> int:
+    """
+    Count a user's assets matching the listing filters.
+    
+    Without category or file type filters this is an index-only count on
+    idx_assets_user_id_uploaded_at.
+    
+    Args:
+        db: Database session
+        user_id: ID of the owning user
+        category: Only count assets in this category
+        file_type: Only count assets with this MIME type
+        uploaded_after: Only count assets uploaded at or after this time
+        uploaded_before: Only count assets uploaded before this time
+    
+    Returns:
+        Number of matching assets
+    """
+    return db.query(func.count()).select_from(Asset).filter(*_asset_filters(
+        db, user_id, category, file_type, uploaded_after, uploaded_before
+    )).scalar()
+
+
+def parse_search_terms(query: str) -> List[str]:
+    """
+    Split a filename search query into lowercase terms.
+    
+    Args:
+        query: Raw search query
+    
+    Returns:
+        Up to MAX_SEARCH_TERMS terms (empty if the query has no letters or digits)
+    """
+    return SEARCH_TERM_PATTERN.findall(query.lower())[:MAX_SEARCH_TERMS]
+
+
+def search_assets(db: Session, user_id: str, query: str, limit: int) -> List[Asset]:
+    """
+    Search a user's assets by filename, newest first.
+    
+    Every query term must match the start of a word in the filename, so
+    "sum hero" finds "Summer_Sale-hero.png". SQLite answers from the
+    assets_fts FTS5 index (scoped to the user inside the index); Postgres
+    uses word-start regular expressions accelerated by the pg_trgm GIN index
+    idx_assets_filename_trgm.
+    
+    Args:
+        db: Database session
+        user_id: ID of the owning user
+        query: Search query
+        limit: Maximum number of assets to return
+    
+    Returns:
+        List of matching Asset objects
+    """
+    terms = parse_search_terms(query)
+    if not terms:
+        return []
+    
+    if db.get_bind().dialect.name == "sqlite":
+        # Terms only contain letters and digits, so quoting them is safe;
+        # the index stores user and asset IDs as single hex tokens (hex() of
+        # the binary ID; FTS5 matches them case-insensitively)
+        prefixes = " AND ".join(f'"{term}"*' for term in terms)
+        match = f'user_key : {user_id.replace("-", "")} AND filename : ({prefixes})'
+        
+        # Matches are joined to their assets and sorted like the listing: FTS
+        # rowid order is not upload order, since renaming re-inserts the row
+        search_query = db.query(Asset).join(assets_fts, assets_fts.c.asset_id == Asset.id).filter(
+            text("assets_fts MATCH :match").bindparams(match=match)
+        )
+    else:
+        search_query = db.query(Asset).filter(
+            Asset.user_id == user_id,
+            *[Asset.filename.op("~*")(f"(^|[^[:alnum:]]){term}") for term in terms]
+        )
+    
+    return search_query.order_by(Asset.uploaded_at.desc(), Asset.id.desc()).limit(limit).all()
+
+
+def get_assets_by_ids(db: Session, asset_ids: List[str], user_id: str) -> Dict[str, Asset]:
+    """
+    Load the given assets owned by a user in one query.
+    
+    Ownership is checked in SQL, so assets that do not exist and assets
+    owned by other users are both left out.
+    
+    Args:
+        db: Database session
+        asset_ids: IDs of the assets to load
+        user_id: ID of the requesting user
+    
+    Returns:
+        Dict mapping asset ID to Asset for every owned asset
+    """
+    if not asset_ids:
+        return {}
+    
+    assets = db.query(Asset).filter(Asset.id.in_(set(asset_ids)), Asset.user_id == user_id).all()
+    return {asset.id: asset for asset in assets}
@@ -1,92 +1,267 @@
 """CRUD operations for campaign database queries."""
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import joinedload
 
 from models.campaign import Campaign
 from models.campaign_asset import CampaignAsset
 from models.asset import Asset
+from crud.keyset import after_cursor, split_page
 
+# Columns returned by the approval queue; the generated email is left out
+APPROVAL_QUEUE_COLUMNS = (
+    Campaign.id,
+    Campaign.advertiser_id,
+    Campaign.campaign_name,
+    Campaign.target_audience,
+    Campaign.campaign_goal,
+    Campaign.status,
+    Campaign.generated_email_html.isnot(None).label("has_proof"),
+    Campaign.created_at,
+    Campaign.updated_at,
+)
 
-def get_campaigns_by_user(db: Session, user_id: str) -> List[Campaign]:
+# Campaign status transitions: action -> (status the campaign must be in, status it moves to)
+CAMPAIGN_STATUS_TRANSITIONS = {
+    "submit": ("draft", "pending_approval"),
+    "approve": ("pending_approval", "approved"),
+    "reject": ("pending_approval", "rejected"),
+}
+
+
+def campaigns_by_user_statement(user_id: str):
+    """Build the query for all campaigns of an advertiser, oldest first."""
+    return select(Campaign).where(Campaign.advertiser_id == user_id).order_by(Campaign.created_at)
+
+
+def campaigns_by_status_statement(status: str):
+    """Build the query for all campaigns with a status, oldest first."""
+    return select(Campaign).where(Campaign.status == status).order_by(Campaign.created_at)
+
+
+def _approval_queue_statement(dialect_name: str, limit: int, cursor: Optional[str]):
+    """Build the approval queue page query for get_approval_queue_page(_async)."""
+    statement = select(*APPROVAL_QUEUE_COLUMNS).where(Campaign.status == "pending_approval")
+    if cursor is not None:
+        statement = statement.where(after_cursor(Campaign.created_at, Campaign.id, dialect_name, cursor, descending=False))
+    # Fetch one extra row to learn whether another page exists
+    return statement.order_by(Campaign.created_at, Campaign.id).limit(limit + 1)
+
+
+def _status_transition_statement(
+    campaign_id: str,
+    action: str,
+    values: Optional[Dict[str, Any]],
+    conditions: Iterable[Any]
+):
+    """Build the conditional UPDATE for transition_campaign_status(_async)."""
+    expected_status, new_status = CAMPAIGN_STATUS_TRANSITIONS[action]
+    return (
+        update(Campaign)
+        .where(Campaign.id == campaign_id, Campaign.status == expected_status, *conditions)
+        .values(status=new_status, **(values or {}))
+        .returning(Campaign.id, Campaign.campaign_name, Campaign.status)
+    )
+
+
+def _campaign_asset_rows(
+    campaign_id: str,
+    asset_ids: List[str],
+    asset_roles: Optional[List[str]],
+    display_orders: Optional[List[int]]
+) -> List[Dict[str, Any]]:
+    """Build campaign_assets parameter sets for link_assets_to_campaign(_async)."""
+    rows = []
+    for idx, asset_id in enumerate(asset_ids):
+        asset_role = asset_roles[idx] if asset_roles and idx < len(asset_roles) else None
+        display_order = display_orders[idx] if display_orders and idx < len(display_orders) else idx
+        
+        rows.append({
+            "campaign_id": campaign_id,
+            "asset_id": asset_id,
+            "asset_role": asset_role,
+            "display_order": display_order
+        })
+    return rows
+
+
+# Bulk INSERT of links; the driver sends batched multi-row INSERT ... RETURNING
+# statements and returns the created records in parameter order
+LINK_ASSETS_STATEMENT = insert(CampaignAsset).returning(CampaignAsset, sort_by_parameter_order=True)
+
+
+def link_assets_to_campaign(
+    db: Session,
+    campaign_id: str,
+    asset_ids: List[str],
+    asset_roles: Optional[List[str]] = None,
+    display_orders: Optional[List[int]] = None
+) -> List[CampaignAsset]:
     """
-    Get all campaigns for a specific user.
+    Link assets to a campaign by creating CampaignAsset records.
+    
+    All links are written with one bulk INSERT ... RETURNING instead of a
+    unit-of-work flush of one object per asset.
+    
+    Args:
+        db: Database session
+        campaign_id: ID of the campaign
+        asset_ids: List of asset IDs to link
+        asset_roles: Optional list of asset roles (e.g., "primary_logo", "hero_image")
+        display_orders: Optional list of display orders
+    
+    Returns:
+        List of created CampaignAsset objects
+    """
+    if not asset_ids:
+        return []
+    rows = _campaign_asset_rows(campaign_id, asset_ids, asset_roles, display_orders)
+    return list(db.scalars(LINK_ASSETS_STATEMENT, rows))
+
+
+def get_approval_queue_page(
+    db: Session,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    Get one page of the approval queue, oldest first, using keyset pagination.
+    
+    Pages are ordered by (created_at, id) and continue strictly after the
+    cursor position, so each page is a range scan on
+    idx_campaigns_status_created_at however long the queue is. Rows hold the
+    summary columns in APPROVAL_QUEUE_COLUMNS.
+    
+    Args:
+        db: Database session
+        limit: Maximum number of campaigns in the page
+        cursor: Cursor returned with the previous page (None for the first page)
+    
+    Returns:
+        Tuple of (rows, next_cursor) where next_cursor is None on the last page
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    statement = _approval_queue_statement(db.get_bind().dialect.name, limit, cursor)
+    return split_page(db.execute(statement).all(), limit, "created_at")
+
+
+def transition_campaign_status(
+    db: Session,
+    campaign_id: str,
+    action: str,
+    values: Optional[Dict[str, Any]] = None,
+    conditions: Iterable[Any] = ()
+) -> Optional[Row]:
+    """
+    Move a campaign to the next status with a single compare-and-set UPDATE.
+    
+    The UPDATE only matches while the campaign is in the status the action
+    starts from (see CAMPAIGN_STATUS_TRANSITIONS) and satisfies conditions,
+    so of two concurrent transitions exactly one succeeds and the other
+    matches no row instead of overwriting the first.
     
     Args:
         db: Database session
+        campaign_id: ID of the campaign
+        action: Key of CAMPAIGN_STATUS_TRANSITIONS (submit, approve, reject)
+        values: Other columns to set along with the status (e.g. reviewed_by)
+        conditions: Extra WHERE clauses the campaign must satisfy
+    
+    Returns:
+        Row of (id, campaign_name, status) after the update, or None if the
+        campaign does not exist, is in another status or fails a condition
+    """
+    statement = _status_transition_statement(campaign_id, action, values, conditions)
+    return db.execute(statement).first()
+
+
+# Async executors used by the async route handlers. Relationships are never
+# lazy-loaded from async code, so every query eagerly loads what callers read.
+
+
+async def get_campaigns_by_user_async(db: AsyncSession, user_id: str) -> List[Campaign]:
+    """
+    Get all campaigns for a specific user.
+    
+    Args:
+        db: Async database session
         user_id: ID of the user
-        
+    
     Returns:
-        List of Campaign objects
+        List of Campaign objects, oldest first
     """
-    return db.query(Campaign).filter(Campaign.advertiser_id == user_id).all()
+    return list(await db.scalars(campaigns_by_user_statement(user_id)))
 
 
-def get_campaigns_by_status(db: Session, status: str) -> List[Campaign]:
+async def get_campaigns_by_status_async(db: AsyncSession, status: str) -> List[Campaign]:
     """
     Get all campaigns with a specific status.
     
     Args:
-        db: Database session
+        db: Async database session
         status: Campaign status (draft, pending_approval, approved, rejected)
-        
+    
     Returns:
-        List of Campaign objects
+        List of Campaign objects, oldest first
     """
-    return db.query(Campaign).filter(Campaign.status == status).all()
+    return list(await db.scalars(campaigns_by_status_statement(status)))
+
 
+async def get_approval_queue_page_async(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Row], Optional[str]]:
+    """Async executor of get_approval_queue_page; see it for arguments and results."""
+    statement = _approval_queue_statement(db.get_bind().dialect.name, limit, cursor)
+    return split_page((await db.execute(statement)).all(), limit, "created_at")
 
-def get_campaign_with_assets(db: Session, campaign_id: str) -> Optional[Campaign]:
+
+async def get_campaign_with_assets_async(db: AsyncSession, campaign_id: str) -> Optional[Campaign]:
     """
     Get a campaign with its linked assets.
     
     Args:
-        db: Database session
+        db: Async database session
         campaign_id: ID of the campaign
-        
+    
     Returns:
         Campaign object with campaign_assets relationship loaded, or None if not found
     """
-    return db.query(Campaign).options(
-        joinedload(Campaign.campaign_assets).joinedload(CampaignAsset.asset)
-    ).filter(Campaign.id == campaign_id).first()
+    result = await db.scalars(
+        select(Campaign).options(
+            joinedload(Campaign.campaign_assets).joinedload(CampaignAsset.asset)
+        ).where(Campaign.id == campaign_id)
+    )
+    return result.unique().first()
 
 
-def link_assets_to_campaign(
-    db: Session,
+async def link_assets_to_campaign_async(
+    db: AsyncSession,
     campaign_id: str,
     asset_ids: List[str],
     asset_roles: Optional[List[str]] = None,
     display_orders: Optional[List[int]] = None
 ) -> List[CampaignAsset]:
-    """
-    Link assets to a campaign by creating CampaignAsset records.
-    
-    Args:
-        db: Database session
-        campaign_id: ID of the campaign
-        asset_ids: List of asset IDs to link
-        asset_roles: Optional list of asset roles (e.g., "primary_logo", "hero_image")
-        display_orders: Optional list of display orders
-        
-    Returns:
-        List of created CampaignAsset objects
-    """
-    campaign_assets = []
-    
-    for idx, asset_id in enumerate(asset_ids):
-        asset_role = asset_roles[idx] if asset_roles and idx < len(asset_roles) else None
-        display_order = display_orders[idx] if display_orders and idx < len(display_orders) else idx
-        
-        campaign_asset = CampaignAsset(
-            campaign_id=campaign_id,
-            asset_id=asset_id,
-            asset_role=asset_role,
-            display_order=display_order
-        )
-        db.add(campaign_asset)
-        campaign_assets.append(campaign_asset)
-    
-    db.flush()  # Flush to get IDs without committing
-    return campaign_assets
+    """Async executor of link_assets_to_campaign; see it for arguments and results."""
+    if not asset_ids:
+        return []
+    rows = _campaign_asset_rows(campaign_id, asset_ids, asset_roles, display_orders)
+    return list(await db.scalars(LINK_ASSETS_STATEMENT, rows))
+
 
+async def transition_campaign_status_async(
+    db: AsyncSession,
+    campaign_id: str,
+    action: str,
+    values: Optional[Dict[str, Any]] = None,
+    conditions: Iterable[Any] = ()
+) -> Optional[Row]:
+    """Async executor of transition_campaign_status; see it for arguments and results."""
+    statement = _status_transition_statement(campaign_id, action, values, conditions)
+    return (await db.execute(statement)).first()
@@ -0,0 +1,110 @@
+"""Keyset pagination over (timestamp, id) shared by the asset listing and the approval queue."""
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import String, literal, tuple_
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """
+    Encode a position in a (timestamp, id) ordering as an opaque cursor.
+    
+    Args:
+        timestamp: Timestamp of the last row of a page
+        row_id: ID of the last row of a page
+    
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([timestamp.isoformat(), row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+    
+    Returns:
+        Tuple of (timestamp, row_id)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def timestamp_value(dialect_name: str, value: datetime) -> Any:
+    """
+    Bind a datetime for comparison against a server-defaulted timestamp column.
+    
+    SQLite stores the CURRENT_TIMESTAMP default as UTC text without fractional
+    seconds, while SQLAlchemy binds datetimes with microseconds. Comparing
+    against the stored text form keeps rows from the cursor's second from
+    being returned twice.
+    
+    Args:
+        dialect_name: Name of the database dialect
+        value: Datetime to compare with
+    
+    Returns:
+        Bind value for the dialect
+    """
+    if dialect_name != "sqlite":
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    storage_format = "%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S"
+    return literal(value.strftime(storage_format), String)
+
+
+def after_cursor(timestamp_column: Any, id_column: Any, dialect_name: str, cursor: str, descending: bool) -> Any:
+    """
+    Build the WHERE clause continuing a (timestamp, id) ordering strictly after a cursor.
+    
+    Args:
+        timestamp_column: Timestamp column of the ordering
+        id_column: ID column breaking timestamp ties
+        dialect_name: Name of the database dialect
+        cursor: Cursor returned with the previous page
+        descending: Whether the ordering is newest first
+    
+    Returns:
+        Row-value comparison usable as a range condition on a (timestamp, id) index
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    cursor_timestamp, cursor_id = decode_cursor(cursor)
+    # The ID is bound with the column type so it compares as a UUID, not as text
+    position = tuple_(timestamp_value(dialect_name, cursor_timestamp), literal(cursor_id, id_column.type))
+    columns = tuple_(timestamp_column, id_column)
+    return columns < position if descending else columns > position
+
+
+def split_page(rows: Sequence[Any], limit: int, timestamp_attribute: str) -> Tuple[List[Any], Optional[str]]:
+    """
+    Split the extra row off a page fetched with LIMIT limit + 1 and build the next cursor.
+    
+    Args:
+        rows: Fetched rows, at most limit + 1
+        limit: Page size
+        timestamp_attribute: Name of the rows' timestamp attribute
+    
+    Returns:
+        Tuple of (rows, next_cursor) where next_cursor is None on the last page
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(getattr(rows[-1], timestamp_attribute), rows[-1].id)
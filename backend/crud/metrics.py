@@ -1,12 +1,102 @@
 """CRUD operations for performance metrics."""
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import Optional, Dict, Any
+from sqlalchemy import func, select
+from typing import Optional, Dict, Any, List, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 
 from models.performance_metric import PerformanceMetric
 from models.campaign import Campaign
+from models.asset import Asset
+
+# Statements are built once and run by the sync executors (scripts, request
+# threads) and the async executors (async route handlers) alike
+
+
+def _build_metric(metric_type: str, metric_value: float, metadata: Optional[Dict[str, Any]]) -> PerformanceMetric:
+    """Build the PerformanceMetric row added by record_metric(_async)."""
+    return PerformanceMetric(
+        metric_type=metric_type,
+        metric_value=Decimal(str(metric_value)),
+        metadata_json=metadata
+    )
+
+
+def _queue_depth_statement():
+    """Build the pending campaign count for get_queue_depth(_async)."""
+    return select(func.count()).select_from(Campaign).where(Campaign.status == "pending_approval")
+
+
+def _approval_rate_statement(days: int):
+    """Build the per-status review counts for calculate_approval_rate(_async)."""
+    cutoff_date = datetime.now() - timedelta(days=days)
+    return select(Campaign.status, func.count()).where(
+        Campaign.reviewed_at >= cutoff_date,
+        Campaign.status.in_(["approved", "rejected"])
+    ).group_by(Campaign.status)
+
+
+def _approval_rate_result(status_counts: List[Tuple[str, int]], days: int) -> Dict[str, Any]:
+    """Build the calculate_approval_rate result from (status, count) rows."""
+    counts = dict(status_counts)
+    approved_count = counts.get("approved", 0)
+    rejected_count = counts.get("rejected", 0)
+    total_reviewed = approved_count + rejected_count
+    approval_rate = (approved_count / total_reviewed * 100) if total_reviewed > 0 else 0.0
+    return {
+        "approval_rate": round(approval_rate, 2),
+        "total_reviewed": total_reviewed,
+        "approved_count": approved_count,
+        "rejected_count": rejected_count,
+        "days": days
+    }
+
+
+def _deduplication_savings_statements() -> Tuple[Any, Any, Any, Any]:
+    """
+    Build the queries for calculate_deduplication_savings(_async).
+    
+    Returns:
+        Tuple of (deduplicated upload count and bytes saved, average upload
+        throughput, logical storage bytes, stored bytes) queries
+    """
+    # Logical storage counts every asset; stored bytes count each S3 object once
+    stored_objects = select(
+        func.max(Asset.file_size_bytes).label("size_bytes")
+    ).group_by(Asset.s3_key).subquery()
+    return (
+        select(
+            func.count(PerformanceMetric.id),
+            func.coalesce(func.sum(PerformanceMetric.metric_value), 0)
+        ).where(PerformanceMetric.metric_type == "upload_dedup_bytes_saved"),
+        select(func.avg(PerformanceMetric.metric_value)).where(
+            PerformanceMetric.metric_type == "asset_upload_throughput"
+        ),
+        select(func.coalesce(func.sum(Asset.file_size_bytes), 0)),
+        select(func.coalesce(func.sum(stored_objects.c.size_bytes), 0)),
+    )
+
+
+def _deduplication_savings_result(
+    deduplicated_uploads: int,
+    bytes_saved: Any,
+    average_throughput_kbps: Any,
+    logical_storage_bytes: Any,
+    stored_bytes: Any
+) -> Dict[str, Any]:
+    """Build the calculate_deduplication_savings result from its query results."""
+    estimated_seconds_saved = 0.0
+    if average_throughput_kbps:
+        estimated_seconds_saved = float(bytes_saved) / 1024 / float(average_throughput_kbps)
+    
+    return {
+        "deduplicated_uploads": deduplicated_uploads,
+        "bytes_saved": int(bytes_saved),
+        "estimated_upload_seconds_saved": round(estimated_seconds_saved, 2),
+        "logical_storage_bytes": int(logical_storage_bytes),
+        "stored_bytes": int(stored_bytes),
+    }
 
 
 def record_metric(
@@ -23,15 +113,11 @@ def record_metric(
         metric_type: Type of metric (e.g., "proof_generation_time", "api_response_time")
         metric_value: Value of the metric (e.g., time in seconds)
         metadata: Optional dictionary with additional context
-        
+    
     Returns:
         PerformanceMetric: Created metric record
     """
-    metric = PerformanceMetric(
-        metric_type=metric_type,
-        metric_value=Decimal(str(metric_value)),
-        metadata_json=metadata
-    )
+    metric = _build_metric(metric_type, metric_value, metadata)
     
     db.add(metric)
     db.flush()  # Flush to get ID without committing
@@ -47,48 +133,28 @@ def get_queue_depth(db: Session) -> int:
     
     Args:
         db: Database session
-        
+    
     Returns:
         int: Number of campaigns pending approval
     """
-    return db.query(Campaign).filter(Campaign.status == "pending_approval").count()
+    return db.scalar(_queue_depth_statement())
 
 
 def calculate_approval_rate(db: Session, days: int = 7) -> Dict[str, Any]:
     """
     Calculate campaign approval rate over a specified time period.
     
+    Reviews are counted per status in the database instead of loading the
+    reviewed campaigns.
+    
     Args:
         db: Database session
         days: Number of days to look back (default: 7)
-        
+    
     Returns:
         Dict with approval_rate (percentage), total_reviewed, approved_count, rejected_count
     """
-    cutoff_date = datetime.now() - timedelta(days=days)
-    
-    # Get all reviewed campaigns (approved or rejected) within the time period
-    reviewed_campaigns = db.query(Campaign).filter(
-        and_(
-            Campaign.reviewed_at >= cutoff_date,
-            Campaign.status.in_(["approved", "rejected"])
-        )
-    ).all()
-    
-    total_reviewed = len(reviewed_campaigns)
-    approved_count = sum(1 for c in reviewed_campaigns if c.status == "approved")
-    rejected_count = sum(1 for c in reviewed_campaigns if c.status == "rejected")
-    
-    # Calculate approval rate percentage
-    approval_rate = (approved_count / total_reviewed * 100) if total_reviewed > 0 else 0.0
-    
-    return {
-        "approval_rate": round(approval_rate, 2),
-        "total_reviewed": total_reviewed,
-        "approved_count": approved_count,
-        "rejected_count": rejected_count,
-        "days": days
-    }
+    return _approval_rate_result(db.execute(_approval_rate_statement(days)).all(), days)
 
 
 def calculate_time_to_approval(db: Session, days: int = 7) -> Optional[float]:
@@ -100,15 +166,15 @@ def calculate_time_to_approval(db: Session, days: int = 7) -> Optional[float]:
     Args:
         db: Database session
         days: Number of days to look back (default: 7)
-        
+    
     Returns:
         float: Average time to approval in hours, or None if no approved campaigns found
     """
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    # Get approved campaigns within the time period
-    approved_campaigns = db.query(Campaign).filter(
-        and_(
+    # Only the two timestamps are read, not whole campaigns
+    rows = db.execute(
+        select(Campaign.created_at, Campaign.reviewed_at).where(
             Campaign.status == "approved",
             Campaign.reviewed_at >= cutoff_date,
             Campaign.reviewed_at.isnot(None),
@@ -116,20 +182,79 @@ def calculate_time_to_approval(db: Session, days: int = 7) -> Optional[float]:
         )
     ).all()
     
-    if not approved_campaigns:
-        return None
-    
     # Calculate time differences in hours
-    time_differences = []
-    for campaign in approved_campaigns:
-        if campaign.reviewed_at and campaign.created_at:
-            delta = campaign.reviewed_at - campaign.created_at
-            hours = delta.total_seconds() / 3600
-            time_differences.append(hours)
-    
+    time_differences = [
+        (reviewed_at - created_at).total_seconds() / 3600
+        for created_at, reviewed_at in rows
+    ]
     if not time_differences:
         return None
     
     # Return average time to approval in hours
     return round(sum(time_differences) / len(time_differences), 2)
 
+
+def calculate_deduplication_savings(db: Session) -> Dict[str, Any]:
+    """
+    Calculate storage and upload time saved by content-hash deduplication.
+    
+    Upload time saved is estimated from the bytes that were not re-uploaded
+    and the average recorded S3 upload throughput.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Dict with deduplicated_uploads, bytes_saved, estimated_upload_seconds_saved,
+        logical_storage_bytes and stored_bytes
+    """
+    savings, throughput, logical_storage, stored = _deduplication_savings_statements()
+    deduplicated_uploads, bytes_saved = db.execute(savings).one()
+    return _deduplication_savings_result(
+        deduplicated_uploads,
+        bytes_saved,
+        db.scalar(throughput),
+        db.scalar(logical_storage),
+        db.scalar(stored)
+    )
+
+
+# Async executors used by the async route handlers
+
+
+async def record_metric_async(
+    db: AsyncSession,
+    metric_type: str,
+    metric_value: float,
+    metadata: Optional[Dict[str, Any]] = None
+) -> PerformanceMetric:
+    """Async executor of record_metric; see it for arguments and results."""
+    metric = _build_metric(metric_type, metric_value, metadata)
+    
+    db.add(metric)
+    await db.flush()  # Flush to get ID without committing
+    
+    return metric
+
+
+async def get_queue_depth_async(db: AsyncSession) -> int:
+    """Async executor of get_queue_depth; see it for arguments and results."""
+    return await db.scalar(_queue_depth_statement())
+
+
+async def calculate_approval_rate_async(db: AsyncSession, days: int = 7) -> Dict[str, Any]:
+    """Async executor of calculate_approval_rate; see it for arguments and results."""
+    return _approval_rate_result((await db.execute(_approval_rate_statement(days))).all(), days)
+
+
+async def calculate_deduplication_savings_async(db: AsyncSession) -> Dict[str, Any]:
+    """Async executor of calculate_deduplication_savings; see it for arguments and results."""
+    savings, throughput, logical_storage, stored = _deduplication_savings_statements()
+    deduplicated_uploads, bytes_saved = (await db.execute(savings)).one()
+    return _deduplication_savings_result(
+        deduplicated_uploads,
+        bytes_saved,
+        await db.scalar(throughput),
+        await db.scalar(logical_storage),
+        await db.scalar(stored)
+    )
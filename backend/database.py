@@ -1,23 +1,392 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+
+from fastapi import Header
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
 from config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=False,  # Set to True for SQL query logging
-)
+# asyncio drivers used by the async engine, by database backend
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def async_database_url(database_url: str) -> URL:
+    """
+    Convert a database URL to the equivalent URL for its asyncio driver.
+    
+    Args:
+        database_url: Sync database URL (e.g. sqlite:///./dev.db, postgresql://...)
+    
+    Returns:
+        URL using aiosqlite (SQLite) or asyncpg (PostgreSQL)
+    
+    Raises:
+        ValueError: If the database backend has no supported asyncio driver
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for database backend: {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+class _PoolWaitStatistics:
+    """
+    Pool mixin recording how long checkouts wait for a connection.
+    
+    The wait covers queueing for a free connection and opening a new one
+    when the pool is below its limit; checkouts that time out are counted
+    separately.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        wait = time.perf_counter() - start
+        with self._stats_lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        return connection
+
+
+class MonitoredQueuePool(_PoolWaitStatistics, QueuePool):
+    """QueuePool of the sync engine with checkout wait statistics."""
+
+
+class MonitoredAsyncQueuePool(_PoolWaitStatistics, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool of the async engine with checkout wait statistics."""
+
+
+def _pool_options(url: URL, poolclass: type) -> Dict[str, Any]:
+    """Pool arguments for create_engine, from settings."""
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory databases keep SQLAlchemy's single-connection pool
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Configure a new SQLite connection for concurrent access.
+    
+    WAL lets readers run alongside a writer, synchronous=NORMAL is durable
+    in WAL mode without an fsync per commit, busy_timeout makes writers wait
+    for the lock instead of failing with "database is locked", and mmap
+    serves reads from the page cache.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE_BYTES}")
+    cursor.close()
 
-# Create session factory
+
+def create_engines(database_url: str) -> Tuple[Engine, AsyncEngine]:
+    """
+    Create the sync and async engines of a database.
+    
+    Args:
+        database_url: Sync database URL
+    
+    Returns:
+        Sync engine and async engine (which connects lazily on first use),
+        both with the configured pool and SQLite pragmas
+    """
+    url = make_url(database_url)
+    sqlite = url.get_backend_name() == "sqlite"
+    
+    sync_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if sqlite else {},
+        echo=False,  # Set to True for SQL query logging
+        **_pool_options(url, MonitoredQueuePool),
+    )
+    async_engine = create_async_engine(
+        async_database_url(database_url),
+        echo=False,
+        **_pool_options(url, MonitoredAsyncQueuePool),
+    )
+    
+    if sqlite:
+        event.listen(sync_engine, "connect", set_sqlite_pragmas)
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+    return sync_engine, async_engine
+
+
+# Primary database: the sync engine serves sync handlers, Alembic, scripts and
+# background workers, the async engine async route handlers
+engine, async_engine = create_engines(settings.DATABASE_URL)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Objects stay readable after commit: expired attributes cannot be lazy-loaded
+# from async code
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
+# Session.info keys: user whose request the session serves (set by the
+# get_current_user dependencies) and whether the open transaction wrote
+SESSION_USER_KEY = "replica_router_user_id"
+SESSION_WROTE_KEY = "replica_router_wrote"
+
+
+class Replica:
+    """Engines of one read replica and its health."""
+    
+    def __init__(self, name: str, database_url: str):
+        self.name = name
+        self.engine, self.async_engine = create_engines(database_url)
+        self.ejected_until = 0.0
+        self.ejections = 0
+    
+    def healthy(self, now: float) -> bool:
+        """Whether the replica is not ejected at monotonic time now."""
+        return self.ejected_until <= now
+
+
+class ReplicaRouter:
+    """
+    Route the sessions of read-only handlers to read replicas.
+    
+    Replicas are taken round-robin. One that fails to connect, or drops a
+    connection mid-query, is ejected for eject_seconds and tried again after.
+    Sessions fall back to the primary when no replica is configured or
+    healthy, and for users who wrote within sticky_seconds, who would
+    otherwise miss their own changes while replicas catch up.
+    """
+    
+    def __init__(self, replica_urls: List[str], eject_seconds: float, sticky_seconds: float):
+        self.replicas = [
+            Replica(f"replica-{number}", url) for number, url in enumerate(replica_urls, start=1)
+        ]
+        self.eject_seconds = eject_seconds
+        self.sticky_seconds = sticky_seconds
+        self._lock = threading.Lock()
+        self._next = 0
+        # User ID -> monotonic time until which the user reads from the primary
+        self._recent_writers: "OrderedDict[str, float]" = OrderedDict()
+        
+        for replica in self.replicas:
+            for replica_engine in (replica.engine, replica.async_engine.sync_engine):
+                event.listen(replica_engine, "handle_error", partial(self._on_error, replica))
+    
+    def _on_error(self, replica: Replica, context) -> None:
+        # Stale pooled connections found by pre-ping are replaced, not failures
+        if context.is_disconnect and not context.is_pre_ping:
+            self.eject(replica)
+    
+    def eject(self, replica: Replica) -> None:
+        """
+        Stop routing reads to a replica for eject_seconds.
+        
+        Args:
+            replica: Replica that failed
+        """
+        with self._lock:
+            replica.ejected_until = time.monotonic() + self.eject_seconds
+            replica.ejections += 1
+    
+    def record_write(self, user_id: str) -> None:
+        """
+        Route a user's reads to the primary for sticky_seconds.
+        
+        Args:
+            user_id: User whose request committed a write
+        """
+        if not self.replicas or self.sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._recent_writers[user_id] = now + self.sticky_seconds
+            self._recent_writers.move_to_end(user_id)
+            # Entries are kept in expiry order
+            while self._recent_writers and next(iter(self._recent_writers.values())) <= now:
+                self._recent_writers.popitem(last=False)
+    
+    def candidates(self, user_id: Optional[str]) -> List[Replica]:
+        """
+        Replicas to try for a read-only session, in round-robin order.
+        
+        Args:
+            user_id: Requesting user, if known
+        
+        Returns:
+            Healthy replicas; empty if the session must use the primary
+        """
+        if not self.replicas:
+            return []
+        now = time.monotonic()
+        with self._lock:
+            if user_id is not None and self._recent_writers.get(user_id, 0.0) > now:
+                return []
+            start = self._next
+            self._next = (start + 1) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.healthy(now)]
+    
+    def session(self, user_id: Optional[str] = None) -> Session:
+        """
+        Open a read-only session on the next healthy replica, or the primary.
+        
+        The session connects immediately, so a replica that is down is
+        ejected and the next one tried before the handler runs.
+        
+        Args:
+            user_id: Requesting user, if known
+        
+        Returns:
+            Session (the caller closes it)
+        """
+        for replica in self.candidates(user_id):
+            db = SessionLocal(bind=replica.engine)
+            try:
+                db.connection()
+                return db
+            except (exc.DBAPIError, OSError):
+                db.close()
+                self.eject(replica)
+        return SessionLocal()
+    
+    async def async_session(self, user_id: Optional[str] = None) -> AsyncSession:
+        """Async variant of session."""
+        for replica in self.candidates(user_id):
+            db = AsyncSessionLocal(bind=replica.async_engine)
+            try:
+                await db.connection()
+                return db
+            except (exc.DBAPIError, OSError):
+                await db.close()
+                self.eject(replica)
+        return AsyncSessionLocal()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_statement_write(execute_state) -> None:
+    """Flag transactions running INSERT, UPDATE or DELETE statements."""
+    if execute_state.is_insert or execute_state.is_update or execute_state.is_delete:
+        execute_state.session.info[SESSION_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flush_write(session: Session, flush_context) -> None:
+    session.info[SESSION_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _record_committed_write(session: Session) -> None:
+    user_id = session.info.get(SESSION_USER_KEY)
+    if session.info.pop(SESSION_WROTE_KEY, False) and user_id:
+        replica_router.record_write(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_write_flag(session: Session) -> None:
+    session.info.pop(SESSION_WROTE_KEY, None)
+
+
+# Global replica router instance
+replica_router = ReplicaRouter(
+    replica_urls=[url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()],
+    eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+    sticky_seconds=settings.DB_REPLICA_STICKY_SECONDS
+)
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """
+    Snapshot of a connection pool's usage.
+    
+    Args:
+        pool: Engine pool (sizes and wait times are only tracked for queue pools)
+    
+    Returns:
+        Dictionary with pool size, connections in use and checkout wait statistics
+    """
+    status = {
+        "pool_class": type(pool).__name__,
+        "pool_size": None,
+        "max_overflow": None,
+        "checked_out": None,
+        "checked_in": None,
+        "overflow": None,
+        "checkouts": None,
+        "timeouts": None,
+        "average_wait_ms": None,
+        "max_wait_ms": None,
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),  # Negative while the pool is below pool_size
+        )
+    if isinstance(pool, _PoolWaitStatistics):
+        with pool._stats_lock:
+            status.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                average_wait_ms=round(pool.total_wait / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+                max_wait_ms=round(pool.max_wait * 1000, 3),
+            )
+    return status
+
+
+def pool_statistics() -> List[Dict[str, Any]]:
+    """Pool snapshots of the sync and async engines of the primary and each read replica."""
+    statistics = [
+        {"engine": "sync", **pool_status(engine.pool)},
+        {"engine": "async", **pool_status(async_engine.sync_engine.pool)},
+    ]
+    now = time.monotonic()
+    for replica in replica_router.replicas:
+        health = {"healthy": replica.healthy(now), "ejections": replica.ejections}
+        statistics += [
+            {"engine": f"{replica.name} sync", **pool_status(replica.engine.pool), **health},
+            {"engine": f"{replica.name} async", **pool_status(replica.async_engine.sync_engine.pool), **health},
+        ]
+    return statistics
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -27,3 +396,30 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db(x_user_id: Optional[str] = Header(None, alias="X-User-ID")):
+    """
+    Dependency for a read-only database session, served by a read replica when one is healthy.
+    
+    Only for handlers that do not write; users who just wrote read from the primary.
+    """
+    db = replica_router.session(x_user_id)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(x_user_id: Optional[str] = Header(None, alias="X-User-ID")):
+    """Dependency for a read-only async database session (see get_read_db)."""
+    db = await replica_router.async_session(x_user_id)
+    try:
+        yield db
+    finally:
+        await db.close()
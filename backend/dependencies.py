@@ -1,35 +1,96 @@
 """FastAPI dependencies for authentication and authorization."""
+from typing import Optional
+
 from fastapi import Depends, Header, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import SESSION_USER_KEY, get_db, get_async_db
 from models.user import User
+from schemas.user import AuthenticatedUser
+from services.user_cache import user_cache
+
+# Columns of a user loaded for authentication; rows are read as plain tuples,
+# so no ORM object is added to the request's session
+_IDENTITY_COLUMNS = (User.id, User.email, User.full_name, User.role)
+
 
+def _require_user(user: Optional[AuthenticatedUser]) -> AuthenticatedUser:
+    """Raise 401 if the X-User-ID header did not match a user."""
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or invalid user ID"
+        )
+    
+    return user
 
-async def get_current_user(
+
+def _cache_user(row, generation: int) -> Optional[AuthenticatedUser]:
+    """Build the identity from a users row and cache it."""
+    if row is None:
+        return None
+    user = AuthenticatedUser.model_validate(row)
+    user_cache.put(user, generation)
+    return user
+
+
+def get_current_user(
     x_user_id: str = Header(alias="X-User-ID"),
     db: Session = Depends(get_db)
-) -> User:
+) -> AuthenticatedUser:
     """
     Dependency to get the current authenticated user from X-User-ID header.
     
+    Users are served from the user cache; the database is only queried on a
+    miss, and the session stays unused when the handler does not need it.
+    
     Args:
         x_user_id: User ID from X-User-ID header
         db: Database session
-        
+    
     Returns:
-        User: The authenticated user object
-        
+        AuthenticatedUser: Identity and role of the authenticated user
+    
     Raises:
         HTTPException: 401 if user not found
     """
-    user = db.query(User).filter(User.id == x_user_id).first()
+    # Commits of this request's session route the user's reads to the primary
+    db.info[SESSION_USER_KEY] = x_user_id
     
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or invalid user ID"
-        )
+    user = user_cache.get(x_user_id)
+    if user:
+        return user
     
-    return user
+    generation = user_cache.generation
+    row = db.execute(select(*_IDENTITY_COLUMNS).where(User.id == x_user_id)).first()
+    return _require_user(_cache_user(row, generation))
+
 
+async def get_current_user_async(
+    x_user_id: str = Header(alias="X-User-ID"),
+    db: AsyncSession = Depends(get_async_db)
+) -> AuthenticatedUser:
+    """
+    Async variant of get_current_user for handlers using an async session.
+    
+    Args:
+        x_user_id: User ID from X-User-ID header
+        db: Async database session
+    
+    Returns:
+        AuthenticatedUser: Identity and role of the authenticated user
+    
+    Raises:
+        HTTPException: 401 if user not found
+    """
+    db.info[SESSION_USER_KEY] = x_user_id
+    
+    user = user_cache.get(x_user_id)
+    if user:
+        return user
+    
+    generation = user_cache.generation
+    row = (await db.execute(select(*_IDENTITY_COLUMNS).where(User.id == x_user_id))).first()
+    return _require_user(_cache_user(row, generation))
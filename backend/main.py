@@ -1,13 +1,30 @@
 """Main FastAPI application entry point."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
-from routers import auth, asset, campaign, metrics
+from concurrency import configure_request_thread_pool
+from routers import auth, asset, campaign, metrics, storage
+from services.s3_deletion_service import s3_deletion_service
+from services.event_loop_monitor import event_loop_monitor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background workers for the lifetime of the application."""
+    configure_request_thread_pool()
+    s3_deletion_service.start()
+    event_loop_monitor.start()
+    yield
+    await event_loop_monitor.stop()
+    s3_deletion_service.stop()
+
 
 app = FastAPI(
     title="Email Advertising Workflow System API",
     description="AI-accelerated email advertising workflow system",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration - allow Vite dev servers and production frontend
@@ -32,6 +49,7 @@ app.include_router(auth.router)
 app.include_router(asset.router)
 app.include_router(campaign.router)
 app.include_router(metrics.router)
+app.include_router(storage.router)
 
 
 @app.get("/health")
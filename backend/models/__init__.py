@@ -5,6 +5,7 @@ from models.campaign import Campaign
 from models.campaign_asset import CampaignAsset
 from models.performance_metric import PerformanceMetric
 from models.system_health import SystemHealth
+from models.s3_deletion import S3Deletion
 
 __all__ = [
     "User",
@@ -13,5 +14,6 @@ __all__ = [
     "CampaignAsset",
     "PerformanceMetric",
     "SystemHealth",
+    "S3Deletion",
 ]
 
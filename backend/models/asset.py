@@ -1,10 +1,10 @@
 """Asset model for uploaded files metadata."""
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, Text, Integer, Float, Boolean, DateTime, ForeignKey, Index, JSON, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from database import Base
+from models.types import BinaryUUID, uuid7
 
 
 class Asset(Base):
@@ -12,24 +12,85 @@ class Asset(Base):
     
     __tablename__ = "assets"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+    user_id = Column(BinaryUUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String(255), nullable=False)
     s3_key = Column(String(512), nullable=False)  # S3 object key
-    s3_url = Column(String, nullable=False)  # Pre-signed or public URL
+    s3_url = Column(String)  # Legacy persisted URL; pre-signed URLs are generated on read from s3_key
     file_type = Column(String(50), nullable=False)  # MIME type
     file_size_bytes = Column(Integer, nullable=False)
-    category = Column(String(50), nullable=False, index=True)  # pending, logo, image, copy, url
+    content_hash = Column(String(64))  # SHA-256 hex digest, shared by deduplicated uploads
+    category = Column(String(50), nullable=False)  # pending, logo, image, copy, url
     categorization_method = Column(String(50))  # rules, ai, manual
-    uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    
+    # Image header metadata (null for non-image assets or unparseable headers)
+    image_width = Column(Integer)  # Pixels
+    image_height = Column(Integer)  # Pixels
+    image_aspect_ratio = Column(Float)  # width / height
+    image_has_transparency = Column(Boolean)  # Alpha channel, tRNS chunk or transparent GIF index
+    image_color_depth = Column(Integer)  # Bits per pixel
+    
+    # Email-optimized renditions keyed by rendition name (null until generated)
+    derivatives = Column(JSON)  # {name: {s3_key, content_type, width, height, size_bytes}}
+    
+    # Text extracted from copy documents (null until extracted or if unparseable)
+    text_excerpt = Column(Text)  # Normalized, capped at TEXT_EXCERPT_MAX_CHARS
+    text_word_count = Column(Integer)  # Words in the whole document
+    
+    uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="assets")
     campaign_assets = relationship("CampaignAsset", back_populates="asset", cascade="all, delete-orphan")
     
     __table_args__ = (
-        Index("idx_assets_user_id", "user_id"),
         Index("idx_assets_category", "category"),
         Index("idx_assets_uploaded_at", "uploaded_at"),
+        Index("idx_assets_user_id_uploaded_at", "user_id", "uploaded_at", "id"),
+        Index("idx_assets_user_id_content_hash", "user_id", "content_hash"),
+        Index("idx_assets_s3_key", "s3_key"),
     )
 
+
+
+# Filename search indexes live outside the ORM metadata: an FTS5 table kept in
+# sync by triggers on SQLite, and a pg_trgm GIN index on Postgres. Migration
+# b8d3f0a5e2c7 creates the same objects on existing databases (triggers as of
+# f4b8d2e6a1c3, which indexes the 16-byte IDs by their hex digits).
+ASSET_SEARCH_SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS assets_fts USING fts5(
+        filename, user_key, asset_key, asset_id UNINDEXED,
+        prefix='2 3 4 5 6', detail='column', columnsize=0
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS assets_fts_insert AFTER INSERT ON assets BEGIN
+        INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+        VALUES (new.filename, hex(new.user_id), hex(new.id), new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS assets_fts_delete AFTER DELETE ON assets BEGIN
+        DELETE FROM assets_fts WHERE assets_fts MATCH 'asset_key : ' || hex(old.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS assets_fts_update AFTER UPDATE OF filename, user_id ON assets BEGIN
+        DELETE FROM assets_fts WHERE assets_fts MATCH 'asset_key : ' || hex(old.id);
+        INSERT INTO assets_fts (filename, user_key, asset_key, asset_id)
+        VALUES (new.filename, hex(new.user_id), hex(new.id), new.id);
+    END
+    """,
+]
+
+ASSET_SEARCH_POSTGRESQL_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_assets_filename_trgm ON assets USING gin (filename gin_trgm_ops)",
+]
+
+for statement in ASSET_SEARCH_SQLITE_DDL:
+    event.listen(Asset.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in ASSET_SEARCH_POSTGRESQL_DDL:
+    event.listen(Asset.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+event.listen(Asset.__table__, "after_drop", DDL("DROP TABLE IF EXISTS assets_fts").execute_if(dialect="sqlite"))
@@ -2,9 +2,9 @@
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from database import Base
+from models.types import BinaryUUID, uuid7
 
 
 class Campaign(Base):
@@ -12,8 +12,8 @@ class Campaign(Base):
     
     __tablename__ = "campaigns"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    advertiser_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+    advertiser_id = Column(BinaryUUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     campaign_name = Column(String(255), nullable=False)
     target_audience = Column(Text)
     campaign_goal = Column(Text)
@@ -24,10 +24,10 @@ class Campaign(Base):
     generated_email_mjml = Column(Text)  # Source MJML template
     
     # Status tracking
-    status = Column(String(50), nullable=False, default="draft", index=True)  # draft, pending_approval, approved, rejected
+    status = Column(String(50), nullable=False, default="draft")  # draft, pending_approval, approved, rejected
     
     # Approval workflow
-    reviewed_by = Column(String, ForeignKey("users.id"), index=True)
+    reviewed_by = Column(BinaryUUID, ForeignKey("users.id"))
     reviewed_at = Column(DateTime(timezone=True))
     rejection_reason = Column(Text)
     
@@ -35,7 +35,7 @@ class Campaign(Base):
     scheduled_send_date = Column(DateTime(timezone=True))
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
@@ -44,8 +44,9 @@ class Campaign(Base):
     campaign_assets = relationship("CampaignAsset", back_populates="campaign", cascade="all, delete-orphan")
     
     __table_args__ = (
-        Index("idx_campaigns_advertiser_id", "advertiser_id"),
-        Index("idx_campaigns_status", "status"),
+        Index("idx_campaigns_advertiser_id_created_at", "advertiser_id", "created_at"),
+        Index("idx_campaigns_status_created_at", "status", "created_at", "id"),
+        Index("idx_campaigns_status_reviewed_at", "status", "reviewed_at"),
         Index("idx_campaigns_created_at", "created_at"),
         Index("idx_campaigns_reviewed_by", "reviewed_by"),
     )
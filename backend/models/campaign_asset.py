@@ -2,9 +2,9 @@
 from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from database import Base
+from models.types import BinaryUUID, uuid7
 
 
 class CampaignAsset(Base):
@@ -12,9 +12,9 @@ class CampaignAsset(Base):
     
     __tablename__ = "campaign_assets"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    campaign_id = Column(String, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False, index=True)
-    asset_id = Column(String, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+    campaign_id = Column(BinaryUUID, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
+    asset_id = Column(BinaryUUID, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False)
     asset_role = Column(String(50))  # primary_logo, hero_image, body_copy, etc.
     display_order = Column(Integer)  # Order for assets of same role
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -24,8 +24,8 @@ class CampaignAsset(Base):
     asset = relationship("Asset", back_populates="campaign_assets")
     
     __table_args__ = (
+        # Also serves lookups by campaign_id
         UniqueConstraint("campaign_id", "asset_id", name="uq_campaign_asset"),
-        Index("idx_campaign_assets_campaign_id", "campaign_id"),
         Index("idx_campaign_assets_asset_id", "asset_id"),
     )
 
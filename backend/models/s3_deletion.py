@@ -0,0 +1,23 @@
+"""S3Deletion model for the S3 object deletion outbox."""
+from sqlalchemy import Column, String, Integer, Text, DateTime, Index
+from sqlalchemy.sql import func
+
+from database import Base
+from models.types import BinaryUUID, uuid7
+
+
+class S3Deletion(Base):
+    """Outbox row for an S3 object to delete once its database rows are gone."""
+    
+    __tablename__ = "s3_deletions"
+    
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+    s3_key = Column(String(1024), nullable=False)  # S3 object key to delete
+    attempts = Column(Integer, nullable=False, default=0)  # Failed delete attempts so far
+    last_error = Column(Text)  # Error from the last failed attempt
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now())  # Retry backoff
+    
+    __table_args__ = (
+        Index("idx_s3_deletions_next_attempt_at", "next_attempt_at"),
+    )
@@ -1,9 +1,9 @@
 """SystemHealth model for component health checks."""
 from sqlalchemy import Column, String, Integer, Text, DateTime, Index
 from sqlalchemy.sql import func
-import uuid
 
 from database import Base
+from models.types import BinaryUUID, uuid7
 
 
 class SystemHealth(Base):
@@ -11,15 +11,15 @@ class SystemHealth(Base):
     
     __tablename__ = "system_health"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    component = Column(String(100), nullable=False, index=True)  # api, s3, database, openai
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+    component = Column(String(100), nullable=False)  # api, s3, database, openai
     status = Column(String(50), nullable=False)  # healthy, degraded, down
     response_time_ms = Column(Integer)  # Response time in milliseconds
     error_message = Column(Text)  # Error message if status is not healthy
-    checked_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    checked_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        Index("idx_system_health_component", "component"),
+        Index("idx_system_health_component_checked_at", "component", "checked_at"),
         Index("idx_system_health_checked_at", "checked_at"),
     )
 
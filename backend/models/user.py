@@ -2,9 +2,9 @@
 from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from database import Base
+from models.types import BinaryUUID, uuid7
 
 
 class User(Base):
@@ -12,11 +12,11 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+    email = Column(String(255), nullable=False)
     password = Column(String(255), nullable=False)  # Plain text for MVP
     full_name = Column(String(255), nullable=False)
-    role = Column(String(50), nullable=False, index=True)  # advertiser, campaign_manager, tech_support
+    role = Column(String(50), nullable=False)  # advertiser, campaign_manager, tech_support
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -26,7 +26,7 @@ class User(Base):
     reviewed_campaigns = relationship("Campaign", foreign_keys="Campaign.reviewed_by", back_populates="reviewer")
     
     __table_args__ = (
-        Index("idx_users_email", "email"),
+        Index("idx_users_email", "email", unique=True),
         Index("idx_users_role", "role"),
     )
 
@@ -55,6 +55,7 @@ def build_categorization_prompt(assets: List[Dict]) -> str:
     
     Args:
         assets: List of asset dictionaries with keys: id, filename, file_type, category
+            and optional image header fields: width, height, has_transparency
         
     Returns:
         Formatted prompt string
@@ -86,7 +86,8 @@ def build_email_generation_prompt(campaign_details: Dict, assets: List[Dict]) ->
     
     Args:
         campaign_details: Dictionary with campaign information (name, audience, goal, notes)
-        assets: List of asset dictionaries with metadata (filename, s3_url, category)
+        assets: List of asset dictionaries with metadata (filename, s3_url, category,
+            and text_excerpt / text_word_count for copy documents with extracted text)
         
     Returns:
         Formatted prompt string
@@ -94,12 +95,17 @@ def build_email_generation_prompt(campaign_details: Dict, assets: List[Dict]) ->
     # Format assets in a readable way
     assets_formatted = []
     for asset in assets:
-        assets_formatted.append({
+        asset_formatted = {
             "category": asset.get("category", "unknown"),
             "filename": asset.get("filename", "unknown"),
             "url": asset.get("s3_url", ""),
             "file_type": asset.get("file_type", "unknown")
-        })
+        }
+        # Copy documents carry their cached text so the model can use the copy itself
+        if asset.get("text_excerpt"):
+            asset_formatted["text"] = asset["text_excerpt"]
+            asset_formatted["word_count"] = asset.get("text_word_count")
+        assets_formatted.append(asset_formatted)
     
     assets_json = json.dumps(assets_formatted, indent=2)
     
@@ -124,7 +130,8 @@ REQUIREMENTS:
 1. Use the provided assets strategically:
    - Place logo(s) in the header
    - Use image(s) as hero or supporting visuals
-   - Incorporate any copy/text assets into the email body
+   - Incorporate any copy/text assets into the email body, using the
+     provided "text" of copy assets as the source for headlines and body copy
    - Link buttons/images to any provided URLs
 
 2. Design for the target audience:
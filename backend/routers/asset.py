@@ -1,121 +1,850 @@
 """Asset router for file upload and management."""
+import asyncio
 import time
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
+import io
+import mimetypes
 from pydantic import BaseModel, Field, field_validator
 
-from database import get_db
+from concurrency import storage_bulkhead, openai_bulkhead
+from database import SessionLocal, get_db, get_read_db
 from dependencies import get_current_user
-from models.user import User
+from schemas.user import AuthenticatedUser
 from models.asset import Asset
-from schemas.asset import AssetResponse, AssetUpdate
-from services.s3_service import s3_service
+from schemas.asset import (
+    AssetResponse,
+    AssetListResponse,
+    AssetBatchRequest,
+    AssetBatchResult,
+    AssetBatchResponse,
+    AssetUpdate,
+    PresignedUploadRequest,
+    PresignedUploadResponse,
+    UploadConfirmRequest,
+    BulkUploadFileResult,
+    BulkUploadResponse,
+)
+from services.s3_service import s3_service, FileTooLargeError
 from services.categorization_service import categorize_asset
+from services.image_metadata_service import extract_image_metadata
+from services.derivative_service import derivative_service, THUMBNAIL_RENDITION
+from services.text_extraction_service import text_extraction_service
+from services.s3_deletion_service import cancel_s3_deletions, enqueue_s3_deletions
 from services.openai_service import openai_service
+from crud.asset import get_assets_page, count_assets, search_assets, get_assets_by_ids
+from crud.metrics import record_metric
 
 router = APIRouter(prefix="/api/assets", tags=["assets"])
 
+# Maximum size of a single uploaded asset
+MAX_UPLOAD_SIZE_BYTES = 10 * 1024 * 1024  # 10MB
+
+# Lifetime of presigned POST upload policies
+PRESIGNED_UPLOAD_EXPIRATION_SECONDS = 900  # 15 minutes
+
+# Leading bytes fetched from S3 to parse image headers of direct uploads
+IMAGE_HEADER_FETCH_BYTES = 64 * 1024  # 64KB
+
+# Page sizes for the asset listing
+DEFAULT_ASSET_PAGE_SIZE = 50
+MAX_ASSET_PAGE_SIZE = 200
+
+# Maximum number of results returned by filename search
+MAX_SEARCH_RESULTS = 100
+
+# Maximum number of files accepted by a single bulk upload request
+MAX_BULK_UPLOAD_FILES = 100
+
+
+
+def _asset_values(
+    user_id: str,
+    filename: str,
+    s3_key: str,
+    file_type: str,
+    file_size: int,
+    image_metadata: Optional[Dict[str, Any]] = None,
+    content_hash: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Categorize an uploaded file and build the column values for its Asset row.
+    
+    Args:
+        user_id: ID of the owning user
+        filename: Original filename
+        s3_key: S3 object key
+        file_type: MIME type of the file
+        file_size: Size of the file in bytes
+        image_metadata: Optional header metadata from extract_image_metadata
+        content_hash: Optional SHA-256 hex digest of the file content
+    
+    Returns:
+        Dict of Asset column values
+    """
+    category, categorization_method = categorize_asset(
+        filename=filename,
+        file_type=file_type,
+        image_metadata=image_metadata
+    )
+    
+    image_metadata = image_metadata or {}
+    return {
+        "user_id": user_id,
+        "filename": filename,
+        "s3_key": s3_key,
+        "file_type": file_type,
+        "file_size_bytes": file_size,
+        "content_hash": content_hash,
+        "category": category,
+        "categorization_method": categorization_method,
+        "image_width": image_metadata.get("width"),
+        "image_height": image_metadata.get("height"),
+        "image_aspect_ratio": image_metadata.get("aspect_ratio"),
+        "image_has_transparency": image_metadata.get("has_transparency"),
+        "image_color_depth": image_metadata.get("color_depth"),
+    }
+
+
+def _build_asset(**kwargs) -> Asset:
+    """
+    Categorize an uploaded file and build its (unsaved) Asset record.
+    
+    Args:
+        **kwargs: Arguments accepted by _asset_values
+    
+    Returns:
+        Asset: New asset instance (not yet added to a session)
+    """
+    return Asset(**_asset_values(**kwargs))
+
+
+def sign_asset_urls(assets: List[AssetResponse]) -> List[AssetResponse]:
+    """
+    Fill in pre-signed URLs of serialized assets and their thumbnails.
+    
+    URLs are generated on read from the S3 keys (the stored s3_url column is
+    legacy) and come from the URL cache, which re-signs all misses in one pass.
+    
+    Args:
+        assets: Serialized assets
+    
+    Returns:
+        The same assets with s3_url and thumbnail_url set
+    """
+    thumbnails = [derivative_service.get_rendition(asset, THUMBNAIL_RENDITION) for asset in assets]
+    urls = s3_service.get_presigned_urls(
+        [asset.s3_key for asset in assets]
+        + [thumbnail["s3_key"] for thumbnail in thumbnails if thumbnail]
+    )
+    for asset, thumbnail in zip(assets, thumbnails):
+        asset.s3_url = urls[asset.s3_key]
+        asset.thumbnail_url = urls[thumbnail["s3_key"]] if thumbnail else None
+    return assets
+
+
+def _asset_responses(assets: Iterable[Asset]) -> List[AssetResponse]:
+    """Serialize assets with pre-signed URLs (see sign_asset_urls)."""
+    return sign_asset_urls([AssetResponse.model_validate(asset) for asset in assets])
+
+
+def _inspect_upload(file: UploadFile) -> Dict[str, Any]:
+    """
+    Parse the image header and hash an uploaded file (blocking; run in the storage bulkhead).
+    
+    Args:
+        file: Uploaded file
+    
+    Returns:
+        Dict with image_metadata, file_size and content_hash
+    
+    Raises:
+        FileTooLargeError: If the file exceeds MAX_UPLOAD_SIZE_BYTES
+    """
+    if file.size is not None and file.size > MAX_UPLOAD_SIZE_BYTES:
+        raise FileTooLargeError(MAX_UPLOAD_SIZE_BYTES)
+    
+    # Parse image header (dimensions, transparency) without decoding the image
+    image_metadata = extract_image_metadata(file.file, file.filename)
+    
+    # Hash while streaming from the spooled file; size limit is enforced incrementally
+    file_size, content_hash = s3_service.hash_file(file.file, max_size=MAX_UPLOAD_SIZE_BYTES)
+    return {"image_metadata": image_metadata, "file_size": file_size, "content_hash": content_hash}
+
+
+def _store_upload(file: UploadFile, user_id: str, inspected: Dict[str, Any]) -> str:
+    """
+    Stream an inspected upload to storage (blocking; run in the storage bulkhead).
+    
+    Args:
+        file: Uploaded file
+        user_id: ID of the owning user
+        inspected: Result of _inspect_upload for the file
+    
+    Returns:
+        S3 key of the stored object
+    """
+    s3_key, _, _, _ = s3_service.upload_stream(
+        file_obj=file.file,
+        filename=file.filename,
+        user_id=user_id,
+        content_type=file.content_type,
+        size_bytes=inspected["file_size"],
+        sha256=inspected["content_hash"]
+    )
+    return s3_key
+
+
+def _find_stored_objects(db: Session, user_id: str, content_hashes: List[str]) -> Dict[str, str]:
+    """
+    Find S3 objects the user already stored for the given content hashes.
+    
+    The matching rows are share-locked until the caller's transaction ends, so
+    deleting them waits until the rows reusing their objects are committed and
+    the objects are not queued for deletion as orphans.
+    
+    Args:
+        db: Database session
+        user_id: ID of the owning user
+        content_hashes: SHA-256 hex digests to look up
+    
+    Returns:
+        Dict mapping content hash to the existing S3 key
+    """
+    if not content_hashes:
+        return {}
+    
+    rows = db.query(Asset.content_hash, Asset.s3_key).filter(
+        Asset.user_id == user_id,
+        Asset.content_hash.in_(set(content_hashes))
+    ).with_for_update(read=True).all()
+    return {content_hash: s3_key for content_hash, s3_key in rows}
+
+
+def _record_upload_metrics(db: Session, user_id: str, file_size: int, deduplicated: bool, upload_time: float) -> None:
+    """
+    Record upload throughput, or bytes saved when an upload was deduplicated.
+    
+    Args:
+        db: Database session
+        user_id: ID of the uploading user
+        file_size: Size of the uploaded file in bytes
+        deduplicated: Whether an existing S3 object was reused
+        upload_time: Time spent uploading to S3 in seconds
+    """
+    if deduplicated:
+        record_metric(
+            db=db,
+            metric_type="upload_dedup_bytes_saved",
+            metric_value=file_size,
+            metadata={"user_id": user_id}
+        )
+    else:
+        record_metric(
+            db=db,
+            metric_type="asset_upload_throughput",
+            metric_value=round(file_size / 1024 / max(upload_time, 0.001), 2),  # KB/s
+            metadata={"user_id": user_id, "file_size_bytes": file_size}
+        )
+
+
+def _record_content_hash(asset_id: str, s3_key: str) -> None:
+    """
+    Hash a directly uploaded object and store the hash on its asset.
+    
+    Intended to run as a background task after /upload-confirm: the client
+    sent the bytes straight to S3, so the hash is only known once the object
+    is read back. The upload itself is never deduplicated, but later uploads
+    of the same content reuse its object and are counted as savings.
+    
+    Args:
+        asset_id: ID of the confirmed asset
+        s3_key: S3 key of its object
+    """
+    db = SessionLocal()
+    try:
+        content_hash = s3_service.hash_stored_file(s3_key)
+        db.execute(update(Asset).where(Asset.id == asset_id).values(content_hash=content_hash))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"[Upload] Failed to hash {s3_key}: {e}")
+    finally:
+        db.close()
+
 
 @router.post("/upload", response_model=AssetResponse, status_code=status.HTTP_201_CREATED)
 async def upload_asset(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Upload an asset file to S3 and create asset record.
     
+    Email-optimized renditions of images and the text of copy documents are
+    generated in the background after the response is sent. Hashing and the
+    S3 transfer run in the storage bulkhead and database work in the request
+    thread pool, so the event loop is never blocked.
+    
     Args:
+        background_tasks: Background tasks run after the response
         file: Uploaded file
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         AssetResponse: Created asset with metadata
-        
+    
     Raises:
-        HTTPException: 400 if file is invalid, 500 if upload fails
+        HTTPException: 400 if file is invalid, 500 if upload fails, 503 if the storage bulkhead is full
     """
+    def save_asset(inspected: Dict[str, Any], s3_key: str, deduplicated: bool, upload_time: float) -> Asset:
+        _record_upload_metrics(db, current_user.id, inspected["file_size"], deduplicated, upload_time)
+        
+        # Categorize asset and create asset record in database
+        asset = _build_asset(
+            user_id=current_user.id,
+            filename=file.filename,
+            s3_key=s3_key,
+            file_type=file.content_type or "application/octet-stream",
+            file_size=inspected["file_size"],
+            image_metadata=inspected["image_metadata"],
+            content_hash=inspected["content_hash"]
+        )
+        
+        db.add(asset)
+        db.commit()
+        db.refresh(asset)
+        return asset
+    
     try:
-        # Read file content
-        file_content = await file.read()
-        file_size = len(file_content)
+        inspected = await storage_bulkhead.run(_inspect_upload, file)
         
-        # Validate file size (e.g., max 10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
-        if file_size > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size exceeds maximum allowed size of {max_size / (1024 * 1024)}MB"
-            )
+        # Reuse the S3 object if this user already uploaded the same content
+        stored_keys = await run_in_threadpool(_find_stored_objects, db, current_user.id, [inspected["content_hash"]])
+        existing_key = stored_keys.get(inspected["content_hash"])
         
-        # Upload to S3
-        s3_key, s3_url = s3_service.upload_file(
-            file_content=file_content,
-            filename=file.filename,
-            user_id=current_user.id,
-            content_type=file.content_type
+        # Keys are content-addressed: a deletion queued for this key must not
+        # remove the object once the new row references it
+        await run_in_threadpool(
+            cancel_s3_deletions,
+            db,
+            [existing_key or s3_service.build_key(current_user.id, file.filename, inspected["content_hash"])]
         )
         
-        # Categorize asset
-        category, categorization_method = categorize_asset(
-            filename=file.filename,
-            file_type=file.content_type or "application/octet-stream"
+        upload_start = time.time()
+        if existing_key:
+            s3_key = existing_key
+        else:
+            s3_key = await storage_bulkhead.run(_store_upload, file, current_user.id, inspected)
+        
+        asset = await run_in_threadpool(save_asset, inspected, s3_key, bool(existing_key), time.time() - upload_start)
+        
+        if derivative_service.supports(asset.file_type):
+            background_tasks.add_task(derivative_service.generate_for_assets, [asset.id])
+        if text_extraction_service.supports(asset.filename, asset.file_type):
+            background_tasks.add_task(text_extraction_service.extract_for_assets, [asset.id])
+        
+        return _asset_responses([asset])[0]
+    
+    except FileTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds maximum allowed size of {MAX_UPLOAD_SIZE_BYTES / (1024 * 1024)}MB"
         )
+    except HTTPException:
+        raise
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to upload asset: {str(e)}"
+        )
+
+
+@router.post("/upload-bulk", response_model=BulkUploadResponse, status_code=status.HTTP_201_CREATED)
+async def upload_assets_bulk(
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(...),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload many asset files in one request.
+    
+    Files are streamed to S3 concurrently through the storage bulkhead, then
+    categorized and inserted with a single bulk INSERT in one transaction.
+    A failed file does not fail the request; its error is reported per file.
+    Image renditions and document text are generated in the background for
+    the whole batch.
+    
+    Args:
+        background_tasks: Background tasks run after the response
+        files: Uploaded files
+        current_user: Current authenticated user
+        db: Database session
+    
+    Returns:
+        BulkUploadResponse: Per-file status (in request order) and total wall time
+    
+    Raises:
+        HTTPException: 400 if too many files are sent, 500 if the database insert fails
+    """
+    if len(files) > MAX_BULK_UPLOAD_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A bulk upload can contain at most {MAX_BULK_UPLOAD_FILES} files"
+        )
+    
+    start_time = time.time()
+    
+    # Parse headers and hash files concurrently without blocking the event loop
+    outcomes = await asyncio.gather(
+        *[storage_bulkhead.run(_inspect_upload, file) for file in files],
+        return_exceptions=True
+    )
+    
+    # One query finds content this user already stored; duplicates within the
+    # request are uploaded once
+    inspected_files = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+    stored_keys = await run_in_threadpool(
+        _find_stored_objects, db, current_user.id, [f["content_hash"] for f in inspected_files]
+    )
+    
+    upload_indexes = {}
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            continue
+        if outcome["content_hash"] not in stored_keys:
+            upload_indexes.setdefault(outcome["content_hash"], index)
+    
+    # Keys are content-addressed: deletions queued for any key the new rows
+    # reference must not remove the objects
+    await run_in_threadpool(
+        cancel_s3_deletions,
+        db,
+        list(stored_keys.values()) + [
+            s3_service.build_key(current_user.id, files[index].filename, content_hash)
+            for content_hash, index in upload_indexes.items()
+        ]
+    )
+    
+    # Upload new content to S3 concurrently through the storage bulkhead
+    upload_start = time.time()
+    upload_results = await asyncio.gather(
+        *[
+            storage_bulkhead.run(_store_upload, files[index], current_user.id, outcomes[index])
+            for index in upload_indexes.values()
+        ],
+        return_exceptions=True
+    )
+    upload_time = time.time() - upload_start
+    
+    upload_errors = {}
+    for (content_hash, index), result in zip(upload_indexes.items(), upload_results):
+        if isinstance(result, BaseException):
+            upload_errors[content_hash] = result
+        else:
+            stored_keys[content_hash] = result
+    
+    # Categorize all files in one pass and build their rows
+    uploaded_bytes = 0
+    deduplicated_sizes = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            continue
+        content_hash = outcome["content_hash"]
+        if content_hash in upload_errors:
+            outcomes[index] = upload_errors[content_hash]
+            continue
         
-        # Create asset record in database
-        asset = Asset(
+        deduplicated = upload_indexes.get(content_hash) != index
+        s3_key = stored_keys[content_hash]
+        outcomes[index] = _asset_values(
             user_id=current_user.id,
-            filename=file.filename,
+            filename=files[index].filename,
             s3_key=s3_key,
-            s3_url=s3_url,
-            file_type=file.content_type or "application/octet-stream",
-            file_size_bytes=file_size,
-            category=category,
-            categorization_method=categorization_method
+            file_type=files[index].content_type or "application/octet-stream",
+            file_size=outcome["file_size"],
+            image_metadata=outcome["image_metadata"],
+            content_hash=content_hash
+        )
+        if deduplicated:
+            deduplicated_sizes.append(outcome["file_size"])
+        else:
+            uploaded_bytes += outcome["file_size"]
+    
+    rows = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+    
+    def save_assets() -> List[AssetResponse]:
+        for file_size in deduplicated_sizes:
+            _record_upload_metrics(db, current_user.id, file_size, True, 0.0)
+        if uploaded_bytes:
+            _record_upload_metrics(db, current_user.id, uploaded_bytes, False, upload_time)
+        
+        # Insert all asset rows with one bulk INSERT ... RETURNING
+        assets = list(db.scalars(insert(Asset).returning(Asset, sort_by_parameter_order=True), rows)) if rows else []
+        
+        record_metric(
+            db=db,
+            metric_type="bulk_upload_time",
+            metric_value=time.time() - start_time,
+            metadata={
+                "user_id": current_user.id,
+                "file_count": len(files),
+                "uploaded_count": len(assets)
+            }
+        )
+        
+        db.commit()
+        
+        # Serialize here: reading expired attributes after commit queries the database
+        return _asset_responses(assets)
+    
+    try:
+        assets = await run_in_threadpool(save_assets)
+        total_time = time.time() - start_time
+    
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to save uploaded assets: {str(e)}"
+        )
+    
+    image_asset_ids = [asset.id for asset in assets if derivative_service.supports(asset.file_type)]
+    if image_asset_ids:
+        background_tasks.add_task(derivative_service.generate_for_assets, image_asset_ids)
+    
+    document_asset_ids = [
+        asset.id for asset in assets if text_extraction_service.supports(asset.filename, asset.file_type)
+    ]
+    if document_asset_ids:
+        background_tasks.add_task(text_extraction_service.extract_for_assets, document_asset_ids)
+    
+    # Build per-file results in request order
+    assets_iter = iter(assets)
+    results = []
+    for file, outcome in zip(files, outcomes):
+        if isinstance(outcome, FileTooLargeError):
+            error = f"File size exceeds maximum allowed size of {MAX_UPLOAD_SIZE_BYTES / (1024 * 1024)}MB"
+        elif isinstance(outcome, BaseException):
+            error = f"Failed to upload asset: {str(outcome)}"
+        else:
+            results.append(BulkUploadFileResult(
+                filename=file.filename,
+                status="uploaded",
+                asset=next(assets_iter)
+            ))
+            continue
+        results.append(BulkUploadFileResult(filename=file.filename, status="failed", error=error))
+    
+    return BulkUploadResponse(
+        results=results,
+        uploaded_count=len(assets),
+        failed_count=len(files) - len(assets),
+        total_time=round(total_time, 2)
+    )
+
+
+@router.post("/upload-url", response_model=PresignedUploadResponse)
+async def create_upload_url(
+    request: PresignedUploadRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    Issue a presigned POST policy so the client can upload directly to S3.
+    
+    The policy restricts the key to users/{user_id}/{filename}, the content type
+    and the maximum size. After uploading, the client calls /upload-confirm.
+    
+    Args:
+        request: Request body with filename and optional content type
+        current_user: Current authenticated user
+    
+    Returns:
+        PresignedUploadResponse: S3 URL, form fields and object key
+    
+    Raises:
+        HTTPException: 500 if the policy cannot be generated
+    """
+    content_type = (
+        request.content_type
+        or mimetypes.guess_type(request.filename)[0]
+        or "application/octet-stream"
+    )
+    
+    try:
+        presigned_post = s3_service.generate_presigned_post(
+            filename=request.filename,
+            user_id=current_user.id,
+            content_type=content_type,
+            max_size=MAX_UPLOAD_SIZE_BYTES,
+            expires_in=PRESIGNED_UPLOAD_EXPIRATION_SECONDS
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create upload URL: {str(e)}"
+        )
+    
+    return PresignedUploadResponse(
+        url=presigned_post["url"],
+        fields=presigned_post["fields"],
+        s3_key=presigned_post["s3_key"],
+        expires_in=PRESIGNED_UPLOAD_EXPIRATION_SECONDS,
+        max_size_bytes=MAX_UPLOAD_SIZE_BYTES
+    )
+
+
+@router.post("/upload-confirm", response_model=AssetResponse, status_code=status.HTTP_201_CREATED)
+async def confirm_upload(
+    request: UploadConfirmRequest,
+    background_tasks: BackgroundTasks,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Confirm a direct-to-S3 upload and create the asset record.
+    
+    The object is verified with a HEAD request; for images only the leading
+    bytes are fetched to parse the header, so the work done here does not
+    depend on the file size.
+    
+    Args:
+        request: Request body with the S3 key returned by /upload-url
+        background_tasks: Background tasks run after the response
+        current_user: Current authenticated user
+        db: Database session
+    
+    Returns:
+        AssetResponse: Created asset with metadata
+    
+    Raises:
+        HTTPException: 403 if the key is outside the user's prefix, 404 if the object
+            was not uploaded, 400 if it exceeds the size limit, 500 if confirmation fails,
+            503 if the storage bulkhead is full
+    """
+    # Keys issued by /upload-url have the form users/{user_id}/{upload_id}/{filename}
+    user_prefix = f"users/{current_user.id}/"
+    key_parts = request.s3_key[len(user_prefix):].split("/")
+    filename = key_parts[-1]
+    
+    if not request.s3_key.startswith(user_prefix) or len(key_parts) != 2 or not all(key_parts):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to confirm this upload"
+        )
+    
+    def find_existing_asset() -> Optional[Asset]:
+        return db.query(Asset).filter(
+            Asset.user_id == current_user.id,
+            Asset.s3_key == request.s3_key
+        ).first()
+    
+    def reject_oversized_object() -> None:
+        enqueue_s3_deletions(db, [request.s3_key])
+        db.commit()
+    
+    def save_asset(object_metadata: Dict[str, Any], file_type: str, image_metadata: Optional[Dict[str, Any]]) -> Asset:
+        asset = _build_asset(
+            user_id=current_user.id,
+            filename=filename,
+            s3_key=request.s3_key,
+            file_type=file_type,
+            file_size=object_metadata["size_bytes"],
+            image_metadata=image_metadata
         )
         
         db.add(asset)
         db.commit()
         db.refresh(asset)
-        
         return asset
+    
+    def read_image_metadata() -> Optional[Dict[str, Any]]:
+        header_bytes = s3_service.read_file_head(request.s3_key, IMAGE_HEADER_FETCH_BYTES)
+        return extract_image_metadata(io.BytesIO(header_bytes), filename)
+    
+    # Confirming the same upload twice returns the existing asset
+    existing_asset = await run_in_threadpool(find_existing_asset)
+    if existing_asset:
+        return _asset_responses([existing_asset])[0]
+    
+    try:
+        object_metadata = await storage_bulkhead.run(s3_service.head_file, request.s3_key)
+        
+        if object_metadata is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Uploaded file not found"
+            )
+        
+        if object_metadata["size_bytes"] > MAX_UPLOAD_SIZE_BYTES:
+            await run_in_threadpool(reject_oversized_object)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File size exceeds maximum allowed size of {MAX_UPLOAD_SIZE_BYTES / (1024 * 1024)}MB"
+            )
         
+        file_type = object_metadata["content_type"] or "application/octet-stream"
+        
+        # Parse image header from a ranged GET instead of downloading the file
+        image_metadata = None
+        if file_type.startswith("image/"):
+            image_metadata = await storage_bulkhead.run(read_image_metadata)
+        
+        asset = await run_in_threadpool(save_asset, object_metadata, file_type, image_metadata)
+        
+        background_tasks.add_task(_record_content_hash, asset.id, asset.s3_key)
+        if derivative_service.supports(asset.file_type):
+            background_tasks.add_task(derivative_service.generate_for_assets, [asset.id])
+        if text_extraction_service.supports(asset.filename, asset.file_type):
+            background_tasks.add_task(text_extraction_service.extract_for_assets, [asset.id])
+        
+        return _asset_responses([asset])[0]
+    
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload asset: {str(e)}"
+            detail=f"Failed to confirm upload: {str(e)}"
         )
 
 
-@router.get("", response_model=List[AssetResponse])
-async def get_assets(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+@router.get("", response_model=AssetListResponse)
+def get_assets(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(DEFAULT_ASSET_PAGE_SIZE, ge=1, le=MAX_ASSET_PAGE_SIZE, description="Maximum assets per page"),
+    category: Optional[str] = Query(None, description="Only return assets in this category"),
+    file_type: Optional[str] = Query(None, description="Only return assets with this MIME type"),
+    uploaded_after: Optional[datetime] = Query(None, description="Only return assets uploaded at or after this time"),
+    uploaded_before: Optional[datetime] = Query(None, description="Only return assets uploaded before this time"),
+    include_total: bool = Query(False, description="Also count all matching assets (request on the first page only)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
 ):
     """
-    Get all assets for the current user.
+    Get one page of the current user's assets, newest first.
     
     Args:
+        cursor: Cursor returned with the previous page (omit for the first page)
+        limit: Maximum number of assets in the page
+        category: Optional category filter
+        file_type: Optional MIME type filter
+        uploaded_after: Optional lower bound (inclusive) on upload time
+        uploaded_before: Optional upper bound (exclusive) on upload time
+        include_total: Whether to count all matching assets
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
-        List of AssetResponse objects
+        AssetListResponse: Page of assets with the cursor for the next page
+    
+    Raises:
+        HTTPException: 400 if the cursor is invalid
     """
-    assets = db.query(Asset).filter(Asset.user_id == current_user.id).all()
-    return assets
+    filters = {
+        "category": category,
+        "file_type": file_type,
+        "uploaded_after": uploaded_after,
+        "uploaded_before": uploaded_before,
+    }
+    
+    try:
+        assets, next_cursor = get_assets_page(db, current_user.id, limit, cursor=cursor, **filters)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    
+    total_count = count_assets(db, current_user.id, **filters) if include_total else None
+    
+    return AssetListResponse(
+        items=_asset_responses(assets),
+        next_cursor=next_cursor,
+        total_count=total_count
+    )
+
+
+@router.get("/search", response_model=List[AssetResponse])
+def search_asset_filenames(
+    q: str = Query(..., min_length=1, max_length=255, description="Words or word prefixes to find in filenames"),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS, description="Maximum number of results"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Search the current user's assets by filename.
+    
+    Every word in the query must match the start of a word in the filename
+    (case-insensitive), e.g. "sum hero" matches "Summer_Sale-hero.png".
+    
+    Args:
+        q: Search query
+        limit: Maximum number of results
+        current_user: Current authenticated user
+        db: Database session
+    
+    Returns:
+        List of matching AssetResponse objects, newest first
+    """
+    return _asset_responses(search_assets(db, current_user.id, q, limit))
+
+
+@router.post("/batch", response_model=AssetBatchResponse)
+def get_assets_batch(
+    batch_request: AssetBatchRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get several assets by ID in one request.
+    
+    Assets are loaded with a single query that applies the ownership check
+    of GET /assets/{asset_id}. Missing assets and assets owned by other
+    users are both reported as not_found.
+    
+    Args:
+        batch_request: IDs of the assets to fetch (up to 500)
+        current_user: Current authenticated user
+        db: Database session
+    
+    Returns:
+        AssetBatchResponse: One result per requested ID, in request order
+    """
+    assets = {asset.id: asset for asset in _asset_responses(
+        get_assets_by_ids(db, batch_request.asset_ids, current_user.id).values()
+    )}
+    
+    results = [
+        AssetBatchResult(asset_id=asset_id, status="found", asset=assets[asset_id])
+        if asset_id in assets
+        else AssetBatchResult(asset_id=asset_id, status="not_found")
+        for asset_id in batch_request.asset_ids
+    ]
+    found_count = sum(1 for result in results if result.status == "found")
+    
+    return AssetBatchResponse(
+        results=results,
+        found_count=found_count,
+        not_found_count=len(results) - found_count
+    )
 
 
 @router.get("/{asset_id}", response_model=AssetResponse)
-async def get_asset(
+def get_asset(
     asset_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get a specific asset by ID.
@@ -124,10 +853,10 @@ async def get_asset(
         asset_id: ID of the asset
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         AssetResponse: Asset details
-        
+    
     Raises:
         HTTPException: 404 if asset not found, 403 if asset belongs to different user
     """
@@ -145,23 +874,27 @@ async def get_asset(
             detail="You do not have permission to access this asset"
         )
     
-    return asset
+    return _asset_responses([asset])[0]
 
 
 @router.delete("/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_asset(
+def delete_asset(
     asset_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Delete an asset from S3 and database.
+    Delete an asset from the database and queue its S3 objects for deletion.
+    
+    The S3 object and its renditions are recorded in the s3_deletions outbox in
+    the same transaction as the row delete (unless another deduplicated asset
+    still references them) and removed by the background deletion worker.
     
     Args:
         asset_id: ID of the asset to delete
         current_user: Current authenticated user
         db: Database session
-        
+    
     Raises:
         HTTPException: 404 if asset not found, 403 if asset belongs to different user, 500 if deletion fails
     """
@@ -180,13 +913,10 @@ async def delete_asset(
         )
     
     try:
-        # Delete file from S3
-        s3_service.delete_file(asset.s3_key)
-        
-        # Delete asset record from database
+        # Delete asset record from database (S3 deletions are enqueued on flush)
         db.delete(asset)
         db.commit()
-        
+    
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -203,7 +933,7 @@ class RecategorizeRequest(BaseModel):
 @router.post("/recategorize", response_model=List[AssetResponse])
 async def recategorize_assets(
     request: RecategorizeRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -213,12 +943,13 @@ async def recategorize_assets(
         request: Request body with list of asset IDs
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         List of updated AssetResponse objects
-        
+    
     Raises:
-        HTTPException: 400 if assets not found or don't belong to user, 500 if OpenAI fails
+        HTTPException: 400 if assets not found or don't belong to user, 500 if OpenAI fails,
+            503 if the OpenAI bulkhead is full
     """
     if not request.asset_ids:
         raise HTTPException(
@@ -226,21 +957,40 @@ async def recategorize_assets(
             detail="asset_ids list cannot be empty"
         )
     
-    # Fetch all assets and verify they belong to current user
-    assets = db.query(Asset).filter(
-        Asset.id.in_(request.asset_ids),
-        Asset.user_id == current_user.id
-    ).all()
+    def load_assets() -> List[Asset]:
+        # Fetch all assets and verify they belong to current user
+        assets = db.query(Asset).filter(
+            Asset.id.in_(request.asset_ids),
+            Asset.user_id == current_user.id
+        ).all()
+        
+        if len(assets) != len(request.asset_ids):
+            # Some assets not found or don't belong to user
+            found_ids = {asset.id for asset in assets}
+            missing_ids = set(request.asset_ids) - found_ids
+            
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Some assets not found or you don't have permission: {list(missing_ids)}"
+            )
+        return assets
     
-    if len(assets) != len(request.asset_ids):
-        # Some assets not found or don't belong to user
-        found_ids = {asset.id for asset in assets}
-        missing_ids = set(request.asset_ids) - found_ids
+    def save_categories(assets: List[Asset], categorization_map: Dict[str, str]) -> List[Asset]:
+        updated_assets = []
+        for asset in assets:
+            if asset.id in categorization_map:
+                asset.category = categorization_map[asset.id]
+                asset.categorization_method = "ai"
+                updated_assets.append(asset)
         
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Some assets not found or you don't have permission: {list(missing_ids)}"
-        )
+        db.commit()
+        
+        # Refresh all assets
+        for asset in updated_assets:
+            db.refresh(asset)
+        return updated_assets
+    
+    assets = await run_in_threadpool(load_assets)
     
     try:
         start_time = time.time()
@@ -254,7 +1004,10 @@ async def recategorize_assets(
                 "id": asset.id,
                 "filename": asset.filename,
                 "file_type": asset.file_type,
-                "category": asset.category
+                "category": asset.category,
+                "width": asset.image_width,
+                "height": asset.image_height,
+                "has_transparency": asset.image_has_transparency
             }
             for asset in assets
         ]
@@ -263,34 +1016,25 @@ async def recategorize_assets(
         
         # OpenAI API call timing
         openai_start = time.time()
-        categorization_map = openai_service.categorize_assets(assets_metadata)
+        categorization_map = await openai_bulkhead.run(openai_service.categorize_assets, assets_metadata)
         openai_time = time.time() - openai_start
         print(f"[Recategorize] OpenAI API call: {openai_time:.3f}s")
         
         # Database update timing
         db_start = time.time()
-        updated_assets = []
-        for asset in assets:
-            if asset.id in categorization_map:
-                asset.category = categorization_map[asset.id]
-                asset.categorization_method = "ai"
-                updated_assets.append(asset)
-        
-        db.commit()
-        
-        # Refresh all assets
-        for asset in updated_assets:
-            db.refresh(asset)
+        updated_assets = await run_in_threadpool(save_categories, assets, categorization_map)
         db_time = time.time() - db_start
         print(f"[Recategorize] Database update: {db_time:.3f}s")
         
         total_time = time.time() - start_time
         print(f"[Recategorize] Total backend time: {total_time:.3f}s ({len(updated_assets)} asset(s) updated)")
         
-        return updated_assets
-        
+        return _asset_responses(updated_assets)
+    
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to recategorize assets: {str(e)}"
@@ -312,10 +1056,10 @@ class CategoryUpdateRequest(BaseModel):
 
 
 @router.patch("/{asset_id}/category", response_model=AssetResponse)
-async def update_asset_category(
+def update_asset_category(
     asset_id: str,
     request: CategoryUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -326,10 +1070,10 @@ async def update_asset_category(
         request: Request body with new category
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         Updated AssetResponse object
-        
+    
     Raises:
         HTTPException: 404 if asset not found, 403 if asset belongs to different user, 400 if invalid category
     """
@@ -355,8 +1099,8 @@ async def update_asset_category(
         db.commit()
         db.refresh(asset)
         
-        return asset
-        
+        return _asset_responses([asset])[0]
+    
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
-async def login(
+def login(
     login_data: LoginRequest,
     db: Session = Depends(get_db)
 ):
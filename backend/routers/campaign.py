@@ -1,13 +1,16 @@
 """Campaign router for campaign management."""
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
 from datetime import datetime
 import time
 
-from database import get_db
-from dependencies import get_current_user
-from models.user import User
+from concurrency import openai_bulkhead, mjml_bulkhead
+from database import get_async_db, get_async_read_db
+from dependencies import get_current_user_async
+from schemas.user import AuthenticatedUser
 from models.campaign import Campaign
 from models.asset import Asset
 from schemas.campaign import (
@@ -16,28 +19,39 @@ from schemas.campaign import (
     CampaignUpdate,
     CampaignWithAssets,
     CampaignStatus,
+    ApprovalQueueResponse,
     ProofGenerationResponse,
     RejectionRequest,
     SuccessMessage,
 )
 from crud.campaign import (
-    get_campaigns_by_user,
-    get_campaigns_by_status,
-    get_campaign_with_assets,
-    link_assets_to_campaign,
+    get_campaigns_by_user_async,
+    get_campaigns_by_status_async,
+    get_campaign_with_assets_async,
+    link_assets_to_campaign_async,
+    get_approval_queue_page_async,
+    transition_campaign_status_async,
+    CAMPAIGN_STATUS_TRANSITIONS,
 )
-from crud.metrics import record_metric
+from crud.metrics import record_metric_async
 from services.openai_service import openai_service
 from services.mjml_service import compile_mjml_to_html
+from services.s3_service import s3_service
+from services.derivative_service import derivative_service, PROOF_RENDITION
+from routers.asset import sign_asset_urls
 
 router = APIRouter(prefix="/api/campaigns", tags=["campaigns"])
 
+# Approval queue page size (keyset-paginated, see crud.campaign.get_approval_queue_page)
+DEFAULT_APPROVAL_QUEUE_PAGE_SIZE = 50
+MAX_APPROVAL_QUEUE_PAGE_SIZE = 200
+
 
 @router.post("", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
     campaign_data: CampaignCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new campaign with linked assets.
@@ -46,18 +60,18 @@ async def create_campaign(
         campaign_data: Campaign creation data including asset IDs
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         CampaignResponse: Created campaign
-        
+    
     Raises:
         HTTPException: 400 if validation fails, 404 if assets not found or don't belong to user
     """
     # Verify all assets belong to current user
-    assets = db.query(Asset).filter(
+    assets = (await db.scalars(select(Asset).where(
         Asset.id.in_(campaign_data.asset_ids),
         Asset.user_id == current_user.id
-    ).all()
+    ))).all()
     
     if len(assets) != len(campaign_data.asset_ids):
         found_ids = {asset.id for asset in assets}
@@ -80,22 +94,22 @@ async def create_campaign(
         )
         
         db.add(campaign)
-        db.flush()  # Flush to get campaign ID
+        await db.flush()  # Flush to get campaign ID
         
         # Link assets to campaign
-        link_assets_to_campaign(
+        await link_assets_to_campaign_async(
             db=db,
             campaign_id=campaign.id,
             asset_ids=campaign_data.asset_ids
         )
         
-        db.commit()
-        db.refresh(campaign)
+        await db.commit()
+        await db.refresh(campaign)
         
         return campaign
-        
+    
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create campaign: {str(e)}"
@@ -104,8 +118,8 @@ async def create_campaign(
 
 @router.get("", response_model=List[CampaignResponse])
 async def get_campaigns(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get all campaigns based on user role.
@@ -116,39 +130,49 @@ async def get_campaigns(
     Args:
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         List of CampaignResponse objects
     """
     if current_user.role == "campaign_manager":
         # Managers see pending approval campaigns
-        campaigns = get_campaigns_by_status(db, CampaignStatus.PENDING_APPROVAL.value)
+        campaigns = await get_campaigns_by_status_async(db, CampaignStatus.PENDING_APPROVAL.value)
     else:
         # Advertisers see their own campaigns
-        campaigns = get_campaigns_by_user(db, current_user.id)
+        campaigns = await get_campaigns_by_user_async(db, current_user.id)
     
     return campaigns
 
 
-@router.get("/approval-queue", response_model=List[CampaignResponse])
+@router.get("/approval-queue", response_model=ApprovalQueueResponse)
 async def get_approval_queue(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(
+        DEFAULT_APPROVAL_QUEUE_PAGE_SIZE,
+        ge=1,
+        le=MAX_APPROVAL_QUEUE_PAGE_SIZE,
+        description="Maximum campaigns per page"
+    ),
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
-    Get approval queue for campaign managers.
+    Get one page of the approval queue for campaign managers.
     
-    Returns all campaigns with status "pending_approval", sorted by created_at (oldest first).
+    Returns campaigns with status "pending_approval", oldest first, as
+    summaries without the generated email (fetch a campaign for its proof).
     
     Args:
+        cursor: Cursor returned with the previous page (omit for the first page)
+        limit: Maximum number of campaigns in the page
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
-        List of CampaignResponse objects sorted by created_at (empty list if no campaigns)
-        
+        ApprovalQueueResponse: Page of campaign summaries with the cursor for the next page
+    
     Raises:
-        HTTPException: 403 if user is not campaign_manager
+        HTTPException: 403 if user is not campaign_manager, 400 if the cursor is invalid
     """
     # Verify user is campaign_manager
     if current_user.role != "campaign_manager":
@@ -157,20 +181,22 @@ async def get_approval_queue(
             detail="Only campaign managers can access the approval queue"
         )
     
-    # Query campaigns with status "pending_approval"
-    campaigns = get_campaigns_by_status(db, CampaignStatus.PENDING_APPROVAL.value)
-    
-    # Sort by created_at (oldest first)
-    campaigns.sort(key=lambda c: c.created_at)
+    try:
+        campaigns, next_cursor = await get_approval_queue_page_async(db, limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
     
-    return campaigns
+    return ApprovalQueueResponse(items=campaigns, next_cursor=next_cursor)
 
 
 @router.get("/{campaign_id}", response_model=CampaignWithAssets)
 async def get_campaign(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get a specific campaign with its linked assets.
@@ -179,14 +205,14 @@ async def get_campaign(
         campaign_id: ID of the campaign
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         CampaignWithAssets: Campaign with linked assets
-        
+    
     Raises:
         HTTPException: 404 if campaign not found, 403 if user doesn't have permission
     """
-    campaign = get_campaign_with_assets(db, campaign_id)
+    campaign = await get_campaign_with_assets_async(db, campaign_id)
     
     if not campaign:
         raise HTTPException(
@@ -211,15 +237,19 @@ async def get_campaign(
                 detail="You can only view campaigns pending approval"
             )
     
-    return campaign
+    # Sign the URLs of all linked assets in one pass
+    response = CampaignWithAssets.model_validate(campaign)
+    sign_asset_urls([campaign_asset.asset for campaign_asset in response.campaign_assets])
+    
+    return response
 
 
 @router.patch("/{campaign_id}", response_model=CampaignResponse)
 async def update_campaign(
     campaign_id: str,
     campaign_data: CampaignUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update campaign details (name, audience, goal, notes).
@@ -232,14 +262,14 @@ async def update_campaign(
         campaign_data: Campaign update data
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         CampaignResponse: Updated campaign
-        
+    
     Raises:
         HTTPException: 404 if campaign not found, 403 if user doesn't have permission, 400 if campaign is not in draft status
     """
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    campaign = await db.scalar(select(Campaign).where(Campaign.id == campaign_id))
     
     if not campaign:
         raise HTTPException(
@@ -272,13 +302,13 @@ async def update_campaign(
         if campaign_data.additional_notes is not None:
             campaign.additional_notes = campaign_data.additional_notes
         
-        db.commit()
-        db.refresh(campaign)
+        await db.commit()
+        await db.refresh(campaign)
         
         return campaign
-        
+    
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update campaign: {str(e)}"
@@ -288,8 +318,8 @@ async def update_campaign(
 @router.delete("/{campaign_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_campaign(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a campaign and cascade to campaign_assets.
@@ -301,11 +331,14 @@ async def delete_campaign(
         campaign_id: ID of the campaign to delete
         current_user: Current authenticated user
         db: Database session
-        
+    
     Raises:
         HTTPException: 404 if campaign not found, 403 if user doesn't have permission, 400 if campaign is not in draft status
     """
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    # Load the linked assets with the campaign; the cascade cannot lazy-load them
+    campaign = await db.scalar(
+        select(Campaign).options(selectinload(Campaign.campaign_assets)).where(Campaign.id == campaign_id)
+    )
     
     if not campaign:
         raise HTTPException(
@@ -329,11 +362,11 @@ async def delete_campaign(
     
     try:
         # Delete campaign (cascade will handle campaign_assets)
-        db.delete(campaign)
-        db.commit()
-        
+        await db.delete(campaign)
+        await db.commit()
+    
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete campaign: {str(e)}"
@@ -343,25 +376,35 @@ async def delete_campaign(
 @router.post("/{campaign_id}/generate-proof", response_model=ProofGenerationResponse)
 async def generate_proof(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate email proof (MJML and HTML) for a campaign using AI.
     
+    Database work runs on the async session and the OpenAI call and MJML
+    compilation run in their own bulkheads, so a slow generation never
+    blocks the event loop or the threads serving other endpoints. No
+    transaction is open during generation: the campaign is read in one and
+    reloaded and updated in another.
+    
     Args:
         campaign_id: ID of the campaign
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         ProofGenerationResponse: Generated MJML, HTML, and generation time
-        
+    
     Raises:
-        HTTPException: 404 if campaign not found, 403 if user doesn't have permission, 500 if generation fails
+        HTTPException: 404 if campaign not found, 403 if user doesn't have permission,
+            500 if generation fails, 503 if the OpenAI or MJML bulkhead is full
     """
+    # Start performance timer
+    start_time = time.time()
+    
     # Fetch campaign with assets
-    campaign = get_campaign_with_assets(db, campaign_id)
+    campaign = await get_campaign_with_assets_async(db, campaign_id)
     
     if not campaign:
         raise HTTPException(
@@ -383,114 +426,214 @@ async def generate_proof(
             detail="Campaign must have at least one asset to generate proof"
         )
     
-    # Start performance timer
-    start_time = time.time()
+    # Prepare campaign details for OpenAI
+    campaign_details = {
+        "name": campaign.campaign_name,
+        "audience": campaign.target_audience or "general audience",
+        "goal": campaign.campaign_goal or "engage customers",
+        "notes": campaign.additional_notes or ""
+    }
+    
+    # Prepare assets for OpenAI, referencing the email-optimized rendition of
+    # each image when one exists (URLs are generated on read)
+    proof_keys = {}
+    optimized_count = 0
+    bytes_saved = 0
+    for campaign_asset in campaign.campaign_assets:
+        asset = campaign_asset.asset
+        rendition = derivative_service.get_rendition(asset, PROOF_RENDITION)
+        if rendition:
+            proof_keys[asset.id] = rendition["s3_key"]
+            optimized_count += 1
+            bytes_saved += asset.file_size_bytes - rendition["size_bytes"]
+        else:
+            proof_keys[asset.id] = asset.s3_key
+    
+    asset_urls = s3_service.get_presigned_urls(proof_keys.values())
+    assets = []
+    for campaign_asset in campaign.campaign_assets:
+        asset = campaign_asset.asset
+        assets.append({
+            "id": asset.id,
+            "filename": asset.filename,
+            "s3_url": asset_urls[proof_keys[asset.id]],
+            "category": asset.category,
+            "file_type": asset.file_type,
+            "text_excerpt": asset.text_excerpt,
+            "text_word_count": asset.text_word_count
+        })
+    campaign_name = campaign.campaign_name
+    
+    # End the read transaction before generating: the OpenAI call and MJML
+    # compilation take seconds, and an open transaction would hold a pooled
+    # connection (idle in transaction on PostgreSQL) for all of that time
+    await db.commit()
     
     try:
-        # Prepare campaign details for OpenAI
-        campaign_details = {
-            "name": campaign.campaign_name,
-            "audience": campaign.target_audience or "general audience",
-            "goal": campaign.campaign_goal or "engage customers",
-            "notes": campaign.additional_notes or ""
-        }
-        
-        # Prepare assets for OpenAI
-        assets = []
-        for campaign_asset in campaign.campaign_assets:
-            asset = campaign_asset.asset
-            assets.append({
-                "id": asset.id,
-                "filename": asset.filename,
-                "s3_url": asset.s3_url,
-                "category": asset.category,
-                "file_type": asset.file_type
-            })
-        
         # Generate MJML using OpenAI
-        mjml_code = openai_service.generate_email_mjml(
+        mjml_code = await openai_bulkhead.run(
+            openai_service.generate_email_mjml,
             campaign_details=campaign_details,
             assets=assets
         )
         
         # Compile MJML to HTML
-        html_code = compile_mjml_to_html(mjml_code)
+        html_code = await mjml_bulkhead.run(compile_mjml_to_html, mjml_code)
         
         # Calculate generation time
         generation_time = time.time() - start_time
         
+        # Reload the campaign in a new transaction: it may have changed or
+        # been deleted while the proof was generated
+        campaign = await db.get(Campaign, campaign_id, populate_existing=True)
+        if not campaign:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Campaign not found"
+            )
+        
         # Update campaign with generated content
         campaign.generated_email_mjml = mjml_code
         campaign.generated_email_html = html_code
         
         # Record performance metric
-        record_metric(
+        await record_metric_async(
             db=db,
             metric_type="proof_generation_time",
             metric_value=generation_time,
             metadata={
                 "campaign_id": campaign_id,
-                "campaign_name": campaign.campaign_name,
+                "campaign_name": campaign_name,
                 "asset_count": len(assets),
                 "mjml_length": len(mjml_code),
                 "html_length": len(html_code)
             }
         )
         
-        db.commit()
+        if optimized_count:
+            await record_metric_async(
+                db=db,
+                metric_type="proof_image_bytes_saved",
+                metric_value=bytes_saved,
+                metadata={
+                    "campaign_id": campaign_id,
+                    "optimized_image_count": optimized_count
+                }
+            )
+        
+        await db.commit()
         
         return ProofGenerationResponse(
             mjml=mjml_code,
             html=html_code,
             generation_time=round(generation_time, 2)
         )
-        
+    
+    except HTTPException:
+        raise
     except ValueError as e:
         # MJML compilation errors
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to compile MJML: {str(e)}"
         )
     except RuntimeError as e:
         # MJML command not found
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"MJML service error: {str(e)}"
         )
     except Exception as e:
         # OpenAI or other errors
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate email proof: {str(e)}"
         )
 
 
+async def _status_transition_error(
+    db: AsyncSession,
+    campaign_id: str,
+    action: str,
+    advertiser_id: Optional[str] = None
+) -> HTTPException:
+    """
+    Explain why a status transition matched no campaign.
+    
+    Only runs after transition_campaign_status_async returned None, so the
+    successful path stays a single UPDATE.
+    
+    Args:
+        db: Database session
+        campaign_id: ID of the campaign
+        action: Key of CAMPAIGN_STATUS_TRANSITIONS that failed
+        advertiser_id: Required owner of the campaign, if the action checks ownership
+    
+    Returns:
+        HTTPException: 404 if campaign not found, 403 if owned by someone else,
+            409 if the campaign is in another status, 400 if it has no generated email
+    """
+    campaign = (await db.execute(
+        select(
+            Campaign.status,
+            Campaign.advertiser_id,
+            and_(Campaign.generated_email_html != "", Campaign.generated_email_mjml != "").label("has_proof")
+        ).where(Campaign.id == campaign_id)
+    )).first()
+    
+    if not campaign:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    
+    if advertiser_id is not None and campaign.advertiser_id != advertiser_id:
+        return HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"You do not have permission to {action} this campaign"
+        )
+    
+    expected_status, _ = CAMPAIGN_STATUS_TRANSITIONS[action]
+    if campaign.status != expected_status:
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot {action} campaign with status '{campaign.status}'. The campaign must be '{expected_status}'."
+        )
+    
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Campaign must have a generated email before submission"
+    )
+
+
 @router.post("/{campaign_id}/submit", response_model=SuccessMessage)
 async def submit_campaign(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Submit a campaign for approval.
     
     Only advertisers can submit campaigns.
-    Campaign must belong to the current user.
-    Campaign must have a generated email.
+    Campaign must belong to the current user, be a draft and have a generated email.
+    The status changes in one conditional UPDATE, so a double submit cannot
+    move the campaign twice.
     
     Args:
         campaign_id: ID of the campaign to submit
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         SuccessMessage: Success message
-        
+    
     Raises:
-        HTTPException: 403 if user is not advertiser or doesn't own campaign, 400 if campaign has no generated email
+        HTTPException: 403 if user is not advertiser or doesn't own campaign, 404 if campaign not found,
+            409 if campaign is not a draft, 400 if campaign has no generated email
     """
     # Verify user is advertiser
     if current_user.role != "advertiser":
@@ -499,67 +642,60 @@ async def submit_campaign(
             detail="Only advertisers can submit campaigns"
         )
     
-    # Fetch campaign
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Campaign not found"
-        )
-    
-    # Verify campaign belongs to current user
-    if campaign.advertiser_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to submit this campaign"
-        )
-    
-    # Verify campaign has generated email
-    if not campaign.generated_email_html or not campaign.generated_email_mjml:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Campaign must have a generated email before submission"
+    try:
+        # Update campaign status to pending_approval if it is the user's draft with a generated email
+        # (!= "" is false for NULL as well as for empty content)
+        campaign = await transition_campaign_status_async(
+            db,
+            campaign_id,
+            "submit",
+            values={"updated_at": datetime.now()},
+            conditions=(
+                Campaign.advertiser_id == current_user.id,
+                Campaign.generated_email_html != "",
+                Campaign.generated_email_mjml != "",
+            )
         )
+        if campaign:
+            await db.commit()
     
-    try:
-        # Update campaign status to pending_approval
-        campaign.status = CampaignStatus.PENDING_APPROVAL.value
-        campaign.updated_at = datetime.now()
-        
-        db.commit()
-        
-        return SuccessMessage(message="Campaign submitted for approval")
-        
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to submit campaign: {str(e)}"
         )
+    
+    if not campaign:
+        raise await _status_transition_error(db, campaign_id, "submit", advertiser_id=current_user.id)
+    
+    return SuccessMessage(message="Campaign submitted for approval")
 
 
 @router.post("/{campaign_id}/approve", response_model=SuccessMessage)
 async def approve_campaign(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Approve a campaign.
     
-    Only campaign managers can approve campaigns.
+    Only campaign managers can approve campaigns, and only while they are
+    pending approval. When two managers review the same campaign at once,
+    the first review wins and the second gets a 409.
     
     Args:
         campaign_id: ID of the campaign to approve
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         SuccessMessage: Success message
-        
+    
     Raises:
-        HTTPException: 403 if user is not campaign_manager, 404 if campaign not found
+        HTTPException: 403 if user is not campaign_manager, 404 if campaign not found,
+            409 if campaign is not pending approval
     """
     # Verify user is campaign_manager
     if current_user.role != "campaign_manager":
@@ -568,57 +704,56 @@ async def approve_campaign(
             detail="Only campaign managers can approve campaigns"
         )
     
-    # Fetch campaign from database
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Campaign not found"
-        )
-    
     try:
-        # Update status to approved
-        campaign.status = CampaignStatus.APPROVED.value
-        campaign.reviewed_by = current_user.id
-        campaign.reviewed_at = datetime.now()
-        campaign.updated_at = datetime.now()
-        
-        # Record approval metric
-        record_metric(
-            db=db,
-            metric_type="campaign_approval",
-            metric_value=1.0,
-            metadata={
-                "campaign_id": campaign_id,
-                "campaign_name": campaign.campaign_name,
-                "reviewed_by": current_user.id
-            }
-        )
-        
-        db.commit()
-        
-        return SuccessMessage(message="Campaign approved")
-        
+        # Update status to approved if the campaign is still pending
+        reviewed_at = datetime.now()
+        campaign = await transition_campaign_status_async(
+            db,
+            campaign_id,
+            "approve",
+            values={"reviewed_by": current_user.id, "reviewed_at": reviewed_at, "updated_at": reviewed_at}
+        )
+        
+        if campaign:
+            # Record approval metric
+            await record_metric_async(
+                db=db,
+                metric_type="campaign_approval",
+                metric_value=1.0,
+                metadata={
+                    "campaign_id": campaign_id,
+                    "campaign_name": campaign.campaign_name,
+                    "reviewed_by": current_user.id
+                }
+            )
+            
+            await db.commit()
+    
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to approve campaign: {str(e)}"
         )
+    
+    if not campaign:
+        raise await _status_transition_error(db, campaign_id, "approve")
+    
+    return SuccessMessage(message="Campaign approved")
 
 
 @router.post("/{campaign_id}/reject", response_model=SuccessMessage)
 async def reject_campaign(
     campaign_id: str,
     rejection_data: RejectionRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Reject a campaign with a reason.
     
-    Only campaign managers can reject campaigns.
+    Only campaign managers can reject campaigns, and only while they are
+    pending approval.
     Rejection reason is required and cannot be empty.
     
     Args:
@@ -626,12 +761,13 @@ async def reject_campaign(
         rejection_data: Rejection request with reason
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         SuccessMessage: Success message
-        
+    
     Raises:
-        HTTPException: 403 if user is not campaign_manager, 404 if campaign not found, 400 if rejection reason is empty
+        HTTPException: 403 if user is not campaign_manager, 404 if campaign not found, 400 if rejection reason is empty,
+            409 if campaign is not pending approval
     """
     # Verify user is campaign_manager
     if current_user.role != "campaign_manager":
@@ -649,44 +785,45 @@ async def reject_campaign(
             detail="Rejection reason cannot be empty"
         )
     
-    # Fetch campaign from database
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Campaign not found"
-        )
-    
     try:
-        # Update status to rejected
-        campaign.status = CampaignStatus.REJECTED.value
-        campaign.reviewed_by = current_user.id
-        campaign.reviewed_at = datetime.now()
-        campaign.rejection_reason = rejection_reason
-        campaign.updated_at = datetime.now()
-        
-        # Record rejection metric
-        record_metric(
-            db=db,
-            metric_type="campaign_rejection",
-            metric_value=1.0,
-            metadata={
-                "campaign_id": campaign_id,
-                "campaign_name": campaign.campaign_name,
+        # Update status to rejected if the campaign is still pending
+        reviewed_at = datetime.now()
+        campaign = await transition_campaign_status_async(
+            db,
+            campaign_id,
+            "reject",
+            values={
                 "reviewed_by": current_user.id,
-                "rejection_reason": rejection_reason
+                "reviewed_at": reviewed_at,
+                "rejection_reason": rejection_reason,
+                "updated_at": reviewed_at
             }
         )
         
-        db.commit()
-        
-        return SuccessMessage(message="Campaign rejected")
-        
+        if campaign:
+            # Record rejection metric
+            await record_metric_async(
+                db=db,
+                metric_type="campaign_rejection",
+                metric_value=1.0,
+                metadata={
+                    "campaign_id": campaign_id,
+                    "campaign_name": campaign.campaign_name,
+                    "reviewed_by": current_user.id,
+                    "rejection_reason": rejection_reason
+                }
+            )
+            
+            await db.commit()
+    
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reject campaign: {str(e)}"
         )
-
+    
+    if not campaign:
+        raise await _status_transition_error(db, campaign_id, "reject")
+    
+    return SuccessMessage(message="Campaign rejected")
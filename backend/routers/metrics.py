@@ -1,15 +1,16 @@
 """Metrics router for performance monitoring endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime, timedelta
 from decimal import Decimal
 import statistics
 
-from database import get_db
-from dependencies import get_current_user
-from models.user import User
+from concurrency import mjml_bulkhead, openai_bulkhead, storage_bulkhead
+from database import get_async_read_db, pool_statistics
+from dependencies import get_current_user_async
+from schemas.user import AuthenticatedUser
 from models.system_health import SystemHealth
 from models.performance_metric import PerformanceMetric
 from schemas.metrics import (
@@ -17,19 +18,28 @@ from schemas.metrics import (
     ProofGenerationMetricsResponse,
     QueueDepthMetricsResponse,
     ApprovalRateMetricsResponse,
+    DeduplicationMetricsResponse,
+    DatabasePoolMetricsResponse,
+    AuthCacheMetricsResponse,
+    BulkheadMetricsResponse,
+)
+from services.user_cache import user_cache
+from crud.metrics import (
+    get_queue_depth_async,
+    calculate_approval_rate_async,
+    calculate_deduplication_savings_async,
 )
-from crud.metrics import get_queue_depth, calculate_approval_rate
 
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 
 
-def require_tech_support(current_user: User) -> None:
+def require_tech_support(current_user: AuthenticatedUser) -> None:
     """
     Verify user has tech_support role.
     
     Args:
         current_user: Current authenticated user
-        
+    
     Raises:
         HTTPException: 403 if user is not tech_support
     """
@@ -43,8 +53,8 @@ def require_tech_support(current_user: User) -> None:
 @router.get("/uptime", response_model=UptimeMetricsResponse)
 async def get_uptime_metrics(
     component: str = Query(..., description="Component name (api, s3, database, openai)"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get uptime metrics for a system component over the last 24 hours.
@@ -53,10 +63,10 @@ async def get_uptime_metrics(
         component: Component name to check (api, s3, database, openai)
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         UptimeMetricsResponse: Uptime metrics for the component
-        
+    
     Raises:
         HTTPException: 403 if user is not tech_support, 400 if invalid component
     """
@@ -73,12 +83,12 @@ async def get_uptime_metrics(
     # Query system_health table for last 24 hours
     cutoff_time = datetime.now() - timedelta(hours=24)
     
-    health_checks = db.query(SystemHealth).filter(
+    health_checks = (await db.scalars(select(SystemHealth).where(
         and_(
             SystemHealth.component == component,
             SystemHealth.checked_at >= cutoff_time
         )
-    ).all()
+    ))).all()
     
     total_checks = len(health_checks)
     
@@ -113,8 +123,8 @@ async def get_uptime_metrics(
 
 @router.get("/proof-generation", response_model=ProofGenerationMetricsResponse)
 async def get_proof_generation_metrics(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get proof generation performance metrics (average, P50, P95, P99).
@@ -122,19 +132,19 @@ async def get_proof_generation_metrics(
     Args:
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         ProofGenerationMetricsResponse: Proof generation metrics
-        
+    
     Raises:
         HTTPException: 403 if user is not tech_support
     """
     require_tech_support(current_user)
     
     # Query performance_metrics table for proof generation times
-    metrics = db.query(PerformanceMetric).filter(
+    metrics = (await db.scalars(select(PerformanceMetric).where(
         PerformanceMetric.metric_type == "proof_generation_time"
-    ).all()
+    ))).all()
     
     if not metrics:
         # No data available
@@ -183,8 +193,8 @@ async def get_proof_generation_metrics(
 
 @router.get("/queue-depth", response_model=QueueDepthMetricsResponse)
 async def get_queue_depth_metrics(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get current approval queue depth.
@@ -192,17 +202,17 @@ async def get_queue_depth_metrics(
     Args:
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         QueueDepthMetricsResponse: Current queue depth
-        
+    
     Raises:
         HTTPException: 403 if user is not tech_support
     """
     require_tech_support(current_user)
     
     # Use existing function from crud.metrics
-    depth = get_queue_depth(db)
+    depth = await get_queue_depth_async(db)
     
     return QueueDepthMetricsResponse(queue_depth=depth)
 
@@ -210,8 +220,8 @@ async def get_queue_depth_metrics(
 @router.get("/approval-rate", response_model=ApprovalRateMetricsResponse)
 async def get_approval_rate_metrics(
     days: int = Query(7, ge=1, le=365, description="Number of days to look back (default: 7)"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get campaign approval rate metrics over a specified time period.
@@ -220,17 +230,17 @@ async def get_approval_rate_metrics(
         days: Number of days to look back (default: 7, min: 1, max: 365)
         current_user: Current authenticated user
         db: Database session
-        
+    
     Returns:
         ApprovalRateMetricsResponse: Approval rate metrics with breakdown
-        
+    
     Raises:
         HTTPException: 403 if user is not tech_support
     """
     require_tech_support(current_user)
     
     # Use existing function from crud.metrics
-    result = calculate_approval_rate(db, days=days)
+    result = await calculate_approval_rate_async(db, days=days)
     
     return ApprovalRateMetricsResponse(
         approval_rate=result["approval_rate"],
@@ -240,3 +250,92 @@ async def get_approval_rate_metrics(
         days=result["days"]
     )
 
+
+@router.get("/deduplication", response_model=DeduplicationMetricsResponse)
+async def get_deduplication_metrics(
+    current_user: AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Get storage and upload time saved by content-hash deduplication.
+    
+    Args:
+        current_user: Current authenticated user
+        db: Database session
+    
+    Returns:
+        DeduplicationMetricsResponse: Deduplication savings
+    
+    Raises:
+        HTTPException: 403 if user is not tech_support
+    """
+    require_tech_support(current_user)
+    
+    result = await calculate_deduplication_savings_async(db)
+    
+    return DeduplicationMetricsResponse(**result)
+
+
+@router.get("/database-pool", response_model=DatabasePoolMetricsResponse)
+async def get_database_pool_metrics(
+    current_user: AuthenticatedUser = Depends(get_current_user_async)
+):
+    """
+    Get live connection pool statistics of the sync and async engines and read replicas.
+    
+    Args:
+        current_user: Current authenticated user
+    
+    Returns:
+        DatabasePoolMetricsResponse: Connections in use, overflow and checkout wait times
+    
+    Raises:
+        HTTPException: 403 if user is not tech_support
+    """
+    require_tech_support(current_user)
+    
+    return DatabasePoolMetricsResponse(pools=pool_statistics())
+
+
+@router.get("/auth-cache", response_model=AuthCacheMetricsResponse)
+async def get_auth_cache_metrics(
+    current_user: AuthenticatedUser = Depends(get_current_user_async)
+):
+    """
+    Get hit/miss statistics of the authenticated user cache (this process).
+    
+    Args:
+        current_user: Current authenticated user
+    
+    Returns:
+        AuthCacheMetricsResponse: Cache hits, misses and size
+    
+    Raises:
+        HTTPException: 403 if user is not tech_support
+    """
+    require_tech_support(current_user)
+    
+    return AuthCacheMetricsResponse(**user_cache.stats())
+
+
+@router.get("/bulkheads", response_model=BulkheadMetricsResponse)
+async def get_bulkhead_metrics(
+    current_user: AuthenticatedUser = Depends(get_current_user_async)
+):
+    """
+    Get usage of the storage, OpenAI and MJML bulkhead thread pools (this process).
+    
+    Args:
+        current_user: Current authenticated user
+    
+    Returns:
+        BulkheadMetricsResponse: Running, queued and rejected calls per bulkhead
+    
+    Raises:
+        HTTPException: 403 if user is not tech_support
+    """
+    require_tech_support(current_user)
+    
+    return BulkheadMetricsResponse(
+        bulkheads=[bulkhead.stats() for bulkhead in (storage_bulkhead, openai_bulkhead, mjml_bulkhead)]
+    )
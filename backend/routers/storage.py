@@ -0,0 +1,124 @@
+"""Storage router serving signed URLs of the local filesystem backend."""
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from services.s3_service import s3_service, HashingReader, FileTooLargeError
+from services.local_storage_backend import LocalStorageBackend
+
+router = APIRouter(prefix="/api/storage", tags=["storage"])
+
+
+def get_local_backend() -> LocalStorageBackend:
+    """
+    Get the local storage backend.
+    
+    Returns:
+        LocalStorageBackend: The configured backend
+    
+    Raises:
+        HTTPException: 404 if storage is not served by this API (S3 backend)
+    """
+    if not isinstance(s3_service.backend, LocalStorageBackend):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Local storage is not enabled"
+        )
+    return s3_service.backend
+
+
+@router.get("/objects/{key:path}")
+def download_object(
+    key: str,
+    expires: int = Query(...),
+    signature: str = Query(...)
+):
+    """
+    Download an object through a signed URL (local equivalent of an S3 pre-signed GET).
+    
+    Sync handler: the metadata lookup reads the filesystem, so it runs in the
+    request thread pool (the streamed chunks are read there as well).
+    
+    Args:
+        key: Object key
+        expires: Expiry timestamp from the signed URL
+        signature: Signature from the signed URL
+    
+    Returns:
+        StreamingResponse: Object content streamed from a memory map
+    
+    Raises:
+        HTTPException: 403 if the signature is invalid or expired, 404 if the object does not exist
+    """
+    backend = get_local_backend()
+    
+    if not backend.verify_get_signature(key, expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired signature"
+        )
+    
+    object_metadata = backend.head(key)
+    if object_metadata is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Object not found"
+        )
+    
+    return StreamingResponse(
+        backend.iter_chunks(key),
+        media_type=object_metadata["content_type"] or "application/octet-stream",
+        headers={
+            "Content-Length": str(object_metadata["size_bytes"]),
+            "ETag": f'"{object_metadata["etag"]}"',
+        }
+    )
+
+
+@router.post("/upload", status_code=status.HTTP_204_NO_CONTENT)
+def upload_object(
+    key: str = Form(...),
+    content_type: str = Form(..., alias="Content-Type"),
+    policy: str = Form(...),
+    signature: str = Form(...),
+    file: UploadFile = File(...)
+):
+    """
+    Accept a form upload signed by a POST policy (local equivalent of an S3 presigned POST).
+    
+    Args:
+        key: Object key pinned by the policy
+        content_type: Content type pinned by the policy
+        policy: Base64-encoded policy
+        signature: Policy signature
+        file: Uploaded file
+    
+    Raises:
+        HTTPException: 403 if the policy is invalid, expired or does not match the form,
+            400 if the file is empty or exceeds the policy size limit
+    """
+    backend = get_local_backend()
+    
+    upload_policy = backend.verify_post_policy(policy, signature)
+    if upload_policy is None or upload_policy["key"] != key or upload_policy["content_type"] != content_type:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired upload policy"
+        )
+    
+    try:
+        reader = HashingReader(file.file, max_size=upload_policy["max_size"])
+        backend.put_stream(key, reader, content_type)
+    except FileTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File exceeds the maximum size allowed by the upload policy"
+        )
+    
+    if reader.size_bytes == 0:
+        backend.delete(key)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is empty"
+        )
+    
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
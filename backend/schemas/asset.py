@@ -1,6 +1,6 @@
 """Pydantic schemas for asset operations."""
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -8,7 +8,7 @@ class AssetCreate(BaseModel):
     """Schema for creating an asset (used internally)."""
     filename: str
     s3_key: str
-    s3_url: str
+    s3_url: Optional[str] = None
     file_type: str
     file_size_bytes: int
     category: str
@@ -21,11 +21,20 @@ class AssetResponse(BaseModel):
     user_id: str
     filename: str
     s3_key: str
-    s3_url: str
+    s3_url: Optional[str] = None
     file_type: str
     file_size_bytes: int
+    content_hash: Optional[str] = None
     category: str
     categorization_method: Optional[str] = None
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_aspect_ratio: Optional[float] = None
+    image_has_transparency: Optional[bool] = None
+    image_color_depth: Optional[int] = None
+    derivatives: Optional[Dict[str, Dict[str, Any]]] = None
+    thumbnail_url: Optional[str] = None
+    text_word_count: Optional[int] = None
     uploaded_at: datetime
     
     class Config:
@@ -46,3 +55,73 @@ class AssetUpdate(BaseModel):
                 raise ValueError(f"Category must be one of: {', '.join(valid_categories)}")
         return v
 
+
+
+class PresignedUploadRequest(BaseModel):
+    """Schema for requesting a direct-to-S3 upload policy."""
+    filename: str = Field(..., min_length=1, max_length=255, description="Name of the file to upload")
+    content_type: Optional[str] = Field(None, description="MIME type of the file (guessed from filename if omitted)")
+    
+    @field_validator('filename')
+    @classmethod
+    def validate_filename(cls, v):
+        """Validate filename has no path components."""
+        if "/" in v or "\\" in v or v in (".", ".."):
+            raise ValueError("Filename cannot contain path separators")
+        return v
+
+
+class PresignedUploadResponse(BaseModel):
+    """Schema for a presigned POST upload policy."""
+    url: str
+    fields: Dict[str, str]
+    s3_key: str
+    expires_in: int
+    max_size_bytes: int
+
+
+class UploadConfirmRequest(BaseModel):
+    """Schema for confirming a direct-to-S3 upload."""
+    s3_key: str = Field(..., description="S3 key returned by the upload-url endpoint")
+
+
+class BulkUploadFileResult(BaseModel):
+    """Schema for the outcome of one file in a bulk upload."""
+    filename: str
+    status: str = Field(..., description="uploaded or failed")
+    asset: Optional[AssetResponse] = None
+    error: Optional[str] = None
+
+
+class BulkUploadResponse(BaseModel):
+    """Schema for bulk upload response."""
+    results: List[BulkUploadFileResult]
+    uploaded_count: int
+    failed_count: int
+    total_time: float = Field(..., description="Total wall time in seconds")
+
+
+class AssetListResponse(BaseModel):
+    """Schema for one page of the asset listing."""
+    items: List[AssetResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (null on the last page)")
+    total_count: Optional[int] = Field(None, description="Number of matching assets (only when include_total is set)")
+
+
+class AssetBatchRequest(BaseModel):
+    """Schema for fetching several assets by ID."""
+    asset_ids: List[str] = Field(..., min_length=1, max_length=500, description="IDs of the assets to fetch")
+
+
+class AssetBatchResult(BaseModel):
+    """Schema for the outcome of one requested asset ID."""
+    asset_id: str
+    status: str = Field(..., description="found or not_found")
+    asset: Optional[AssetResponse] = None
+
+
+class AssetBatchResponse(BaseModel):
+    """Schema for batch asset fetch response (results in request order)."""
+    results: List[AssetBatchResult]
+    found_count: int
+    not_found_count: int
@@ -84,6 +84,28 @@ class CampaignResponse(BaseModel):
         from_attributes = True
 
 
+class CampaignSummary(BaseModel):
+    """Schema for a campaign in the approval queue (without generated email content)."""
+    id: str
+    advertiser_id: str
+    campaign_name: str
+    target_audience: Optional[str] = None
+    campaign_goal: Optional[str] = None
+    status: str
+    has_proof: bool = Field(..., description="Whether an email proof has been generated")
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class ApprovalQueueResponse(BaseModel):
+    """Schema for one page of the approval queue."""
+    items: List[CampaignSummary]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (null on the last page)")
+
+
 class CampaignWithAssets(CampaignResponse):
     """Schema for campaign response with linked assets."""
     campaign_assets: List[CampaignAssetResponse] = []
@@ -1,6 +1,6 @@
 """Pydantic schemas for metrics endpoints."""
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class UptimeMetricsResponse(BaseModel):
@@ -47,3 +47,62 @@ class ApprovalRateMetricsResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+
+class DeduplicationMetricsResponse(BaseModel):
+    """Schema for upload deduplication savings response."""
+    deduplicated_uploads: int = Field(..., description="Number of uploads that reused an existing S3 object")
+    bytes_saved: int = Field(..., description="Bytes not re-uploaded because of deduplication")
+    estimated_upload_seconds_saved: float = Field(..., description="Estimated upload time saved in seconds")
+    logical_storage_bytes: int = Field(..., description="Total size of all assets")
+    stored_bytes: int = Field(..., description="Total size of distinct S3 objects backing the assets")
+    
+    class Config:
+        from_attributes = True
+
+
+class PoolStatisticsResponse(BaseModel):
+    """Schema for one engine's connection pool statistics."""
+    engine: str = Field(..., description="Engine the pool belongs to (sync, async, or replica-N sync/async)")
+    pool_class: str = Field(..., description="SQLAlchemy pool class")
+    pool_size: Optional[int] = Field(None, description="Connections kept open in the pool")
+    max_overflow: Optional[int] = Field(None, description="Connections allowed beyond pool_size")
+    checked_out: Optional[int] = Field(None, description="Connections currently in use")
+    checked_in: Optional[int] = Field(None, description="Idle connections in the pool")
+    overflow: Optional[int] = Field(None, description="Overflow connections currently open")
+    checkouts: Optional[int] = Field(None, description="Connections checked out since startup")
+    timeouts: Optional[int] = Field(None, description="Checkouts that timed out waiting for a connection")
+    average_wait_ms: Optional[float] = Field(None, description="Average time to obtain a connection in milliseconds")
+    max_wait_ms: Optional[float] = Field(None, description="Longest time to obtain a connection in milliseconds")
+    healthy: Optional[bool] = Field(None, description="Whether the read replica receives reads (None for the primary)")
+    ejections: Optional[int] = Field(None, description="Times the read replica was ejected after a connection failure")
+
+
+class DatabasePoolMetricsResponse(BaseModel):
+    """Schema for database connection pool metrics response."""
+    pools: List[PoolStatisticsResponse] = Field(..., description="Pool statistics per engine")
+
+
+class AuthCacheMetricsResponse(BaseModel):
+    """Schema for authenticated user cache metrics response."""
+    hits: int = Field(..., description="Requests authenticated from the cache")
+    misses: int = Field(..., description="Requests that queried the users table")
+    hit_rate: float = Field(..., description="Hit percentage")
+    invalidations: int = Field(..., description="Users dropped after a change")
+    entries: int = Field(..., description="Users currently cached")
+    ttl_seconds: float = Field(..., description="Time a cached user is served before reloading")
+
+
+class BulkheadStatisticsResponse(BaseModel):
+    """Schema for one bulkhead thread pool's usage."""
+    name: str = Field(..., description="Dependency the bulkhead isolates (storage, openai or mjml)")
+    max_workers: int = Field(..., description="Threads in the bulkhead's pool")
+    max_queue: int = Field(..., description="Calls allowed to wait for a thread")
+    running: int = Field(..., description="Calls currently running")
+    queued: int = Field(..., description="Calls currently waiting for a thread")
+    rejected: int = Field(..., description="Calls rejected with 503 since startup because the queue was full")
+
+
+class BulkheadMetricsResponse(BaseModel):
+    """Schema for bulkhead thread pool metrics response."""
+    bulkheads: List[BulkheadStatisticsResponse] = Field(..., description="Usage per bulkhead (this process)")
@@ -13,6 +13,18 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class AuthenticatedUser(BaseModel):
+    """Identity of the user making a request, shared through the user cache."""
+    id: str
+    email: str
+    full_name: str
+    role: str
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
+
 class LoginRequest(BaseModel):
     """Login request schema."""
     email: EmailStr
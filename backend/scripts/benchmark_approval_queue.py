@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark the full approval queue load against keyset-paginated summary pages."""
+import argparse
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+
+from models.campaign import Campaign
+from crud.campaign import campaigns_by_status_statement, get_approval_queue_page
+from schemas.campaign import CampaignResponse, CampaignSummary
+from scripts.benchmark_support import create_users, temporary_database, timed
+
+# Serializers for the response bodies of the old and new endpoint
+full_queue_body = TypeAdapter(List[CampaignResponse])
+queue_page_body = TypeAdapter(List[CampaignSummary])
+
+# Stand-in for a compiled MJML proof (real proofs are 20-60 KB of inlined HTML)
+PROOF_HTML = "<html><body>" + "<table><tr><td>Campaign proof</td></tr></table>" * 600 + "</body></html>"
+
+
+def seed_campaigns(db, advertiser_id: str, count: int, proof_ratio: float) -> None:
+    """Insert count pending campaigns, spread over the past year."""
+    start = datetime.now(timezone.utc) - timedelta(days=365)
+    with_proof = int(1 / proof_ratio) if proof_ratio > 0 else 0
+    batch = []
+    for i in range(count):
+        created_at = start + timedelta(seconds=i * 300)
+        batch.append({
+            "id": str(uuid.uuid4()),
+            "advertiser_id": advertiser_id,
+            "campaign_name": f"Campaign {i}",
+            "target_audience": "Returning customers",
+            "campaign_goal": "Drive spring sale traffic",
+            "status": "pending_approval",
+            "generated_email_html": PROOF_HTML if with_proof and i % with_proof == 0 else None,
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+        if len(batch) == 5000:
+            db.execute(insert(Campaign), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Campaign), batch)
+    db.commit()
+
+
+def main():
+    """Run the benchmark against a temporary SQLite database."""
+    parser = argparse.ArgumentParser(description="Benchmark approval queue pagination")
+    parser.add_argument("--campaigns", type=int, default=100000, help="Pending campaigns (default: 100000)")
+    parser.add_argument("--page-size", type=int, default=50, help="Campaigns per page (default: 50)")
+    parser.add_argument("--proof-ratio", type=float, default=0.1, help="Share of campaigns with a generated proof (default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best is reported (default: 3)")
+    args = parser.parse_args()
+    
+    with temporary_database() as (_, db):
+        advertiser_id = create_users(db, 1)[0]
+        
+        print(f"Seeding {args.campaigns} pending campaigns...")
+        seed_campaigns(db, advertiser_id, args.campaigns, args.proof_ratio)
+        
+        # Cursors positioned halfway through and on the last page of the queue
+        cursors = []
+        cursor = None
+        while True:
+            _, cursor = get_approval_queue_page(db, args.page_size, cursor=cursor)
+            if cursor is None:
+                break
+            cursors.append(cursor)
+        deep_cursor = cursors[len(cursors) // 2] if cursors else None
+        last_cursor = cursors[-1] if cursors else None
+        
+        def full_queue():
+            # Previous endpoint: every pending campaign, generated HTML included
+            db.expunge_all()
+            campaigns = db.scalars(campaigns_by_status_statement("pending_approval")).all()
+            return full_queue_body.dump_json([CampaignResponse.model_validate(campaign) for campaign in campaigns])
+        
+        def response_size(payload):
+            return f"{len(payload) / 1024:.1f} KB"
+        
+        def page(cursor=None):
+            rows, _ = get_approval_queue_page(db, args.page_size, cursor=cursor)
+            return queue_page_body.dump_json([CampaignSummary.model_validate(row) for row in rows])
+        
+        print(f"campaigns={args.campaigns} page_size={args.page_size} proof_ratio={args.proof_ratio}")
+        timed("full queue (CampaignResponse)", full_queue, args.repeat, describe=response_size)
+        timed("first page (CampaignSummary)", page, args.repeat, describe=response_size)
+        timed("page at 50% depth", lambda: page(deep_cursor), args.repeat, describe=response_size)
+        timed("last page", lambda: page(last_cursor), args.repeat, describe=response_size)
+
+
+if __name__ == "__main__":
+    main()
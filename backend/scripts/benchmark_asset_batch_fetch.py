@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark loading campaign review assets one by one against the batch endpoint."""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from scripts.benchmark_support import (
+    QueryCounter, best_time, create_assets, create_users, temporary_database, use_temporary_environment
+)
+
+# Presigned URLs are signed by the local storage backend, no credentials needed
+use_temporary_environment("asset-batch-benchmark-")
+
+from dependencies import get_current_user
+from routers.asset import get_asset, get_assets_batch
+from schemas.asset import AssetBatchRequest, AssetBatchResponse, AssetResponse
+
+
+def fetch_one_by_one(db, user_id: str, asset_ids: list) -> int:
+    """Load assets the way the review screen does today: one request per asset."""
+    for asset_id in asset_ids:
+        user = get_current_user(user_id, db)
+        AssetResponse.model_validate(get_asset(asset_id, user, db)).model_dump()
+    return len(asset_ids)
+
+
+def fetch_batch(db, user_id: str, asset_ids: list) -> int:
+    """Load assets with one POST /api/assets/batch request."""
+    user = get_current_user(user_id, db)
+    response = get_assets_batch(AssetBatchRequest(asset_ids=asset_ids), user, db)
+    AssetBatchResponse.model_validate(response).model_dump()
+    return 1
+
+
+def main():
+    """Run the benchmark against a temporary SQLite database."""
+    parser = argparse.ArgumentParser(description="Benchmark batch asset fetch")
+    parser.add_argument("--assets", type=int, default=10000, help="Assets owned by the user (default: 10000)")
+    parser.add_argument(
+        "--review-sizes",
+        type=int,
+        nargs="+",
+        default=[10, 50, 200, 500],
+        help="Assets loaded per review screen (default: 10 50 200 500)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best is reported (default: 3)")
+    args = parser.parse_args()
+    
+    with temporary_database() as (engine, db):
+        user_id = create_users(db, 1)[0]
+        asset_ids = create_assets(db, user_id, args.assets)
+        counter = QueryCounter(engine)
+        
+        print(f"{'assets':>6}  {'flow':<12} {'requests':>8} {'queries':>8} {'time':>10}")
+        for size in args.review_sizes:
+            review_ids = asset_ids[:: max(1, args.assets // size)][:size]
+            for label, flow in [("one by one", fetch_one_by_one), ("batch", fetch_batch)]:
+                def run():
+                    db.expunge_all()
+                    counter.count = 0
+                    return flow(db, user_id, review_ids)
+                
+                best, requests = best_time(run, args.repeat)
+                print(f"{size:>6}  {label:<12} {requests:>8} {counter.count:>8} {best * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
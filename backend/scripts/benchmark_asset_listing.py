@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark the full asset listing against keyset-paginated pages."""
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from scripts.benchmark_support import (
+    asset_row, create_users, temporary_database, timed, use_temporary_environment
+)
+
+# Presigned URLs are signed by the local storage backend, no credentials needed
+use_temporary_environment("asset-listing-benchmark-")
+
+from sqlalchemy import insert
+
+from models.asset import Asset
+from crud.asset import get_assets_page, count_assets
+from routers.asset import sign_asset_urls
+from schemas.asset import AssetResponse
+
+
+def seed_assets(db, user_id: str, count: int) -> None:
+    """Insert count assets for one user, spread over the past year."""
+    start = datetime.now(timezone.utc) - timedelta(days=365)
+    batch = []
+    for i in range(count):
+        batch.append(asset_row(
+            user_id,
+            f"asset-{i}.png",
+            file_type="image/png" if i % 4 else "text/plain",
+            category="image" if i % 4 else "copy",
+            uploaded_at=start + timedelta(seconds=i * 300),
+        ))
+        if len(batch) == 5000:
+            db.execute(insert(Asset), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Asset), batch)
+    db.commit()
+
+
+def serialize(assets: list) -> list:
+    """Serialize assets the way the assets router does."""
+    return [asset.model_dump() for asset in sign_asset_urls([AssetResponse.model_validate(asset) for asset in assets])]
+
+
+def main():
+    """Run the benchmark against a temporary SQLite database."""
+    parser = argparse.ArgumentParser(description="Benchmark asset listing pagination")
+    parser.add_argument("--assets", type=int, default=100000, help="Assets owned by the user (default: 100000)")
+    parser.add_argument("--page-size", type=int, default=50, help="Assets per page (default: 50)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best is reported (default: 3)")
+    args = parser.parse_args()
+    
+    with temporary_database() as (_, db):
+        user_id = create_users(db, 1)[0]
+        
+        print(f"Seeding {args.assets} assets...")
+        seed_assets(db, user_id, args.assets)
+        
+        # Cursor positioned halfway through the listing
+        deep_cursor = None
+        for _ in range(args.assets // (2 * args.page_size)):
+            _, deep_cursor = get_assets_page(db, user_id, args.page_size, cursor=deep_cursor)
+        
+        def full_listing():
+            db.expunge_all()
+            serialize(db.query(Asset).filter(Asset.user_id == user_id).all())
+        
+        def page(cursor=None, **filters):
+            db.expunge_all()
+            assets, _ = get_assets_page(db, user_id, args.page_size, cursor=cursor, **filters)
+            serialize(assets)
+        
+        print(f"assets={args.assets} page_size={args.page_size}")
+        timed("full listing (.all())", full_listing, args.repeat)
+        timed("first page", page, args.repeat)
+        timed("page at 50% depth", lambda: page(deep_cursor), args.repeat)
+        timed("first page, category=copy", lambda: page(category="copy"), args.repeat)
+        timed(
+            "first page, last 30 days",
+            lambda: page(uploaded_after=datetime.now(timezone.utc) - timedelta(days=30)),
+            args.repeat
+        )
+        timed("total count", lambda: count_assets(db, user_id), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark filename search against a LIKE scan at a million assets."""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import insert
+
+from models.asset import Asset
+from crud.asset import search_assets
+from scripts.benchmark_support import asset_row, create_users, temporary_database, timed
+
+FILENAME_WORDS = [
+    "summer", "winter", "spring", "autumn", "sale", "launch", "hero", "banner", "logo", "dark",
+    "light", "header", "footer", "promo", "newsletter", "product", "team", "offer", "holiday",
+    "black", "friday", "cyber", "monday", "welcome", "onboarding", "retargeting", "final", "draft",
+]
+FILENAME_EXTENSIONS = ["png", "jpg", "gif", "svg", "txt", "pdf"]
+
+
+def random_filename(rng: random.Random) -> str:
+    """Build a filename like "Summer_Sale-hero_v12.png"."""
+    words = rng.sample(FILENAME_WORDS, rng.randint(2, 4))
+    separator = rng.choice(["_", "-", " "])
+    return f"{separator.join(words).title()}_v{rng.randint(1, 99)}.{rng.choice(FILENAME_EXTENSIONS)}"
+
+
+def seed_assets(db, user_ids: list, assets_per_user: int, rng: random.Random) -> None:
+    """Insert assets_per_user assets for every user (search triggers fire on insert)."""
+    batch = []
+    for user_id in user_ids:
+        for _ in range(assets_per_user):
+            batch.append(asset_row(user_id, random_filename(rng)))
+            if len(batch) == 10000:
+                db.execute(insert(Asset), batch)
+                batch = []
+    if batch:
+        db.execute(insert(Asset), batch)
+    db.commit()
+
+
+def main():
+    """Run the benchmark against a temporary SQLite database."""
+    parser = argparse.ArgumentParser(description="Benchmark asset filename search")
+    parser.add_argument("--users", type=int, default=900, help="Number of typical users (default: 900)")
+    parser.add_argument("--assets-per-user", type=int, default=1000, help="Assets per user (default: 1000)")
+    parser.add_argument(
+        "--heavy-user-assets",
+        type=int,
+        default=100000,
+        help="Assets owned by one additional heavy user (default: 100000)"
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Results per search (default: 20)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, best is reported (default: 5)")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    
+    with temporary_database() as (_, db):
+        user_ids = create_users(db, args.users + 1)
+        heavy_user_id = user_ids.pop()
+        
+        total = args.users * args.assets_per_user + args.heavy_user_assets
+        print(f"Seeding {total} assets...")
+        start = time.perf_counter()
+        seed_assets(db, user_ids, args.assets_per_user, rng)
+        seed_assets(db, [heavy_user_id], args.heavy_user_assets, rng)
+        print(f"Seeded in {time.perf_counter() - start:.1f}s ({total / (time.perf_counter() - start):.0f} rows/s with triggers)")
+        
+        def like_scan(user_id, *terms):
+            db.expunge_all()
+            return db.query(Asset).filter(
+                Asset.user_id == user_id,
+                *[Asset.filename.ilike(f"%{term}%") for term in terms]
+            ).order_by(Asset.uploaded_at.desc(), Asset.id.desc()).limit(args.limit).all()
+        
+        def search(user_id, query):
+            db.expunge_all()
+            return search_assets(db, user_id, query, args.limit)
+        
+        def measure(label, fn):
+            timed(label, fn, args.repeat, describe=lambda result: f"({len(result)} results)")
+        
+        print(f"assets={total} users={args.users + 1} limit={args.limit}")
+        for label, user_id in [
+            (f"{args.assets_per_user} assets", user_ids[len(user_ids) // 2]),
+            (f"{args.heavy_user_assets} assets", heavy_user_id),
+        ]:
+            print(f"user with {label}:")
+            measure("  LIKE scan '%hero%'", lambda: like_scan(user_id, "hero"))
+            measure("  LIKE scan '%cyber%' '%final%' '%v42%'", lambda: like_scan(user_id, "cyber", "final", "v42"))
+            measure("  LIKE scan, no match '%zebra%'", lambda: like_scan(user_id, "zebra"))
+            measure("  search 'hero'", lambda: search(user_id, "hero"))
+            measure("  search prefix 'he'", lambda: search(user_id, "he"))
+            measure("  search 'summer sale hero'", lambda: search(user_id, "summer sale hero"))
+            measure("  search 'cyber final v42'", lambda: search(user_id, "cyber final v42"))
+            measure("  search, no match 'zebra'", lambda: search(user_id, "zebra"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark request throughput of sync (thread pool) and async database sessions at high concurrency."""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+import anyio.to_thread
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from config import settings
+from database import Base, async_database_url
+import models  # noqa: F401 - registers all tables on Base.metadata
+from models.campaign import Campaign
+from models.user import User
+from crud.campaign import campaigns_by_user_statement, get_campaigns_by_user_async
+from crud.metrics import get_queue_depth, get_queue_depth_async
+from schemas.campaign import CampaignResponse
+
+
+def seed(engine, advertisers: int, campaigns_per_advertiser: int) -> list:
+    """Create advertisers with campaigns in mixed statuses and return their ids."""
+    db = sessionmaker(bind=engine)()
+    user_ids = [str(uuid.uuid4()) for _ in range(advertisers)]
+    db.execute(insert(User), [
+        {
+            "id": user_id,
+            "email": f"advertiser-{i}@example.com",
+            "password": "benchmark",
+            "full_name": f"Advertiser {i}",
+            "role": "advertiser",
+        }
+        for i, user_id in enumerate(user_ids)
+    ])
+    statuses = ["draft", "pending_approval", "approved", "rejected"]
+    db.execute(insert(Campaign), [
+        {
+            "id": str(uuid.uuid4()),
+            "advertiser_id": user_id,
+            "campaign_name": f"Campaign {j}",
+            "status": statuses[j % len(statuses)],
+        }
+        for user_id in user_ids
+        for j in range(campaigns_per_advertiser)
+    ])
+    db.commit()
+    db.close()
+    return user_ids
+
+
+def sync_request(session_factory, user_id: str) -> int:
+    """One GET /api/campaigns as a sync handler runs it: auth, list, serialize."""
+    db = session_factory()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        campaigns = db.scalars(campaigns_by_user_statement(user.id)).all()
+        get_queue_depth(db)
+        return len([CampaignResponse.model_validate(c).model_dump() for c in campaigns])
+    finally:
+        db.close()
+
+
+async def async_request(session_factory, user_id: str) -> int:
+    """The same request on an async session, awaited on the event loop."""
+    async with session_factory() as db:
+        user = await db.get(User, user_id)
+        campaigns = await get_campaigns_by_user_async(db, user.id)
+        await get_queue_depth_async(db)
+        return len([CampaignResponse.model_validate(c).model_dump() for c in campaigns])
+
+
+async def run_load(handler, user_ids: list, concurrency: int, total: int) -> dict:
+    """Issue total requests with at most concurrency in flight; return throughput and latency."""
+    latencies = []
+    next_request = 0
+    
+    async def client():
+        nonlocal next_request
+        while next_request < total:
+            user_id = user_ids[next_request % len(user_ids)]
+            next_request += 1
+            start = time.perf_counter()
+            await handler(user_id)
+            latencies.append(time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "throughput": total / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int((len(latencies) - 1) * 0.99)],
+    }
+
+
+async def benchmark(database_url: str, user_ids: list, concurrency_levels: list, total: int) -> None:
+    """Run both modes at each concurrency level against fresh engines."""
+    # Sync handlers run in the request thread pool, as FastAPI schedules them
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.REQUEST_THREAD_POOL_SIZE
+    sync_engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+    )
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    async_engine = create_async_engine(async_database_url(database_url))
+    AsyncSessionFactory = async_sessionmaker(
+        bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    
+    async def sync_handler(user_id):
+        return await run_in_threadpool(sync_request, SyncSession, user_id)
+    
+    async def async_handler(user_id):
+        return await async_request(AsyncSessionFactory, user_id)
+    
+    # Warm up both pools
+    await run_load(sync_handler, user_ids, 10, 50)
+    await run_load(async_handler, user_ids, 10, 50)
+    
+    print(f"{'clients':>7}  {'mode':<20} {'req/s':>8} {'p50':>9} {'p99':>9}")
+    for concurrency in concurrency_levels:
+        for label, handler in [
+            (f"sync ({settings.REQUEST_THREAD_POOL_SIZE} threads)", sync_handler),
+            ("async", async_handler),
+        ]:
+            result = await run_load(handler, user_ids, concurrency, total)
+            print(
+                f"{concurrency:>7}  {label:<20} {result['throughput']:>8.0f} "
+                f"{result['p50'] * 1000:>7.1f}ms {result['p99'] * 1000:>7.1f}ms"
+            )
+    
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
+def main():
+    """Seed a database and compare sync and async session throughput."""
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async database sessions")
+    parser.add_argument(
+        "--database-url",
+        help="Sync URL of an empty database to seed, e.g. postgresql://... (default: temporary SQLite file)"
+    )
+    parser.add_argument("--advertisers", type=int, default=200, help="Advertisers to seed (default: 200)")
+    parser.add_argument("--campaigns", type=int, default=20, help="Campaigns per advertiser (default: 20)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[10, 100, 500, 1000],
+        help="Concurrent clients (default: 10 100 500 1000)"
+    )
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per measurement (default: 5000)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = args.database_url or f"sqlite:///{tmp_dir}/benchmark.db"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+        user_ids = seed(engine, args.advertisers, args.campaigns)
+        engine.dispose()
+        
+        print(f"{args.advertisers} advertisers x {args.campaigns} campaigns on {engine.url.get_backend_name()}")
+        asyncio.run(benchmark(database_url, user_ids, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark request authentication with and without the user cache."""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from scripts.benchmark_support import QueryCounter, create_users, use_temporary_environment
+
+# The API runs against a throwaway database and local storage
+use_temporary_environment("auth-cache-benchmark-")
+
+from fastapi.testclient import TestClient
+
+import main
+from database import Base, engine, async_engine, SessionLocal
+from dependencies import get_current_user
+from services.user_cache import user_cache
+
+
+def seed(users: int) -> list:
+    """Create advertisers and return their ids."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    user_ids = create_users(db, users)
+    db.close()
+    return user_ids
+
+
+def set_cache(enabled: bool, ttl: float) -> None:
+    """Enable or disable the user cache and reset its counters."""
+    user_cache.clear()
+    user_cache.ttl = ttl if enabled else 0
+    user_cache.hits = user_cache.misses = user_cache.invalidations = 0
+
+
+def time_dependency(user_ids: list, calls: int) -> list:
+    """Call get_current_user directly, one session per call as in a request."""
+    latencies = []
+    for i in range(calls):
+        db = SessionLocal()
+        start = time.perf_counter()
+        get_current_user(user_ids[i % len(user_ids)], db)
+        latencies.append(time.perf_counter() - start)
+        db.close()
+    return latencies
+
+
+def time_requests(client: TestClient, path: str, user_ids: list, requests: int) -> list:
+    """Send requests to one endpoint, rotating through the users."""
+    latencies = []
+    for i in range(requests):
+        start = time.perf_counter()
+        response = client.get(path, headers={"X-User-ID": user_ids[i % len(user_ids)]})
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return latencies
+
+
+def report(label: str, latencies: list, queries: int) -> None:
+    """Print latency and SQL statements per call."""
+    print(
+        f"{label:<36} p50={statistics.median(latencies) * 1000:7.3f}ms "
+        f"mean={statistics.mean(latencies) * 1000:7.3f}ms "
+        f"queries/call={queries / len(latencies):5.2f} "
+        f"hit_rate={user_cache.stats()['hit_rate']:6.2f}%"
+    )
+
+
+def main_benchmark():
+    """Compare authentication cost with the cache disabled and enabled."""
+    parser = argparse.ArgumentParser(description="Benchmark the authenticated user cache")
+    parser.add_argument("--users", type=int, default=100, help="Distinct users sending requests (default: 100)")
+    parser.add_argument("--calls", type=int, default=20000, help="Direct dependency calls (default: 20000)")
+    parser.add_argument("--requests", type=int, default=2000, help="HTTP requests per endpoint (default: 2000)")
+    parser.add_argument("--ttl", type=float, default=60.0, help="Cache TTL in seconds (default: 60)")
+    args = parser.parse_args()
+    
+    user_ids = seed(args.users)
+    counter = QueryCounter(engine, async_engine.sync_engine)
+    
+    print(f"{args.users} users, cache ttl={args.ttl}s")
+    for enabled in (False, True):
+        set_cache(enabled, args.ttl)
+        counter.count = 0
+        latencies = time_dependency(user_ids, args.calls)
+        report(f"get_current_user (cache {'on' if enabled else 'off'})", latencies, counter.count)
+    
+    with TestClient(main.app) as client:
+        # Endpoints running a single query of their own after authentication
+        for path in ["/api/assets?limit=1", "/api/campaigns"]:
+            for enabled in (False, True):
+                set_cache(enabled, args.ttl)
+                time_requests(client, path, user_ids, len(user_ids))  # Warm up
+                counter.count = 0
+                latencies = time_requests(client, path, user_ids, args.requests)
+                report(f"GET {path} (cache {'on' if enabled else 'off'})", latencies, counter.count)
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark bulk inserts of campaign-asset links and seed users against per-row ORM inserts."""
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import delete, func, select
+
+from models.campaign import Campaign
+from models.campaign_asset import CampaignAsset
+from models.user import User
+from crud.campaign import link_assets_to_campaign
+from seed_database import insert_users
+from scripts.benchmark_support import create_assets, create_users, temporary_database, timed
+
+
+def link_assets_one_by_one(db, campaign_id: str, asset_ids: list) -> list:
+    """link_assets_to_campaign before the bulk insert: one ORM object per asset, then a flush."""
+    campaign_assets = [
+        CampaignAsset(campaign_id=campaign_id, asset_id=asset_id, display_order=idx)
+        for idx, asset_id in enumerate(asset_ids)
+    ]
+    db.add_all(campaign_assets)
+    db.flush()
+    return campaign_assets
+
+
+def insert_users_one_by_one(db, users_data: list) -> int:
+    """seed_database.insert_users before the bulk insert: a SELECT and an ORM add per user."""
+    inserted_count = 0
+    for user_data in users_data:
+        if db.query(User).filter(User.email == user_data["email"]).first():
+            continue
+        db.add(User(**user_data))
+        inserted_count += 1
+    db.commit()
+    return inserted_count
+
+
+def main():
+    """Run the benchmark against a temporary SQLite database."""
+    parser = argparse.ArgumentParser(description="Benchmark bulk inserts")
+    parser.add_argument("--assets", type=int, default=500, help="Assets linked to one campaign (default: 500)")
+    parser.add_argument("--users", type=int, default=100000, help="Users in the seed file (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per link measurement, best is reported (default: 3)")
+    args = parser.parse_args()
+    
+    with temporary_database() as (_, db):
+        advertiser_id = create_users(db, 1, prefix="benchmark")[0]
+        asset_ids = create_assets(db, advertiser_id, args.assets)
+        campaign = Campaign(advertiser_id=advertiser_id, campaign_name="Benchmark")
+        db.add(campaign)
+        db.commit()
+        campaign_id = campaign.id
+        
+        def link(link_assets):
+            db.execute(delete(CampaignAsset))
+            db.expunge_all()
+            link_assets(db, campaign_id, asset_ids)
+            db.commit()
+        
+        print(f"Linking {args.assets} assets to a campaign")
+        timed("per-object flush", lambda: link(link_assets_one_by_one), args.repeat)
+        timed("bulk INSERT ... RETURNING", lambda: link(link_assets_to_campaign), args.repeat)
+        
+        users_data = [
+            {"email": f"seed-{i}@example.com", "password": "password123", "full_name": f"Seed User {i}", "role": "advertiser"}
+            for i in range(args.users)
+        ]
+        
+        def seed(insert_fn):
+            # The seed script prints a line per user
+            with contextlib.redirect_stdout(io.StringIO()):
+                insert_fn(db, users_data)
+        
+        def seed_empty(insert_fn):
+            db.execute(delete(User).where(User.email.like("seed-%")))
+            db.commit()
+            db.expunge_all()
+            seed(insert_fn)
+        
+        print(f"Seeding {args.users} users into an empty table, then again with all present")
+        timed("per-user SELECT + add", lambda: seed_empty(insert_users_one_by_one), 1)
+        timed("per-user SELECT + add, all present", lambda: seed(insert_users_one_by_one), 1)
+        timed("set-based check + bulk INSERT", lambda: seed_empty(insert_users), 1)
+        timed("set-based check, all present", lambda: seed(insert_users), 1)
+        print(f"users seeded: {db.scalar(select(func.count()).select_from(User)) - 1}")
+
+
+if __name__ == "__main__":
+    main()
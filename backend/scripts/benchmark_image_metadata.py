@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark header-only image metadata extraction against growing file sizes."""
+import argparse
+import io
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from services.image_metadata_service import extract_image_metadata
+
+
+class CountingReader(io.RawIOBase):
+    """File wrapper that counts the bytes actually read."""
+    
+    def __init__(self, file_obj):
+        self._file = file_obj
+        self.bytes_read = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def read(self, size=-1):
+        data = self._file.read(size)
+        self.bytes_read += len(data)
+        return data
+    
+    def seek(self, offset, whence=0):
+        return self._file.seek(offset, whence)
+    
+    def tell(self):
+        return self._file.tell()
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk with length and CRC."""
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def write_png(path: Path, payload_bytes: int) -> None:
+    """Write a PNG with a large IDAT payload (contents need not decode)."""
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", 4000, 3000, 8, 6, 0, 0, 0)))
+        f.write(struct.pack(">I", payload_bytes) + b"IDAT")
+        _write_padding(f, payload_bytes)
+        f.write(b"\x00\x00\x00\x00")
+        f.write(_png_chunk(b"IEND", b""))
+
+
+def write_jpeg(path: Path, payload_bytes: int) -> None:
+    """Write a JPEG with an EXIF-sized APP1 segment and a large scan payload."""
+    with open(path, "wb") as f:
+        f.write(b"\xff\xd8")
+        app1 = b"Exif\x00\x00" + b"\x00" * 60000
+        f.write(b"\xff\xe1" + struct.pack(">H", len(app1) + 2) + app1)
+        f.write(b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, 3000, 4000, 3) + b"\x00" * 9)
+        f.write(b"\xff\xda" + struct.pack(">H", 2))
+        _write_padding(f, payload_bytes)
+        f.write(b"\xff\xd9")
+
+
+def _write_padding(f, size: int) -> None:
+    """Write size zero bytes in 1MB blocks."""
+    block = b"\x00" * (1024 * 1024)
+    remaining = size
+    while remaining > 0:
+        chunk = block[:min(remaining, len(block))]
+        f.write(chunk)
+        remaining -= len(chunk)
+
+
+def main():
+    """Run the benchmark and print bytes read and time per file size."""
+    parser = argparse.ArgumentParser(description="Benchmark image header parsing")
+    parser.add_argument(
+        "--sizes-mb",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Payload sizes in MB to benchmark (default: 1 10 100)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1000,
+        help="Extractions per file (default: 1000)",
+    )
+    args = parser.parse_args()
+    
+    writers = {"png": write_png, "jpeg": write_jpeg}
+    
+    print(f"{'format':<6} {'file size':>12} {'bytes read':>12} {'avg time':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes_mb:
+            for fmt, writer in writers.items():
+                path = Path(tmp_dir) / f"bench_{size_mb}.{fmt}"
+                writer(path, size_mb * 1024 * 1024)
+                
+                with open(path, "rb") as f:
+                    reader = CountingReader(f)
+                    metadata = extract_image_metadata(reader, path.name)
+                    bytes_read = reader.bytes_read
+                    
+                    start = time.perf_counter()
+                    for _ in range(args.iterations):
+                        extract_image_metadata(f, path.name)
+                    avg_us = (time.perf_counter() - start) / args.iterations * 1e6
+                
+                assert metadata and metadata["width"] == 4000, f"Failed to parse {fmt}"
+                print(f"{fmt:<6} {path.stat().st_size:>12,} {bytes_read:>12,} {avg_us:>10.1f}us")
+                path.unlink()
+
+
+if __name__ == "__main__":
+    main()
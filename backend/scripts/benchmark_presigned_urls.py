@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark listing assets with cold and warm pre-signed URL caches."""
+import argparse
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from routers.asset import sign_asset_urls
+from schemas.asset import AssetResponse
+from services.s3_service import s3_service
+
+
+def build_assets(count: int) -> list:
+    """Build asset dictionaries shaped like rows returned by GET /api/assets."""
+    user_id = str(uuid.uuid4())
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "filename": f"asset-{i}.png",
+            "s3_key": f"users/{user_id}/{uuid.uuid4().hex}/asset-{i}.png",
+            "file_type": "image/png",
+            "file_size_bytes": 1024,
+            "category": "image",
+            "uploaded_at": datetime.now(),
+        }
+        for i in range(count)
+    ]
+
+
+def list_assets(assets: list) -> list:
+    """Serialize a listing the way the assets router does."""
+    return [asset.model_dump() for asset in sign_asset_urls([AssetResponse.model_validate(asset) for asset in assets])]
+
+
+def main():
+    """Run the benchmark and print listing times."""
+    parser = argparse.ArgumentParser(description="Benchmark pre-signed URL caching")
+    parser.add_argument("--assets", type=int, default=5000, help="Assets per listing (default: 5000)")
+    args = parser.parse_args()
+    
+    assets = build_assets(args.assets)
+    
+    start = time.perf_counter()
+    for asset in assets:
+        s3_service.generate_presigned_url(asset["s3_key"])
+    uncached = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    list_assets(assets)
+    cold = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    list_assets(assets)
+    warm = time.perf_counter() - start
+    
+    cache = s3_service.url_cache
+    print(f"assets={args.assets}")
+    print(f"sign every URL (no cache): {uncached * 1000:.1f}ms")
+    print(f"listing, cold cache:       {cold * 1000:.1f}ms")
+    print(f"listing, warm cache:       {warm * 1000:.1f}ms")
+    print(f"cache hits={cache.hits} misses={cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent approvals: read-check-write against compare-and-set transitions."""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from scripts.benchmark_support import create_users, use_temporary_environment
+
+# The handlers run against a throwaway database unless DATABASE_URL is set
+use_temporary_environment("status-transition-benchmark-", database_url=os.environ.get("DATABASE_URL"))
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, insert, select, update
+
+from database import Base, engine, async_engine, AsyncSessionLocal, SessionLocal
+import models  # noqa: F401 - registers all tables on Base.metadata
+from models.campaign import Campaign
+from models.performance_metric import PerformanceMetric
+from crud.metrics import record_metric_async
+from routers.campaign import approve_campaign
+from schemas.user import AuthenticatedUser
+
+# Stand-in for a compiled MJML proof, loaded by the read-check-write handler
+PROOF_HTML = "<html><body>" + "<table><tr><td>Campaign proof</td></tr></table>" * 600 + "</body></html>"
+
+
+async def read_check_write_approve(campaign_id: str, current_user: AuthenticatedUser, db) -> None:
+    """The approval handler before compare-and-set: load the row, check in Python, write back."""
+    campaign = await db.scalar(select(Campaign).where(Campaign.id == campaign_id))
+    if campaign.status != "pending_approval":
+        raise HTTPException(status_code=409, detail="Campaign is not pending approval")
+    campaign.status = "approved"
+    campaign.reviewed_by = current_user.id
+    campaign.reviewed_at = datetime.now()
+    await record_metric_async(
+        db=db,
+        metric_type="campaign_approval",
+        metric_value=1.0,
+        metadata={"campaign_id": campaign_id, "campaign_name": campaign.campaign_name, "reviewed_by": current_user.id}
+    )
+    await db.commit()
+
+
+async def compare_and_set_approve(campaign_id: str, current_user: AuthenticatedUser, db) -> None:
+    """The approval route handler (conditional UPDATE ... RETURNING)."""
+    await approve_campaign(campaign_id, current_user=current_user, db=db)
+
+
+def seed(campaigns: int, managers: int) -> tuple:
+    """Create an advertiser, campaign managers and pending campaigns; return their ids."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    advertiser_id = create_users(db, 1)[0]
+    manager_ids = create_users(db, managers, role="campaign_manager", prefix="manager")
+    campaign_ids = db.scalars(insert(Campaign).returning(Campaign.id, sort_by_parameter_order=True), [
+        {
+            "advertiser_id": advertiser_id,
+            "campaign_name": f"Campaign {i}",
+            "status": "pending_approval",
+            "generated_email_html": PROOF_HTML,
+            "generated_email_mjml": "<mjml></mjml>",
+        }
+        for i in range(campaigns)
+    ]).all()
+    db.commit()
+    db.close()
+    return campaign_ids, manager_ids
+
+
+def reset() -> None:
+    """Put every campaign back in the queue and drop recorded approvals."""
+    with engine.begin() as conn:
+        conn.execute(update(Campaign).values(status="pending_approval", reviewed_by=None, reviewed_at=None))
+        conn.execute(delete(PerformanceMetric))
+
+
+async def reviewer(approve, manager_id: str, campaign_ids: list, results: dict) -> None:
+    """One manager working through their campaigns, in their own order."""
+    current_user = AuthenticatedUser(id=manager_id, email="", full_name="", role="campaign_manager")
+    for campaign_id in random.sample(campaign_ids, len(campaign_ids)):
+        async with AsyncSessionLocal() as db:
+            try:
+                await approve(campaign_id, current_user, db)
+                results["approved"] += 1
+            except HTTPException as e:
+                results[e.status_code] = results.get(e.status_code, 0) + 1
+
+
+async def run(label: str, approve, assignments: dict) -> None:
+    """Let the managers approve their assigned campaigns concurrently and check the outcome."""
+    reset()
+    results = {"approved": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        reviewer(approve, manager_id, campaign_ids, results) for manager_id, campaign_ids in assignments.items()
+    ))
+    elapsed = time.perf_counter() - start
+    
+    with engine.connect() as conn:
+        approved = conn.scalar(select(func.count()).select_from(Campaign).where(Campaign.status == "approved"))
+        metrics = conn.scalar(select(func.count()).select_from(PerformanceMetric))
+    attempts = sum(len(campaign_ids) for campaign_ids in assignments.values())
+    # Every approval after the first one of a campaign overwrote another manager's review
+    lost_updates = results["approved"] - approved
+    print(
+        f"{label:<32} {attempts / elapsed:8.1f} attempts/s  succeeded={results['approved']:<5} "
+        f"conflicts={results.get(409, 0):<5} approved_campaigns={approved:<5} "
+        f"approval_metrics={metrics:<5} lost_updates={lost_updates}"
+    )
+
+
+async def main_benchmark():
+    """Race several managers through the same queue with each approval strategy."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent campaign approvals")
+    parser.add_argument("--campaigns", type=int, default=500, help="Pending campaigns (default: 500)")
+    parser.add_argument("--managers", type=int, default=8, help="Managers approving concurrently (default: 8)")
+    args = parser.parse_args()
+    
+    campaign_ids, manager_ids = seed(args.campaigns, args.managers)
+    print(f"{args.campaigns} pending campaigns, {args.managers} concurrent managers")
+    scenarios = {
+        # Each campaign is reviewed by one manager
+        "disjoint": {
+            manager_id: campaign_ids[i::len(manager_ids)] for i, manager_id in enumerate(manager_ids)
+        },
+        # Every manager reviews every campaign
+        "contended": {manager_id: campaign_ids for manager_id in manager_ids},
+    }
+    for scenario, assignments in scenarios.items():
+        await run(f"{scenario}, read-check-write", read_check_write_approve, assignments)
+        await run(f"{scenario}, compare-and-set", compare_and_set_approve, assignments)
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main_benchmark())
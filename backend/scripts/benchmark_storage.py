@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark upload and download throughput of the storage backends."""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from config import settings
+from services.local_storage_backend import LocalStorageBackend
+from services.storage_backend import StorageBackend, create_storage_backend
+
+
+def run_backend(backend: StorageBackend, files: int, size_mb: int, concurrency: int) -> None:
+    """Upload and download files concurrently and print throughput."""
+    block = os.urandom(1024 * 1024)
+    uploads = []
+    for _ in range(files):
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        for _ in range(size_mb):
+            spooled.write(block)
+        spooled.seek(0)
+        uploads.append(spooled)
+    
+    prefix = f"benchmark/{uuid.uuid4().hex}/"
+    keys = [f"{prefix}file-{index}.bin" for index in range(files)]
+    total_mb = files * size_mb
+    
+    def upload(index: int) -> None:
+        backend.put_stream(keys[index], uploads[index], "application/octet-stream", size_bytes=size_mb * 1024 * 1024)
+    
+    def download(key: str) -> int:
+        return sum(len(chunk) for chunk in backend.iter_chunks(key))
+    
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(upload, range(files)))
+        upload_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            downloaded = sum(executor.map(download, keys))
+        download_time = time.perf_counter() - start
+        
+        assert downloaded == total_mb * 1024 * 1024, "Downloaded size does not match uploaded size"
+        print(
+            f"{backend.name:<6} files={files} size={size_mb}MB concurrency={concurrency} "
+            f"upload={total_mb / upload_time:.1f}MB/s download={total_mb / download_time:.1f}MB/s"
+        )
+    finally:
+        backend.delete_many(keys)
+
+
+def main():
+    """Benchmark the selected storage backends."""
+    parser = argparse.ArgumentParser(description="Benchmark storage backend throughput")
+    parser.add_argument(
+        "--backend",
+        choices=["local", "s3", "all"],
+        default="local",
+        help="Backend to benchmark; s3 needs credentials or AWS_S3_ENDPOINT_URL (default: local)",
+    )
+    parser.add_argument("--files", type=int, default=20, help="Number of files (default: 20)")
+    parser.add_argument("--size-mb", type=int, default=10, help="Size of each file in MB (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent transfers (default: 8)")
+    parser.add_argument(
+        "--root",
+        type=str,
+        default=None,
+        help="Directory for the local backend (default: a temporary directory)",
+    )
+    args = parser.parse_args()
+    
+    backend_names = ["local", "s3"] if args.backend == "all" else [args.backend]
+    
+    for backend_name in backend_names:
+        if backend_name == "local":
+            with tempfile.TemporaryDirectory() as tmp_root:
+                backend = LocalStorageBackend(
+                    root=args.root or tmp_root,
+                    base_url=settings.LOCAL_STORAGE_BASE_URL,
+                    signing_key=settings.LOCAL_STORAGE_SIGNING_KEY
+                )
+                run_backend(backend, args.files, args.size_mb, args.concurrency)
+        else:
+            run_backend(create_storage_backend(backend_name), args.files, args.size_mb, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
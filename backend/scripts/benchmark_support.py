@@ -0,0 +1,190 @@
+"""Shared setup for the benchmark, demo and load test scripts (and the test suite)."""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+
+def use_temporary_environment(prefix: str, database_url: Optional[str] = None) -> str:
+    """
+    Point the application at a throwaway SQLite database and local storage.
+    
+    Must be called before importing application modules: the engines and the
+    storage backend are created from settings at import time.
+    
+    Args:
+        prefix: Prefix of the temporary directory name
+        database_url: Database to use instead of a temporary SQLite file
+    
+    Returns:
+        Path of the temporary directory holding database.db and the storage root
+    """
+    tmp_dir = tempfile.mkdtemp(prefix=prefix)
+    os.environ["DATABASE_URL"] = database_url or f"sqlite:///{tmp_dir}/database.db"
+    os.environ["STORAGE_BACKEND"] = "local"
+    os.environ["LOCAL_STORAGE_ROOT"] = f"{tmp_dir}/storage"
+    return tmp_dir
+
+
+@contextmanager
+def temporary_database() -> Iterator[Tuple[Any, Any]]:
+    """
+    Create a SQLite database from the models in a temporary directory.
+    
+    Yields:
+        Tuple of (engine, session); both are closed on exit
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    
+    from database import Base
+    import models  # noqa: F401 - registers all tables on Base.metadata
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{tmp_dir}/benchmark.db")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        try:
+            yield engine, db
+        finally:
+            db.close()
+            engine.dispose()
+
+
+def create_users(db, count: int, role: str = "advertiser", prefix: str = "user") -> List[str]:
+    """
+    Insert users with one bulk INSERT and commit.
+    
+    Args:
+        db: Database session
+        count: Number of users
+        role: Role of every user
+        prefix: Prefix of the generated emails and names
+    
+    Returns:
+        IDs of the created users, in creation order
+    """
+    from sqlalchemy import insert
+    
+    from models.user import User
+    
+    user_ids = db.scalars(
+        insert(User).returning(User.id, sort_by_parameter_order=True),
+        [
+            {
+                "email": f"{prefix}-{i}@example.com",
+                "password": "benchmark",
+                "full_name": f"{prefix.title()} {i}",
+                "role": role,
+            }
+            for i in range(count)
+        ]
+    ).all()
+    db.commit()
+    return list(user_ids)
+
+
+def asset_row(user_id: str, filename: str, **values: Any) -> Dict[str, Any]:
+    """
+    Build an assets row for a bulk INSERT.
+    
+    Args:
+        user_id: ID of the owning user
+        filename: Original filename
+        **values: Columns overriding the defaults (a 1KB PNG image)
+    
+    Returns:
+        Dict of column values
+    """
+    row = {
+        "user_id": user_id,
+        "filename": filename,
+        "s3_key": f"users/{user_id}/{filename}",
+        "file_type": "image/png",
+        "file_size_bytes": 1024,
+        "category": "image",
+    }
+    row.update(values)
+    return row
+
+
+def create_assets(db, user_id: str, count: int, **values: Any) -> List[str]:
+    """
+    Insert assets named asset-{i}.png for one user with one bulk INSERT and commit.
+    
+    Args:
+        db: Database session
+        user_id: ID of the owning user
+        count: Number of assets
+        **values: Columns overriding the asset_row defaults
+    
+    Returns:
+        IDs of the created assets, in creation order
+    """
+    from sqlalchemy import insert
+    
+    from models.asset import Asset
+    
+    asset_ids = db.scalars(
+        insert(Asset).returning(Asset.id, sort_by_parameter_order=True),
+        [asset_row(user_id, f"asset-{i}.png", **values) for i in range(count)]
+    ).all()
+    db.commit()
+    return list(asset_ids)
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """
+    Run fn repeat times.
+    
+    Args:
+        fn: Function to time
+        repeat: Number of runs
+    
+    Returns:
+        Tuple of (best wall time in seconds, result of the last run)
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def timed(
+    label: str,
+    fn: Callable[[], Any],
+    repeat: int,
+    width: int = 44,
+    describe: Optional[Callable[[Any], str]] = None
+) -> None:
+    """
+    Run fn repeat times and print the best wall time.
+    
+    Args:
+        label: Measurement label
+        fn: Function to time
+        repeat: Number of runs, the best is reported
+        width: Width of the label column
+        describe: Optional formatter of the result appended to the line
+    """
+    best, result = best_time(fn, repeat)
+    suffix = f"  {describe(result)}" if describe else ""
+    print(f"{label:<{width}} {best * 1000:10.2f}ms{suffix}")
+
+
+class QueryCounter:
+    """Count SQL statements executed on one or more engines."""
+    
+    def __init__(self, *engines):
+        self.count = 0
+        for counted_engine in engines:
+            event.listen(counted_engine, "before_cursor_execute", self._on_execute)
+    
+    def _on_execute(self, *args):
+        self.count += 1
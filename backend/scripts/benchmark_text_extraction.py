@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark copy document text extraction and email prompt building."""
+import argparse
+import io
+import random
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from prompts import build_email_generation_prompt
+from services.text_extraction_service import extract_text
+
+WORDS = (
+    "save big this summer on every order shop the collection today free shipping "
+    "limited time offer new arrivals exclusive members early access discover our best "
+    "sellers fresh styles for the season your favorites are back in stock"
+).split()
+
+
+def build_paragraphs(words: int, rng: random.Random) -> list:
+    """Build paragraphs of marketing-like copy totalling roughly the given word count."""
+    paragraphs = []
+    while words > 0:
+        length = min(words, rng.randint(20, 80))
+        paragraphs.append(" ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + ".")
+        words -= length
+    return paragraphs
+
+
+def build_txt(paragraphs: list) -> bytes:
+    """Build a plain text document."""
+    return "\n\n".join(paragraphs).encode()
+
+
+def build_docx(paragraphs: list) -> bytes:
+    """Build a minimal .docx document with one w:p per paragraph."""
+    body = "".join(f"<w:p><w:r><w:t>{escape(paragraph)}</w:t></w:r></w:p>" for paragraph in paragraphs)
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "[Content_Types].xml",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="xml" ContentType="application/xml"/></Types>'
+        )
+        archive.writestr(
+            "word/document.xml",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>"
+        )
+    return output.getvalue()
+
+
+def build_pdf(paragraphs: list, lines_per_page: int = 50, chars_per_line: int = 90) -> bytes:
+    """Build a minimal text PDF (Helvetica, one text object per page)."""
+    lines = []
+    for paragraph in paragraphs:
+        line = ""
+        for word in paragraph.split():
+            if len(line) + len(word) + 1 > chars_per_line:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}".strip()
+        lines.extend([line, ""])
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    page_ids = []
+    for index, page_lines in enumerate(pages):
+        page_id, content_id = 4 + index * 2, 5 + index * 2
+        page_ids.append(page_id)
+        text = "".join(
+            f"({line.replace(chr(92), '').replace('(', '').replace(')', '')}) '\n" for line in page_lines
+        )
+        stream = f"BT /F1 10 Tf 14 TL 50 780 Td\n{text}ET".encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+    
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = output.tell()
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id]))
+    xref_offset = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for object_id in sorted(objects):
+        output.write(b"%010d 00000 n \n" % offsets[object_id])
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset))
+    return output.getvalue()
+
+
+def extract_bytes(data: bytes, kind: str) -> dict:
+    """Extract text from in-memory document bytes (runs in worker processes)."""
+    return extract_text(io.BytesIO(data), kind)
+
+
+def main():
+    """Run the benchmark and print throughput and prompt build times."""
+    parser = argparse.ArgumentParser(description="Benchmark copy document text extraction")
+    parser.add_argument("--words", type=int, default=20000, help="Words per document (default: 20000)")
+    parser.add_argument("--documents", type=int, default=16, help="Documents per kind for the pool run (default: 16)")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes for the pool run (default: 2)")
+    parser.add_argument("--copy-assets", type=int, default=5, help="Copy assets per campaign prompt (default: 5)")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    paragraphs = build_paragraphs(args.words, rng)
+    documents = {"text": build_txt(paragraphs), "docx": build_docx(paragraphs), "pdf": build_pdf(paragraphs)}
+    
+    print(f"words per document={args.words}")
+    print(f"{'kind':<6} {'size':>9} {'words':>7} {'excerpt':>8} {'1 process':>12} {f'{args.workers} workers':>12}")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Warm up worker processes so imports are not timed
+        list(executor.map(extract_bytes, [documents["text"]] * args.workers, ["text"] * args.workers))
+        
+        for kind, data in documents.items():
+            start = time.perf_counter()
+            result = extract_bytes(data, kind)
+            single = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            list(executor.map(extract_bytes, [data] * args.documents, [kind] * args.documents))
+            pooled = time.perf_counter() - start
+            
+            size_mb = len(data) / (1024 * 1024)
+            print(
+                f"{kind:<6} {size_mb:>7.2f}MB {result['text_word_count']:>7} {len(result['text_excerpt']):>8} "
+                f"{size_mb / single:>9.1f}MB/s {size_mb * args.documents / pooled:>9.1f}MB/s"
+            )
+    
+    # Prompt building: cached excerpts against re-parsing every copy document per generation
+    campaign_details = {"name": "Summer Sale", "audience": "returning customers", "goal": "drive sales", "notes": ""}
+    kinds = list(documents)
+    copy_documents = [(kinds[i % len(kinds)], documents[kinds[i % len(kinds)]]) for i in range(args.copy_assets)]
+    cached_assets = [
+        {"filename": f"copy-{i}.{kind}", "category": "copy", "s3_url": "https://example.com/x", "file_type": kind,
+         **extract_bytes(data, kind)}
+        for i, (kind, data) in enumerate(copy_documents)
+    ]
+    
+    start = time.perf_counter()
+    for _ in range(100):
+        build_email_generation_prompt(campaign_details, cached_assets)
+    cached = (time.perf_counter() - start) / 100
+    
+    start = time.perf_counter()
+    for _ in range(3):
+        build_email_generation_prompt(campaign_details, [
+            {**asset, **extract_bytes(data, kind)}
+            for asset, (kind, data) in zip(cached_assets, copy_documents)
+        ])
+    reparsed = (time.perf_counter() - start) / 3
+    
+    print(f"prompt build, {args.copy_assets} copy assets, cached text:   {cached * 1000:8.2f}ms")
+    print(f"prompt build, {args.copy_assets} copy assets, re-parse files: {reparsed * 1000:8.2f}ms (download time excluded)")
+
+
+if __name__ == "__main__":
+    main()
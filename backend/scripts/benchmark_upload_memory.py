@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark peak memory of concurrent S3 uploads: upload_stream vs a buffered put_object baseline."""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Process
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+
+class StandInS3Handler(BaseHTTPRequestHandler):
+    """Minimal S3 stand-in that accepts PUT/multipart uploads and discards the bytes."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _drain_body(self) -> None:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                self.rfile.read(size + 2)
+                if size == 0:
+                    break
+            return
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+
+    def _respond(self, status: int, body: bytes = b"") -> None:
+        self.send_response(status)
+        self.send_header("ETag", '"d41d8cd98f00b204e9800998ecf8427e"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        self._drain_body()
+        self._respond(200)
+
+    def do_POST(self):
+        self._drain_body()
+        if "uploads" in self.path.split("?", 1)[-1]:
+            upload_id = uuid.uuid4().hex
+            body = (
+                "<InitiateMultipartUploadResult><Bucket>bench</Bucket><Key>key</Key>"
+                f"<UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+            )
+        else:
+            body = (
+                "<CompleteMultipartUploadResult><Bucket>bench</Bucket><Key>key</Key>"
+                '<ETag>"d41d8cd98f00b204e9800998ecf8427e-1"</ETag></CompleteMultipartUploadResult>'
+            )
+        self._respond(200, body.encode())
+
+    def do_DELETE(self):
+        self._respond(204)
+
+
+def serve(port: int) -> None:
+    """Run the stand-in S3 server until terminated."""
+    ThreadingHTTPServer(("127.0.0.1", port), StandInS3Handler).serve_forever()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, files: int, size_mb: int) -> None:
+    """Upload files concurrently in one mode and print peak memory and wall time."""
+    from services.s3_service import s3_service
+
+    # Spooled files mirror how Starlette stores multipart uploads (spill to disk after 1MB)
+    uploads = []
+    block = os.urandom(1024 * 1024)
+    for _ in range(files):
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        for _ in range(size_mb):
+            spooled.write(block)
+        spooled.seek(0)
+        uploads.append(spooled)
+
+    baseline_mb = peak_rss_mb()
+
+    def upload(index: int) -> None:
+        file_obj = uploads[index]
+        if mode == "buffered":
+            # Baseline only: reads the whole file into memory before a single put_object
+            s3_key = s3_service.build_key("bench-user", f"bench-{index}.bin")
+            s3_service.backend.put_bytes(s3_key, file_obj.read(), "application/octet-stream")
+        else:
+            s3_service.upload_stream(file_obj, f"bench-{index}.bin", "bench-user")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=files) as executor:
+        list(executor.map(upload, range(files)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{mode:<10} files={files} size={size_mb}MB "
+        f"peak_rss_growth={peak_rss_mb() - baseline_mb:.1f}MB wall_time={elapsed:.2f}s"
+    )
+
+
+def main():
+    """Start the stand-in S3 server and benchmark each mode in a fresh process."""
+    parser = argparse.ArgumentParser(description="Benchmark S3 upload memory usage")
+    parser.add_argument("--files", type=int, default=50, help="Concurrent uploads (default: 50)")
+    parser.add_argument("--size-mb", type=int, default=10, help="Size of each file in MB (default: 10)")
+    parser.add_argument("--port", type=int, default=9555, help="Stand-in S3 port (default: 9555)")
+    parser.add_argument(
+        "--mode",
+        choices=["buffered", "streaming"],
+        default=None,
+        help="Run a single mode in this process (default: run both in subprocesses)",
+    )
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.files, args.size_mb)
+        return
+
+    server = Process(target=serve, args=(args.port,), daemon=True)
+    server.start()
+    env = dict(
+        os.environ,
+        AWS_S3_ENDPOINT_URL=f"http://127.0.0.1:{args.port}",
+        AWS_ACCESS_KEY_ID="bench",
+        AWS_SECRET_ACCESS_KEY="bench",
+        AWS_S3_BUCKET="bench",
+    )
+
+    try:
+        time.sleep(0.5)
+        for mode in ("buffered", "streaming"):
+            subprocess.run(
+                [
+                    sys.executable, __file__,
+                    "--mode", mode,
+                    "--files", str(args.files),
+                    "--size-mb", str(args.size_mb),
+                ],
+                env=env,
+                check=True,
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
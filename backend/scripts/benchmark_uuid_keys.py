@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Compare index size and insert/join speed of text UUID keys against binary UUID keys."""
+import argparse
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import MetaData, String, create_engine, func, insert, select, text
+
+from database import Base
+import models  # noqa: F401 - registers all tables on Base.metadata
+from models.types import BinaryUUID, uuid7
+
+TABLES = ["users", "assets", "campaigns", "campaign_assets"]
+
+
+def key_metadata(binary: bool) -> MetaData:
+    """Copy of the tables with UUID columns as BinaryUUID or as the former String."""
+    metadata = MetaData()
+    for name in TABLES:
+        table = Base.metadata.tables[name].to_metadata(metadata)
+        if not binary:
+            for column in table.columns:
+                if isinstance(column.type, BinaryUUID):
+                    column.type = String()
+    return metadata
+
+
+def seed(engine, metadata: MetaData, new_id, counts: dict) -> float:
+    """Insert users, assets, campaigns and links; return the seconds spent inserting."""
+    users, assets, campaigns, links = (metadata.tables[name] for name in TABLES)
+    user_ids = [new_id() for _ in range(counts["users"])]
+    elapsed = 0.0
+    
+    def insert_rows(table, rows):
+        nonlocal elapsed
+        with engine.begin() as conn:
+            start = time.perf_counter()
+            for batch_start in range(0, len(rows), 5000):
+                conn.execute(insert(table), rows[batch_start:batch_start + 5000])
+            elapsed += time.perf_counter() - start
+    
+    insert_rows(users, [
+        {"id": user_id, "email": f"user-{i}@example.com", "password": "benchmark", "full_name": f"User {i}", "role": "advertiser"}
+        for i, user_id in enumerate(user_ids)
+    ])
+    asset_rows = [
+        {
+            "id": new_id(),
+            "user_id": random.choice(user_ids),
+            "filename": f"asset-{i}.png",
+            "s3_key": f"users/{i}/asset-{i}.png",
+            "file_type": "image/png",
+            "file_size_bytes": 1024,
+            "category": "image",
+        }
+        for i in range(counts["assets"])
+    ]
+    insert_rows(assets, asset_rows)
+    campaign_rows = [
+        {"id": new_id(), "advertiser_id": random.choice(user_ids), "campaign_name": f"Campaign {i}", "status": "draft"}
+        for i in range(counts["campaigns"])
+    ]
+    insert_rows(campaigns, campaign_rows)
+    insert_rows(links, [
+        {"id": new_id(), "campaign_id": campaign["id"], "asset_id": asset["id"], "display_order": order}
+        for campaign in campaign_rows
+        for order, asset in enumerate(random.sample(asset_rows, counts["links_per_campaign"]))
+    ])
+    return elapsed
+
+
+def index_bytes(engine) -> dict:
+    """Bytes used by the tables and by their indexes (including primary keys), from dbstat."""
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT tbl_name, type, sum(pgsize) FROM dbstat JOIN sqlite_schema USING (name) "
+            "GROUP BY tbl_name, type"
+        )).all()
+    sizes = {"table": 0, "index": 0}
+    for table_name, object_type, size in rows:
+        if table_name in TABLES:
+            sizes[object_type] += size
+    return sizes
+
+
+def time_joins(engine, metadata: MetaData, lookups: int) -> tuple:
+    """Per-campaign link lookups per second and the time of one full three-table join."""
+    _, assets, campaigns, links = (metadata.tables[name] for name in TABLES)
+    with engine.connect() as conn:
+        campaign_ids = conn.scalars(select(campaigns.c.id)).all()
+        sample = random.sample(campaign_ids, min(lookups, len(campaign_ids)))
+        # As get_campaign_with_assets_async: a campaign's links with their assets
+        lookup = select(links, assets).join(assets, assets.c.id == links.c.asset_id)
+        start = time.perf_counter()
+        for campaign_id in sample:
+            conn.execute(lookup.where(links.c.campaign_id == campaign_id)).all()
+        lookups_per_second = len(sample) / (time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        conn.execute(
+            select(func.count())
+            .select_from(links)
+            .join(assets, assets.c.id == links.c.asset_id)
+            .join(campaigns, campaigns.c.id == links.c.campaign_id)
+            .where(assets.c.user_id == campaigns.c.advertiser_id)
+        ).scalar()
+        full_join = time.perf_counter() - start
+    return lookups_per_second, full_join
+
+
+def main():
+    """Seed one temporary SQLite database per key layout and compare them."""
+    parser = argparse.ArgumentParser(description="Benchmark text against binary UUID keys")
+    parser.add_argument("--users", type=int, default=1000, help="Users (default: 1000)")
+    parser.add_argument("--assets", type=int, default=200000, help="Assets (default: 200000)")
+    parser.add_argument("--campaigns", type=int, default=50000, help="Campaigns (default: 50000)")
+    parser.add_argument("--links-per-campaign", type=int, default=4, help="Assets linked to each campaign (default: 4)")
+    parser.add_argument("--lookups", type=int, default=5000, help="Campaign link lookups to time (default: 5000)")
+    args = parser.parse_args()
+    counts = {
+        "users": args.users,
+        "assets": args.assets,
+        "campaigns": args.campaigns,
+        "links_per_campaign": args.links_per_campaign,
+    }
+    
+    layouts = [
+        ("text, uuid4 (before)", False, lambda: str(uuid.uuid4())),
+        ("binary, uuid4", True, lambda: str(uuid.uuid4())),
+        ("binary, uuid7 (after)", True, uuid7),
+    ]
+    print(f"{args.users} users, {args.assets} assets, {args.campaigns} campaigns x {args.links_per_campaign} links")
+    print(f"{'':<24} {'insert':>9} {'table MB':>9} {'index MB':>9} {'lookups/s':>10} {'full join':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i, (label, binary, new_id) in enumerate(layouts):
+            random.seed(0)
+            engine = create_engine(f"sqlite:///{tmp_dir}/keys-{i}.db")
+            metadata = key_metadata(binary)
+            metadata.create_all(engine)
+            insert_seconds = seed(engine, metadata, new_id, counts)
+            sizes = index_bytes(engine)
+            lookups_per_second, full_join = time_joins(engine, metadata, args.lookups)
+            print(
+                f"{label:<24} {insert_seconds:8.2f}s {sizes['table'] / 2**20:9.1f} {sizes['index'] / 2**20:9.1f} "
+                f"{lookups_per_second:10.0f} {full_join * 1000:8.0f}ms"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Demonstrate read-replica routing with a primary and replica SQLite database."""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from scripts.benchmark_support import asset_row, create_users, use_temporary_environment
+
+# The API runs against a throwaway primary, one replica file and one replica
+# that cannot be opened (its directory does not exist)
+tmp_dir = use_temporary_environment("read-replica-demo-")
+primary_path = f"{tmp_dir}/database.db"
+replica_path = f"{tmp_dir}/replica.db"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{replica_path},sqlite:///{tmp_dir}/missing/replica.db"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+import main
+from database import Base, engine, async_engine, SessionLocal, pool_statistics, replica_router
+import models  # noqa: F401 - registers all tables on Base.metadata
+from models.asset import Asset
+
+
+class StatementLog:
+    """Record which database each SQL statement ran on."""
+    
+    def __init__(self):
+        self.databases = []
+        self._listen(engine, "primary")
+        self._listen(async_engine.sync_engine, "primary")
+        for replica in replica_router.replicas:
+            self._listen(replica.engine, replica.name)
+            self._listen(replica.async_engine.sync_engine, replica.name)
+    
+    def _listen(self, logged_engine, name: str) -> None:
+        event.listen(logged_engine, "before_cursor_execute", lambda *args: self.databases.append(name))
+    
+    def take(self) -> str:
+        """Databases used since the last call, e.g. "replica-1"."""
+        used = ", ".join(dict.fromkeys(self.databases)) or "none"
+        self.databases = []
+        return used
+
+
+def replicate() -> None:
+    """Copy the primary into the replica file, standing in for streaming replication."""
+    source = sqlite3.connect(primary_path)
+    target = sqlite3.connect(replica_path)
+    source.backup(target)
+    target.close()
+    source.close()
+
+
+def seed() -> dict:
+    """Create an advertiser, a manager and an asset on the primary; return request headers per user."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    advertiser_id = create_users(db, 1, prefix="advertiser")[0]
+    manager_id = create_users(db, 1, role="campaign_manager", prefix="manager")[0]
+    db.execute(insert(Asset), [asset_row(advertiser_id, "logo.png", category="logo")])
+    db.commit()
+    headers = {
+        "advertiser": {"X-User-ID": advertiser_id},
+        "manager": {"X-User-ID": manager_id},
+    }
+    db.close()
+    return headers
+
+
+def main_demo():
+    """Walk through round-robin, ejection, read-your-writes and fallback to the primary."""
+    parser = argparse.ArgumentParser(description="Demonstrate read-replica routing with two SQLite databases")
+    parser.add_argument(
+        "--sticky-seconds",
+        type=float,
+        default=1.0,
+        help="Time a writer reads from the primary after a write (default: 1.0)"
+    )
+    args = parser.parse_args()
+    sticky_seconds = args.sticky_seconds
+    replica_router.sticky_seconds = sticky_seconds
+    headers = seed()
+    replicate()
+    client = TestClient(main.app)
+    log = StatementLog()
+    
+    def show(step: str, response) -> None:
+        print(f"{step:<52} {response.status_code}  served by {log.take()}")
+    
+    print("Reads are spread over the replicas; the missing one is ejected on its first use")
+    for _ in range(3):
+        show("GET /api/campaigns (advertiser)", client.get("/api/campaigns", headers=headers["advertiser"]))
+    show("GET /api/assets (advertiser)", client.get("/api/assets", headers=headers["advertiser"]))
+    
+    print("\nA write goes to the primary and pins the writer's reads there")
+    asset_id = client.get("/api/assets", headers=headers["advertiser"]).json()["items"][0]["id"]
+    log.take()
+    response = client.post("/api/campaigns", headers=headers["advertiser"], json={
+        "campaign_name": "Spring launch",
+        "asset_ids": [asset_id],
+    })
+    show("POST /api/campaigns (advertiser)", response)
+    campaign_id = response.json()["id"]
+    response = client.get(f"/api/campaigns/{campaign_id}", headers=headers["advertiser"])
+    show("GET /api/campaigns/{id} right after (advertiser)", response)
+    response = client.get("/api/campaigns", headers=headers["advertiser"])
+    show(f"GET /api/campaigns (advertiser, {len(response.json())} campaigns)", response)
+    
+    print(f"\nOther users, and the writer after {sticky_seconds}s, read the (lagging) replica again")
+    show("GET /api/campaigns/{id} (manager, not replicated)", client.get(f"/api/campaigns/{campaign_id}", headers=headers["manager"]))
+    time.sleep(sticky_seconds)
+    response = client.get("/api/campaigns", headers=headers["advertiser"])
+    show(f"GET /api/campaigns (advertiser, {len(response.json())} campaigns)", response)
+    replicate()
+    response = client.get("/api/campaigns", headers=headers["advertiser"])
+    show(f"GET /api/campaigns after replication ({len(response.json())} campaigns)", response)
+    
+    print("\nWith every replica ejected, reads fall back to the primary")
+    for replica in replica_router.replicas:
+        replica_router.eject(replica)
+    show("GET /api/campaigns (advertiser)", client.get("/api/campaigns", headers=headers["advertiser"]))
+    
+    print("\nPools")
+    for pool in pool_statistics():
+        print(f"  {pool['engine']:<18} checkouts={pool['checkouts']} healthy={pool.get('healthy')} ejections={pool.get('ejections')}")
+
+
+if __name__ == "__main__":
+    main_demo()
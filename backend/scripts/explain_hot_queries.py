@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Capture query plans of the hot queries and check each one uses its index."""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+import models  # noqa: F401 - registers all tables on Base.metadata
+from models.campaign import Campaign
+from scripts.query_plans import explain_query, hot_queries, seed
+
+
+def main():
+    """Seed a database, explain every hot query and fail if one misses its index."""
+    parser = argparse.ArgumentParser(description="Check query plans of the hot queries")
+    parser.add_argument(
+        "--database-url",
+        help="Database to explain against, migrated to head (default: temporary SQLite file from the models)"
+    )
+    parser.add_argument("--campaigns", type=int, default=20000, help="Campaigns, metrics and health checks to seed (default: 20000)")
+    parser.add_argument("--no-seed", action="store_true", help="Explain against the existing data only")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(args.database_url or f"sqlite:///{tmp_dir}/explain.db")
+        if not args.database_url:
+            Base.metadata.create_all(engine)
+        
+        if args.no_seed:
+            with engine.connect() as conn:
+                advertiser_id = conn.scalar(select(Campaign.advertiser_id).limit(1)) or ""
+        else:
+            advertiser_id = seed(engine, args.campaigns)
+        # Plans depend on table statistics
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+        
+        db = sessionmaker(bind=engine)()
+        failures = 0
+        for name, expected_index, run in hot_queries(advertiser_id):
+            plan = explain_query(engine, db, run)
+            uses_index = any(expected_index in line for line in plan)
+            failures += not uses_index
+            print(f"{'ok' if uses_index else 'MISSING INDEX':<13} {name} (expects {expected_index}*)")
+            for line in plan:
+                print(f"    {line}")
+        db.close()
+        engine.dispose()
+    
+    if failures:
+        print(f"{failures} hot queries do not use their index")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Backfill cached text for copy documents uploaded before text extraction existed."""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import select
+
+from database import SessionLocal
+from models import Asset
+from services.text_extraction_service import text_extraction_service
+
+
+def extract_asset_text(batch_size: int = 50, user_id: Optional[str] = None) -> int:
+    """
+    Programmatic function to backfill extracted text for existing copy assets.
+    
+    Args:
+        batch_size: Number of assets extracted per batch
+        user_id: Optional user ID to restrict the backfill to
+    
+    Returns:
+        Number of assets processed
+    """
+    db = SessionLocal()
+    processed = 0
+    last_id = None
+    start_time = time.time()
+    
+    try:
+        while True:
+            query = select(Asset.id, Asset.filename, Asset.file_type).where(
+                Asset.text_word_count.is_(None),
+                Asset.category == "copy"
+            ).order_by(Asset.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(Asset.id > last_id)
+            if user_id:
+                query = query.where(Asset.user_id == user_id)
+            
+            rows = db.execute(query).all()
+            if not rows:
+                break
+            
+            asset_ids = [
+                asset_id for asset_id, filename, file_type in rows
+                if text_extraction_service.supports(filename, file_type)
+            ]
+            if asset_ids:
+                text_extraction_service.extract_for_assets(asset_ids)
+            processed += len(asset_ids)
+            last_id = rows[-1][0]
+            
+            elapsed = time.time() - start_time
+            print(f"Processed {processed} assets ({processed / elapsed:.1f} assets/s)")
+    finally:
+        db.close()
+    
+    return processed
+
+
+def main():
+    """Main function to backfill asset text."""
+    parser = argparse.ArgumentParser(description="Extract text for existing copy assets")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="Number of assets extracted per batch (default: 50)",
+    )
+    parser.add_argument(
+        "--user-id",
+        type=str,
+        default=None,
+        help="Only process assets belonging to this user",
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        processed = extract_asset_text(batch_size=args.batch_size, user_id=args.user_id)
+        print(f"Extracted text for {processed} assets")
+    except Exception as e:
+        print(f"Text extraction backfill failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Backfill email-optimized renditions for images uploaded before derivatives existed."""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import select
+
+from database import SessionLocal
+from models import Asset
+from services.derivative_service import derivative_service, DERIVATIVE_SOURCE_TYPES
+
+
+def generate_derivatives(batch_size: int = 50, user_id: Optional[str] = None) -> int:
+    """
+    Programmatic function to backfill renditions for existing image assets.
+    
+    Args:
+        batch_size: Number of assets rendered per batch
+        user_id: Optional user ID to restrict the backfill to
+        
+    Returns:
+        Number of assets processed
+    """
+    db = SessionLocal()
+    processed = 0
+    last_id = None
+    start_time = time.time()
+    
+    try:
+        while True:
+            query = select(Asset.id).where(
+                Asset.derivatives.is_(None),
+                Asset.file_type.in_(DERIVATIVE_SOURCE_TYPES)
+            ).order_by(Asset.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(Asset.id > last_id)
+            if user_id:
+                query = query.where(Asset.user_id == user_id)
+            
+            asset_ids = list(db.scalars(query))
+            if not asset_ids:
+                break
+            
+            derivative_service.generate_for_assets(asset_ids)
+            processed += len(asset_ids)
+            last_id = asset_ids[-1]
+            
+            elapsed = time.time() - start_time
+            print(f"Processed {processed} assets ({processed / elapsed:.1f} assets/s)")
+    finally:
+        db.close()
+    
+    return processed
+
+
+def main():
+    """Main function to backfill asset renditions."""
+    parser = argparse.ArgumentParser(description="Generate renditions for existing image assets")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="Number of assets rendered per batch (default: 50)",
+    )
+    parser.add_argument(
+        "--user-id",
+        type=str,
+        default=None,
+        help="Only process assets belonging to this user",
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        processed = generate_derivatives(batch_size=args.batch_size, user_id=args.user_id)
+        print(f"Generated renditions for {processed} assets")
+    except Exception as e:
+        print(f"Derivative backfill failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Load test: latency of unrelated endpoints while slow proof generations run."""
+import argparse
+import socket
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from scripts.benchmark_support import use_temporary_environment
+
+# The API runs against a throwaway database and local storage
+use_temporary_environment("load-test-")
+
+import uvicorn
+
+import concurrency
+import main
+import routers.campaign
+from database import Base, engine, SessionLocal
+from models.asset import Asset
+from models.campaign import Campaign
+from models.campaign_asset import CampaignAsset
+from models.user import User
+from services.event_loop_monitor import event_loop_monitor
+
+
+def seed() -> tuple:
+    """Create an advertiser with one campaign and one linked asset."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    user = User(email="load@example.com", password="load", full_name="Load Test", role="advertiser")
+    db.add(user)
+    db.flush()
+    asset = Asset(
+        user_id=user.id,
+        filename="hero.png",
+        s3_key=f"users/{user.id}/hero.png",
+        file_type="image/png",
+        file_size_bytes=1024,
+        category="image",
+    )
+    campaign = Campaign(advertiser_id=user.id, campaign_name="Load test", status="draft")
+    db.add_all([asset, campaign])
+    db.flush()
+    db.add(CampaignAsset(campaign_id=campaign.id, asset_id=asset.id))
+    db.commit()
+    ids = (user.id, campaign.id)
+    db.close()
+    return ids
+
+
+def install_slow_dependencies(proof_seconds: float, mjml_seconds: float, blocking: bool) -> None:
+    """Replace OpenAI and MJML with blocking stubs of fixed duration."""
+    def generate_email_mjml(campaign_details, assets):
+        time.sleep(proof_seconds)
+        return "<mjml><mj-body></mj-body></mjml>"
+    
+    def compile_mjml_to_html(mjml_code):
+        time.sleep(mjml_seconds)
+        return "<html></html>"
+    
+    routers.campaign.openai_service.generate_email_mjml = generate_email_mjml
+    routers.campaign.compile_mjml_to_html = compile_mjml_to_html
+    
+    if blocking:
+        # Call the dependencies directly on the event loop, as the handlers used to
+        async def run_inline(self, fn, *args, **kwargs):
+            return fn(*args, **kwargs)
+        concurrency.Bulkhead.run = run_inline
+
+
+def request(url: str, user_id: str, method: str = "GET") -> float:
+    """Send one request and return its latency in seconds."""
+    start = time.perf_counter()
+    req = urllib.request.Request(url, method=method, headers={"X-User-ID": user_id})
+    with urllib.request.urlopen(req, timeout=120) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def probe(base_url: str, user_id: str, duration: float) -> dict:
+    """Measure latency of unrelated endpoints, sequentially, for a fixed duration."""
+    latencies = {"/health": [], "/api/campaigns": []}
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        for path in latencies:
+            latencies[path].append(request(base_url + path, user_id))
+            time.sleep(0.01)
+    return latencies
+
+
+def summarize(label: str, latencies: dict) -> None:
+    """Print p50/p95/max latency per endpoint."""
+    for path, values in latencies.items():
+        values = sorted(values)
+        p95 = values[int((len(values) - 1) * 0.95)]
+        print(
+            f"{label:<14} GET {path:<15} p50={statistics.median(values) * 1000:8.1f}ms "
+            f"p95={p95 * 1000:8.1f}ms max={values[-1] * 1000:8.1f}ms ({len(values)} requests)"
+        )
+
+
+def main_load_test():
+    """Run the load test against a uvicorn server in a background thread."""
+    parser = argparse.ArgumentParser(description="Load test event loop responsiveness during proof generation")
+    parser.add_argument("--generators", type=int, default=8, help="Clients generating proofs concurrently (default: 8)")
+    parser.add_argument("--proof-seconds", type=float, default=2.0, help="Simulated OpenAI latency (default: 2.0)")
+    parser.add_argument("--mjml-seconds", type=float, default=0.2, help="Simulated MJML compile time (default: 0.2)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds probed per phase (default: 10)")
+    parser.add_argument(
+        "--blocking",
+        action="store_true",
+        help="Call OpenAI and MJML directly on the event loop (behaviour before the bulkheads)"
+    )
+    args = parser.parse_args()
+    
+    user_id, campaign_id = seed()
+    install_slow_dependencies(args.proof_seconds, args.mjml_seconds, args.blocking)
+    
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    base_url = f"http://127.0.0.1:{port}"
+    
+    print(f"mode={'blocking (on the event loop)' if args.blocking else 'bulkheads'} generators={args.generators} "
+          f"proof={args.proof_seconds}s mjml={args.mjml_seconds}s")
+    summarize("idle", probe(base_url, user_id, args.duration))
+    
+    stop = threading.Event()
+    proof_latencies = []
+    
+    def generate_proofs():
+        while not stop.is_set():
+            proof_latencies.append(
+                request(f"{base_url}/api/campaigns/{campaign_id}/generate-proof", user_id, method="POST")
+            )
+    
+    generators = [threading.Thread(target=generate_proofs) for _ in range(args.generators)]
+    for generator in generators:
+        generator.start()
+    time.sleep(0.5)
+    
+    stalls_before = event_loop_monitor.stall_count
+    summarize("during proofs", probe(base_url, user_id, args.duration))
+    stop.set()
+    for generator in generators:
+        generator.join()
+    
+    print(f"proofs generated: {len(proof_latencies)} (p50 {statistics.median(proof_latencies):.2f}s)")
+    print(
+        f"event loop stalls over {event_loop_monitor.threshold * 1000:.0f}ms: "
+        f"{event_loop_monitor.stall_count - stalls_before} (max lag {event_loop_monitor.max_lag * 1000:.0f}ms)"
+    )
+    
+    server.should_exit = True
+    time.sleep(0.5)
+
+
+if __name__ == "__main__":
+    main_load_test()
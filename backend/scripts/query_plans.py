@@ -0,0 +1,143 @@
+"""Hot queries and their expected indexes, shared by explain_hot_queries.py and the test suite."""
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, event, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from models.campaign import Campaign
+from models.performance_metric import PerformanceMetric
+from models.system_health import SystemHealth
+from models.user import User
+from crud.campaign import (
+    campaigns_by_user_statement,
+    campaigns_by_status_statement,
+    get_approval_queue_page,
+)
+from crud.keyset import encode_cursor
+from crud.metrics import (
+    get_queue_depth,
+    calculate_approval_rate,
+    calculate_time_to_approval,
+    calculate_deduplication_savings,
+)
+
+
+def seed(engine, campaigns: int, rng: random.Random = random) -> str:
+    """Fill the tables the hot queries read; return an advertiser id to query for."""
+    db = sessionmaker(bind=engine)()
+    advertiser_ids = [str(uuid.uuid4()) for _ in range(max(1, campaigns // 50))]
+    db.execute(insert(User), [
+        {
+            "id": user_id,
+            "email": f"advertiser-{i}@example.com",
+            "password": "explain",
+            "full_name": f"Advertiser {i}",
+            "role": "advertiser",
+        }
+        for i, user_id in enumerate(advertiser_ids)
+    ])
+    
+    now = datetime.now()
+    rows = []
+    for i in range(campaigns):
+        status = rng.choice(["draft", "pending_approval", "approved", "rejected"])
+        created_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "advertiser_id": rng.choice(advertiser_ids),
+            "campaign_name": f"Campaign {i}",
+            "status": status,
+            "created_at": created_at,
+            "reviewed_at": created_at + timedelta(hours=2) if status in ("approved", "rejected") else None,
+        })
+    db.execute(insert(Campaign), rows)
+    
+    metric_types = ["proof_generation_time", "asset_upload_throughput", "upload_dedup_bytes_saved", "event_loop_lag"]
+    db.execute(insert(PerformanceMetric), [
+        {
+            "id": str(uuid.uuid4()),
+            "metric_type": rng.choice(metric_types),
+            "metric_value": rng.random() * 10,
+            "recorded_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+        }
+        for _ in range(campaigns)
+    ])
+    db.execute(insert(SystemHealth), [
+        {
+            "id": str(uuid.uuid4()),
+            "component": rng.choice(["api", "s3", "database", "openai"]),
+            "status": "healthy",
+            "checked_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+        }
+        for _ in range(campaigns)
+    ])
+    db.commit()
+    db.close()
+    return advertiser_ids[0]
+
+
+def hot_queries(advertiser_id: str) -> list:
+    """(name, expected index, function running the query on a session)."""
+    cutoff = datetime.now() - timedelta(hours=24)
+    # Position halfway through the seeded queue
+    queue_cursor = encode_cursor(datetime.now() - timedelta(days=180), str(uuid.UUID(int=0)))
+    return [
+        ("campaigns by advertiser", "idx_campaigns_advertiser_id_created_at",
+         lambda db: db.scalars(campaigns_by_user_statement(advertiser_id)).all()),
+        ("pending campaigns", "idx_campaigns_status_created_at",
+         lambda db: db.scalars(campaigns_by_status_statement("pending_approval")).all()),
+        ("approval queue first page", "idx_campaigns_status_created_at",
+         lambda db: get_approval_queue_page(db, 50)),
+        ("approval queue next page", "idx_campaigns_status_created_at",
+         lambda db: get_approval_queue_page(db, 50, cursor=queue_cursor)),
+        ("queue depth", "idx_campaigns_status_",
+         get_queue_depth),
+        ("approval rate", "idx_campaigns_status_reviewed_at",
+         lambda db: calculate_approval_rate(db, days=7)),
+        ("time to approval", "idx_campaigns_status_reviewed_at",
+         lambda db: calculate_time_to_approval(db, days=7)),
+        ("deduplication savings", "idx_performance_metrics_type_recorded_at",
+         calculate_deduplication_savings),
+        # As in routers/metrics.py
+        ("proof generation metrics", "idx_performance_metrics_type_recorded_at",
+         lambda db: db.scalars(select(PerformanceMetric).where(
+             PerformanceMetric.metric_type == "proof_generation_time"
+         )).all()),
+        ("component uptime", "idx_system_health_component_checked_at",
+         lambda db: db.scalars(select(SystemHealth).where(and_(
+             SystemHealth.component == "api",
+             SystemHealth.checked_at >= cutoff
+         ))).all()),
+    ]
+
+
+def capture_first_statement(engine, db, run) -> tuple:
+    """Run a query function and return the first SQL statement it executed."""
+    captured = []
+    
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+    
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return captured[0]
+
+
+def explain(engine, statement: str, parameters) -> list:
+    """Query plan lines for a statement."""
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+    # SQLite returns (id, parent, notused, detail); PostgreSQL one text column
+    return [row[-1] for row in rows]
+
+
+def explain_query(engine, db, run) -> list:
+    """Query plan lines of the first statement a query function executes."""
+    statement, parameters = capture_first_statement(engine, db, run)
+    return explain(engine, statement, parameters)
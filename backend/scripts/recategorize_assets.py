@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""Re-run asset categorization rules over the whole assets table in batches."""
+import argparse
+import json
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import select, update
+
+from database import SessionLocal
+from models import Asset
+from services.categorization_service import categorize_asset
+
+
+# Columns needed to re-run the rules engine (full ORM rows are never loaded)
+ASSET_COLUMNS = (
+    Asset.id,
+    Asset.filename,
+    Asset.file_type,
+    Asset.category,
+    Asset.categorization_method,
+    Asset.image_width,
+    Asset.image_height,
+    Asset.image_aspect_ratio,
+    Asset.image_has_transparency,
+    Asset.image_color_depth,
+)
+
+# Number of assets sent to OpenAI per categorization request
+AI_CHUNK_SIZE = 25
+
+
+def load_checkpoint(checkpoint_path: Optional[Path]) -> Dict:
+    """Load checkpoint state from disk.
+
+    Args:
+        checkpoint_path: Path to checkpoint JSON file (None disables checkpoints)
+
+    Returns:
+        Checkpoint dictionary with last_id, processed and changed counts
+    """
+    if checkpoint_path and checkpoint_path.exists():
+        with open(checkpoint_path, "r") as f:
+            return json.load(f)
+    return {"last_id": None, "processed": 0, "changed": 0}
+
+
+def save_checkpoint(checkpoint_path: Optional[Path], state: Dict) -> None:
+    """Atomically write checkpoint state to disk.
+
+    Args:
+        checkpoint_path: Path to checkpoint JSON file (None disables checkpoints)
+        state: Checkpoint dictionary to persist
+    """
+    if not checkpoint_path:
+        return
+    tmp_path = checkpoint_path.with_suffix(checkpoint_path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    tmp_path.replace(checkpoint_path)
+
+
+def iter_asset_batches(db_session, batch_size: int, last_id: Optional[str], methods: List[str], user_id: Optional[str]):
+    """Read asset rows in primary-key order, one batch at a time.
+
+    Each batch is its own keyset query (id > last seen id, LIMIT batch_size)
+    and is fully fetched before it is written back, so no cursor stays open
+    across the per-batch commits.
+
+    Args:
+        db_session: Database session used for reads
+        batch_size: Number of rows per batch
+        last_id: Resume after this asset ID (None starts from the beginning)
+        methods: Categorization methods eligible for re-categorization
+        user_id: Optional user ID to restrict the scan to
+
+    Yields:
+        Lists of row tuples matching ASSET_COLUMNS
+    """
+    while True:
+        query = select(*ASSET_COLUMNS).order_by(Asset.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(Asset.id > last_id)
+        if user_id:
+            query = query.where(Asset.user_id == user_id)
+
+        method_filter = Asset.categorization_method.in_(methods)
+        if "rules" in methods:
+            # Rows created before categorization_method existed count as rules
+            method_filter = method_filter | Asset.categorization_method.is_(None)
+        query = query.where(method_filter)
+
+        batch = [tuple(row) for row in db_session.execute(query)]
+        if not batch:
+            return
+
+        yield batch
+        last_id = batch[-1][0]
+
+
+def categorize_batch(batch: List[Tuple]) -> Dict[str, Tuple[str, str]]:
+    """Run the rules engine over a batch of asset rows.
+
+    Args:
+        batch: Row tuples matching ASSET_COLUMNS
+
+    Returns:
+        Dict mapping asset ID to (category, categorization_method)
+    """
+    results = {}
+    for asset_id, filename, file_type, _, _, width, height, aspect_ratio, has_transparency, color_depth in batch:
+        image_metadata = None
+        if width and height:
+            image_metadata = {
+                "width": width,
+                "height": height,
+                "aspect_ratio": aspect_ratio,
+                "has_transparency": has_transparency,
+                "color_depth": color_depth,
+            }
+        results[asset_id] = categorize_asset(filename, file_type, image_metadata)
+    return results
+
+
+def categorize_leftovers_with_ai(
+    batch: List[Tuple],
+    results: Dict[str, Tuple[str, str]],
+    executor: ThreadPoolExecutor
+) -> None:
+    """Send assets the rules engine left as 'pending', and assets previously
+    categorized by AI, to OpenAI.
+
+    Leftovers are split into chunks that are categorized concurrently; the
+    executor's worker count bounds the number of in-flight OpenAI requests.
+    Failed chunks keep their rules result.
+
+    Args:
+        batch: Row tuples matching ASSET_COLUMNS
+        results: Rules results, updated in place with AI categories
+        executor: Thread pool bounding OpenAI concurrency
+    """
+    from services.openai_service import openai_service
+
+    leftovers = [
+        {"id": row[0], "filename": row[1], "file_type": row[2], "category": "pending"}
+        for row in batch
+        if results[row[0]][0] == "pending" or row[4] == "ai"
+    ]
+    chunks = [leftovers[i:i + AI_CHUNK_SIZE] for i in range(0, len(leftovers), AI_CHUNK_SIZE)]
+    futures = [executor.submit(openai_service.categorize_assets, chunk) for chunk in chunks]
+
+    for future in futures:
+        try:
+            categorization_map = future.result()
+        except Exception as e:
+            print(f"AI categorization failed for a chunk, keeping rules result: {e}")
+            continue
+        for asset_id, category in categorization_map.items():
+            results[asset_id] = (category, "ai")
+
+
+def apply_changes(db_session, changes: Dict[Tuple[str, str], List[str]]) -> None:
+    """Write category changes back with one UPDATE ... WHERE id IN per target value.
+
+    Args:
+        db_session: Database session used for writes
+        changes: Dict mapping (category, categorization_method) to asset IDs
+    """
+    for (category, method), asset_ids in changes.items():
+        db_session.execute(
+            update(Asset)
+            .where(Asset.id.in_(asset_ids))
+            .values(category=category, categorization_method=method)
+            .execution_options(synchronize_session=False)
+        )
+    db_session.commit()
+
+
+def recategorize_assets(
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    use_ai: bool = False,
+    ai_concurrency: int = 4,
+    include_ai: bool = False,
+    user_id: Optional[str] = None,
+    checkpoint_file: Optional[str] = None,
+    report_file: Optional[str] = None,
+) -> Dict:
+    """Programmatic function to re-categorize assets.
+
+    Args:
+        batch_size: Number of rows read and written per batch
+        dry_run: Report changes without writing them
+        use_ai: Send assets still 'pending' after rules to OpenAI
+        ai_concurrency: Maximum concurrent OpenAI requests
+        include_ai: Also re-evaluate assets previously categorized by AI (requires use_ai)
+        user_id: Optional user ID to restrict the run to
+        checkpoint_file: Optional path used to resume an interrupted run
+        report_file: Optional path for the tab-separated diff report (default: stdout)
+
+    Returns:
+        Summary dict with processed, changed and transitions counts
+
+    Raises:
+        ValueError: If include_ai is set without use_ai
+    """
+    if include_ai and not use_ai:
+        # The rules engine would replace AI categories with its own fallbacks
+        raise ValueError("include_ai requires use_ai: AI categories are only re-evaluated with AI")
+
+    checkpoint_path = Path(checkpoint_file) if checkpoint_file else None
+    state = load_checkpoint(checkpoint_path)
+    if state["last_id"]:
+        print(f"Resuming after asset {state['last_id']} ({state['processed']} already processed)")
+
+    # Manual categorizations are user decisions and are never overwritten
+    methods = ["rules", "ai"] if include_ai else ["rules"]
+    transitions = Counter()
+
+    report = open(report_file, "w") if report_file else sys.stdout
+    executor = ThreadPoolExecutor(max_workers=ai_concurrency) if use_ai else None
+    db = SessionLocal()
+    start_time = time.time()
+
+    try:
+        for batch in iter_asset_batches(db, batch_size, state["last_id"], methods, user_id):
+            results = categorize_batch(batch)
+            if executor:
+                categorize_leftovers_with_ai(batch, results, executor)
+
+            changes = defaultdict(list)
+            for asset_id, filename, _, old_category, old_method, *_ in batch:
+                new_category, new_method = results[asset_id]
+                if new_category == old_category:
+                    continue
+                if old_method == "ai" and new_method != "ai":
+                    # Never downgrade an AI category to a rules result (e.g. a failed AI chunk)
+                    continue
+                changes[(new_category, new_method)].append(asset_id)
+                transitions[f"{old_category} -> {new_category}"] += 1
+                if dry_run:
+                    report.write(f"{asset_id}\t{filename}\t{old_category}\t{new_category}\t{new_method}\n")
+
+            changed_count = sum(len(ids) for ids in changes.values())
+            if not dry_run:
+                apply_changes(db, changes)
+            db.expunge_all()
+
+            state["last_id"] = batch[-1][0]
+            state["processed"] += len(batch)
+            state["changed"] += changed_count
+            if not dry_run:
+                save_checkpoint(checkpoint_path, state)
+
+            elapsed = time.time() - start_time
+            print(
+                f"Processed {state['processed']} assets, {state['changed']} changed "
+                f"({state['processed'] / elapsed:.0f} rows/s)",
+                file=sys.stderr,
+            )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+        if executor:
+            executor.shutdown()
+        if report is not sys.stdout:
+            report.close()
+
+    action = "Would change" if dry_run else "Changed"
+    print(f"{action} {state['changed']} of {state['processed']} assets", file=sys.stderr)
+    for transition, count in transitions.most_common():
+        print(f"  {transition}: {count}", file=sys.stderr)
+
+    return {
+        "processed": state["processed"],
+        "changed": state["changed"],
+        "transitions": dict(transitions),
+    }
+
+
+def main():
+    """Main function to re-categorize assets."""
+    parser = argparse.ArgumentParser(description="Re-run categorization rules over all assets")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of rows read and updated per batch (default: 1000)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print a diff of category changes without writing them",
+    )
+    parser.add_argument(
+        "--ai",
+        action="store_true",
+        help="Categorize assets left as 'pending' by the rules engine with OpenAI",
+    )
+    parser.add_argument(
+        "--ai-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent OpenAI requests (default: 4)",
+    )
+    parser.add_argument(
+        "--include-ai",
+        action="store_true",
+        help="Also re-evaluate assets previously categorized by AI with OpenAI; requires --ai (manual categories are always kept)",
+    )
+    parser.add_argument(
+        "--user-id",
+        type=str,
+        default=None,
+        help="Only re-categorize assets belonging to this user",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        type=str,
+        default=None,
+        help="Checkpoint file used to resume an interrupted run",
+    )
+    parser.add_argument(
+        "--report-file",
+        type=str,
+        default=None,
+        help="Write the dry-run diff report to this file instead of stdout",
+    )
+
+    args = parser.parse_args()
+    if args.include_ai and not args.ai:
+        parser.error("--include-ai requires --ai")
+
+    try:
+        recategorize_assets(
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            use_ai=args.ai,
+            ai_concurrency=args.ai_concurrency,
+            include_ai=args.include_ai,
+            user_id=args.user_id,
+            checkpoint_file=args.checkpoint_file,
+            report_file=args.report_file,
+        )
+    except Exception as e:
+        print(f"Re-categorization failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
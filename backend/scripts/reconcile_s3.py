@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Reconcile S3 objects under users/ against asset rows (orphans and drift)."""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+# Add backend directory to path (we're in backend/scripts/, so go up one level)
+backend_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import func, select
+
+from database import SessionLocal, engine
+from models import Asset
+from services.s3_service import s3_service
+from services.s3_deletion_service import enqueue_s3_deletions, s3_deletion_service
+
+
+def load_checkpoint(checkpoint_path: Optional[Path]) -> Dict:
+    """Load checkpoint state from disk.
+    
+    Args:
+        checkpoint_path: Path to checkpoint JSON file (None disables checkpoints)
+    
+    Returns:
+        Checkpoint dictionary with continuation_token, last_key and counters
+    """
+    if checkpoint_path and checkpoint_path.exists():
+        with open(checkpoint_path, "r") as f:
+            return json.load(f)
+    return {
+        "continuation_token": None,
+        "last_key": None,
+        "objects": 0,
+        "orphans": 0,
+        "orphan_bytes": 0,
+        "missing": 0,
+        "size_mismatches": 0,
+    }
+
+
+def save_checkpoint(checkpoint_path: Optional[Path], state: Dict) -> None:
+    """Atomically write checkpoint state to disk.
+    
+    Args:
+        checkpoint_path: Path to checkpoint JSON file (None disables checkpoints)
+        state: Checkpoint dictionary to persist
+    """
+    if not checkpoint_path:
+        return
+    tmp_path = checkpoint_path.with_suffix(checkpoint_path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    tmp_path.replace(checkpoint_path)
+
+
+def iter_asset_keys(db_session, prefix: str, last_key: Optional[str], batch_size: int) -> Iterator[Tuple[str, int]]:
+    """Stream distinct asset S3 keys in the same byte order S3 lists keys.
+    
+    Deduplicated assets share one key, so keys are grouped. Postgres sorts
+    by the column collation by default; the "C" collation matches S3's
+    UTF-8 binary order (SQLite already compares with BINARY).
+    
+    Args:
+        db_session: Database session used for the streaming read
+        prefix: Only keys starting with this prefix are returned
+        last_key: Resume after this key (None starts from the beginning)
+        batch_size: Rows fetched per round trip
+    
+    Yields:
+        Tuples of (s3_key, file_size_bytes)
+    """
+    key_column = Asset.s3_key.collate("C") if engine.dialect.name == "postgresql" else Asset.s3_key
+    query = (
+        select(Asset.s3_key, func.max(Asset.file_size_bytes))
+        .where(Asset.s3_key.startswith(prefix, autoescape=True))
+        .group_by(Asset.s3_key)
+        .order_by(key_column)
+    )
+    if last_key is not None:
+        query = query.where(key_column > last_key)
+    
+    for s3_key, size_bytes in db_session.execute(query.execution_options(yield_per=batch_size)):
+        yield s3_key, size_bytes
+
+
+def reconcile_s3(
+    prefix: str = "users/",
+    min_age_hours: float = 24.0,
+    delete_orphans: bool = False,
+    requests_per_second: float = 5.0,
+    checkpoint_file: Optional[str] = None,
+    report_file: Optional[str] = None,
+) -> Dict:
+    """Programmatic function to reconcile S3 objects with asset rows.
+    
+    S3 pages and database keys are both consumed in sorted order and
+    merge-joined, so memory use does not depend on the number of objects.
+    
+    Args:
+        prefix: S3 key prefix to reconcile
+        min_age_hours: Objects younger than this are never reported as orphans
+            (direct uploads may not be confirmed yet)
+        delete_orphans: Queue orphans for deletion in the s3_deletions outbox
+        requests_per_second: Maximum S3 list requests per second
+        checkpoint_file: Optional path used to resume an interrupted run
+        report_file: Optional path for the tab-separated report (default: stdout)
+    
+    Returns:
+        Summary dict with objects, orphans, orphan_bytes, missing and size_mismatches counts
+    """
+    checkpoint_path = Path(checkpoint_file) if checkpoint_file else None
+    state = load_checkpoint(checkpoint_path)
+    if state["last_key"]:
+        print(f"Resuming after {state['last_key']} ({state['objects']} objects already listed)", file=sys.stderr)
+    
+    orphan_cutoff = datetime.now(timezone.utc) - timedelta(hours=min_age_hours)
+    min_request_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+    
+    report = open(report_file, "a" if state["last_key"] else "w") if report_file else sys.stdout
+    read_db = SessionLocal()
+    write_db = SessionLocal()
+    start_time = time.time()
+    
+    try:
+        asset_keys = iter_asset_keys(read_db, prefix, state["last_key"], batch_size=1000)
+        db_entry = next(asset_keys, None)
+        continuation_token = state["continuation_token"]
+        
+        while True:
+            request_start = time.time()
+            objects, next_token = s3_service.list_files_page(prefix, continuation_token)
+            
+            orphan_keys = []
+            for obj in objects:
+                # Rows whose key sorts before this object have no object in S3
+                while db_entry is not None and db_entry[0] < obj["s3_key"]:
+                    report.write(f"missing\t{db_entry[0]}\t{db_entry[1]}\t\n")
+                    state["missing"] += 1
+                    db_entry = next(asset_keys, None)
+                
+                if db_entry is not None and db_entry[0] == obj["s3_key"]:
+                    if db_entry[1] != obj["size_bytes"]:
+                        report.write(f"size_mismatch\t{obj['s3_key']}\t{db_entry[1]}\t{obj['size_bytes']}\n")
+                        state["size_mismatches"] += 1
+                    db_entry = next(asset_keys, None)
+                elif obj["last_modified"] < orphan_cutoff:
+                    report.write(f"orphan\t{obj['s3_key']}\t\t{obj['size_bytes']}\n")
+                    orphan_keys.append(obj["s3_key"])
+                    state["orphan_bytes"] += obj["size_bytes"]
+            
+            state["objects"] += len(objects)
+            state["orphans"] += len(orphan_keys)
+            
+            if delete_orphans and orphan_keys:
+                # The outbox re-checks references before deleting, so a key
+                # confirmed in the meantime is kept
+                enqueue_s3_deletions(write_db, orphan_keys)
+                write_db.commit()
+                s3_deletion_service.drain()
+            
+            if objects:
+                state["last_key"] = objects[-1]["s3_key"]
+            state["continuation_token"] = next_token
+            if next_token:
+                save_checkpoint(checkpoint_path, state)
+            
+            elapsed = time.time() - start_time
+            print(
+                f"Listed {state['objects']} objects: {state['orphans']} orphans, "
+                f"{state['missing']} missing, {state['size_mismatches']} size mismatches "
+                f"({state['objects'] / max(elapsed, 0.001):.0f} objects/s)",
+                file=sys.stderr,
+            )
+            
+            if not next_token:
+                break
+            continuation_token = next_token
+            
+            # Rate-limit list requests
+            time.sleep(max(0.0, min_request_interval - (time.time() - request_start)))
+        
+        # Remaining rows sort after the last object, so none of them has an object
+        while db_entry is not None:
+            report.write(f"missing\t{db_entry[0]}\t{db_entry[1]}\t\n")
+            state["missing"] += 1
+            db_entry = next(asset_keys, None)
+        
+        # A completed run starts from the beginning next time
+        if checkpoint_path and checkpoint_path.exists():
+            checkpoint_path.unlink()
+    
+    except Exception:
+        write_db.rollback()
+        raise
+    finally:
+        read_db.close()
+        write_db.close()
+        if report is not sys.stdout:
+            report.close()
+    
+    action = "Queued for deletion" if delete_orphans else "Found"
+    print(
+        f"{action} {state['orphans']} orphaned objects ({state['orphan_bytes'] / (1024 * 1024):.1f}MB); "
+        f"{state['missing']} asset keys missing from S3; {state['size_mismatches']} size mismatches",
+        file=sys.stderr,
+    )
+    
+    return {
+        "objects": state["objects"],
+        "orphans": state["orphans"],
+        "orphan_bytes": state["orphan_bytes"],
+        "missing": state["missing"],
+        "size_mismatches": state["size_mismatches"],
+    }
+
+
+def main():
+    """Main function to reconcile S3 with the assets table."""
+    parser = argparse.ArgumentParser(description="Find S3 objects without asset rows and asset rows without S3 objects")
+    parser.add_argument(
+        "--prefix",
+        type=str,
+        default="users/",
+        help="S3 key prefix to reconcile (default: users/)",
+    )
+    parser.add_argument(
+        "--min-age-hours",
+        type=float,
+        default=24.0,
+        help="Ignore objects modified more recently than this (default: 24)",
+    )
+    parser.add_argument(
+        "--delete-orphans",
+        action="store_true",
+        help="Queue orphaned objects for batched deletion",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=5.0,
+        help="Maximum S3 list requests per second (default: 5)",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        type=str,
+        default=None,
+        help="Checkpoint file used to resume an interrupted run",
+    )
+    parser.add_argument(
+        "--report-file",
+        type=str,
+        default=None,
+        help="Write the tab-separated report (kind, key, db size, s3 size) to this file instead of stdout",
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        reconcile_s3(
+            prefix=args.prefix,
+            min_age_hours=args.min_age_hours,
+            delete_orphans=args.delete_orphans,
+            requests_per_second=args.requests_per_second,
+            checkpoint_file=args.checkpoint_file,
+            report_file=args.report_file,
+        )
+    except Exception as e:
+        print(f"Reconciliation failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,22 @@ from pathlib import Path
 backend_path = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(backend_path))
 
+from sqlalchemy import insert, select
+
 from database import SessionLocal, engine
 from models import User
 from database import Base
 
+# Emails per existence check (stays below the bound parameter limit of SQLite)
+EMAIL_LOOKUP_BATCH_SIZE = 5000
+
 
 def read_json_data(json_path: Path) -> list:
     """Read user data from JSON file.
     
     Args:
         json_path: Path to JSON file containing user data
-        
+    
     Returns:
         List of user dictionaries
     """
@@ -28,42 +33,58 @@ def read_json_data(json_path: Path) -> list:
     return data
 
 
+def existing_emails(db_session, emails: list) -> set:
+    """Find which emails already belong to a user.
+    
+    Args:
+        db_session: Database session
+        emails: Emails to look up
+    
+    Returns:
+        Set of emails already in the users table
+    """
+    existing = set()
+    for start in range(0, len(emails), EMAIL_LOOKUP_BATCH_SIZE):
+        batch = emails[start:start + EMAIL_LOOKUP_BATCH_SIZE]
+        existing.update(db_session.scalars(select(User.email).where(User.email.in_(batch))))
+    return existing
+
+
 def insert_users(db_session, users_data: list) -> int:
     """Insert users into database.
     
+    Existing users are found with one query per EMAIL_LOOKUP_BATCH_SIZE
+    emails and the new ones are written with a single bulk INSERT.
+    
     Args:
         db_session: Database session
         users_data: List of user dictionaries
-        
+    
     Returns:
         Number of users inserted
     """
-    inserted_count = 0
+    skipped = existing_emails(db_session, [user_data["email"] for user_data in users_data])
+    new_users = []
     
     for user_data in users_data:
-        # Check if user already exists
-        existing_user = db_session.query(User).filter(
-            User.email == user_data["email"]
-        ).first()
-        
-        if existing_user:
+        if user_data["email"] in skipped:
             print(f"User {user_data['email']} already exists, skipping...")
             continue
         
-        # Create new user
-        user = User(
-            email=user_data["email"],
-            password=user_data["password"],  # Plain text for MVP
-            full_name=user_data["full_name"],
-            role=user_data["role"],
-        )
-        
-        db_session.add(user)
-        inserted_count += 1
+        # Later duplicates of the same email in the file are skipped too
+        skipped.add(user_data["email"])
+        new_users.append({
+            "email": user_data["email"],
+            "password": user_data["password"],  # Plain text for MVP
+            "full_name": user_data["full_name"],
+            "role": user_data["role"],
+        })
         print(f"Created user: {user_data['email']} ({user_data['role']})")
     
+    if new_users:
+        db_session.execute(insert(User), new_users)
     db_session.commit()
-    return inserted_count
+    return len(new_users)
 
 
 def seed_database(json_file: str = None, reset: bool = False):
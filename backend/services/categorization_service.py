@@ -1,15 +1,27 @@
 """Asset categorization service using rules engine."""
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 import os
 
 
-def categorize_asset(filename: str, file_type: str) -> Tuple[str, str]:
+# Logo heuristics based on image header metadata
+LOGO_MAX_SQUARE_DIMENSION = 512  # Small square images are almost always icons/logos
+LOGO_MAX_TRANSPARENT_DIMENSION = 1024  # Transparent artwork this size is typically a logo
+LOGO_SQUARE_TOLERANCE = 0.2  # Aspect ratios within 1 +/- 0.2 count as square
+
+
+def categorize_asset(
+    filename: str,
+    file_type: str,
+    image_metadata: Optional[Dict[str, Any]] = None
+) -> Tuple[str, str]:
     """
     Categorize an asset using rules-based detection.
     
     Args:
         filename: Name of the uploaded file
         file_type: MIME type of the file
+        image_metadata: Optional header metadata from extract_image_metadata
+            (width, height, aspect_ratio, has_transparency, color_depth)
         
     Returns:
         Tuple of (category, categorization_method)
@@ -34,6 +46,8 @@ def categorize_asset(filename: str, file_type: str) -> Tuple[str, str]:
         # Check if it's a logo by filename
         if "logo" in filename_lower:
             return ("logo", "rules")
+        if image_metadata and _looks_like_logo(image_metadata):
+            return ("logo", "rules")
         return ("image", "rules")
     
     # Rule 4: URL detection (if filename looks like a URL)
@@ -43,3 +57,34 @@ def categorize_asset(filename: str, file_type: str) -> Tuple[str, str]:
     # Fallback: pending category
     return ("pending", "rules")
 
+
+
+def _looks_like_logo(image_metadata: Dict[str, Any]) -> bool:
+    """
+    Decide whether image header metadata describes a logo rather than a photo.
+    
+    Small square images and moderately sized images with transparency are
+    treated as logos; large opaque images are treated as general imagery.
+    
+    Args:
+        image_metadata: Header metadata from extract_image_metadata
+        
+    Returns:
+        True if the image is most likely a logo
+    """
+    width = image_metadata.get("width") or 0
+    height = image_metadata.get("height") or 0
+    if not width or not height:
+        return False
+    
+    largest_dimension = max(width, height)
+    aspect_ratio = image_metadata.get("aspect_ratio") or (width / height)
+    is_square = abs(aspect_ratio - 1) <= LOGO_SQUARE_TOLERANCE
+    
+    if is_square and largest_dimension <= LOGO_MAX_SQUARE_DIMENSION:
+        return True
+    
+    if image_metadata.get("has_transparency") and largest_dimension <= LOGO_MAX_TRANSPARENT_DIMENSION:
+        return True
+    
+    return False
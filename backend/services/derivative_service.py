@@ -0,0 +1,285 @@
+"""Derivative service producing email-optimized image renditions."""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+import io
+import multiprocessing
+import threading
+import time
+
+from PIL import Image, ImageOps
+
+from config import settings
+from database import SessionLocal
+from models.asset import Asset
+from services.s3_service import s3_service
+from crud.metrics import record_metric
+
+
+# Renditions generated for each raster image. Images are only ever scaled down,
+# so a source narrower than max_width is recompressed at its own size.
+DERIVATIVE_RENDITIONS = {
+    "email_600": {"max_width": 600, "max_height": None},  # Full-width email image
+    "email_1200": {"max_width": 1200, "max_height": None},  # @2x for high-density displays
+    "thumbnail": {"max_width": 200, "max_height": 200},  # Asset library previews
+}
+
+# Rendition referenced by generated email proofs
+PROOF_RENDITION = "email_600"
+
+# Rendition returned as the asset thumbnail
+THUMBNAIL_RENDITION = "thumbnail"
+
+# Source formats Pillow re-encodes (SVG is vector and is served as uploaded)
+DERIVATIVE_SOURCE_TYPES = {"image/png", "image/jpeg", "image/jpg", "image/gif", "image/webp"}
+
+# JPEG quality for opaque renditions
+JPEG_QUALITY = 80
+
+
+def render_derivatives(data: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Decode an image and encode every rendition in DERIVATIVE_RENDITIONS.
+    
+    Runs in a worker process. Renditions are re-encoded without EXIF, ICC or
+    text chunks; opaque images become progressive JPEGs and images with
+    transparency stay PNG. Animated images are skipped so they keep animating.
+    
+    Args:
+        data: Original image bytes
+    
+    Returns:
+        Dict mapping rendition name to {data, content_type, width, height}
+        (empty if the image cannot be re-encoded)
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        if getattr(source, "n_frames", 1) > 1:
+            return {}
+        
+        # Apply the EXIF orientation before the EXIF block is dropped
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    
+    renditions = {}
+    for name, spec in DERIVATIVE_RENDITIONS.items():
+        rendition = image.copy()
+        rendition.thumbnail(
+            (spec["max_width"], spec["max_height"] or image.height),
+            Image.Resampling.LANCZOS
+        )
+        
+        output = io.BytesIO()
+        if has_alpha:
+            rendition.save(output, format="PNG", optimize=True)
+            content_type = "image/png"
+        else:
+            rendition.save(output, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+            content_type = "image/jpeg"
+        
+        renditions[name] = {
+            "data": output.getvalue(),
+            "content_type": content_type,
+            "width": rendition.width,
+            "height": rendition.height,
+        }
+    return renditions
+
+
+def render_object_derivatives(s3_key: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Download an original from S3 and render its renditions.
+    
+    Runs in a worker process so the original is never held by the API process.
+    
+    Args:
+        s3_key: S3 key of the original object
+        
+    Returns:
+        Rendition dict as returned by render_derivatives
+    """
+    return render_derivatives(s3_service.download_file(s3_key))
+
+
+class DerivativeService:
+    """Service generating and storing derived renditions of uploaded images."""
+    
+    def __init__(self, max_workers: int):
+        """Initialize the service; the process pool is started on first use."""
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Process pool used for decoding and encoding (spawned, not forked)."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+    
+    def supports(self, file_type: Optional[str]) -> bool:
+        """
+        Check whether renditions can be generated for a MIME type.
+        
+        Args:
+            file_type: MIME type of the asset
+        
+        Returns:
+            True if the type is a raster image Pillow can re-encode
+        """
+        return (file_type or "").lower() in DERIVATIVE_SOURCE_TYPES
+    
+    def build_key(self, s3_key: str, rendition: str, content_type: str) -> str:
+        """
+        Build the S3 key of a rendition derived from an original object.
+        
+        Args:
+            s3_key: S3 key of the original object
+            rendition: Rendition name from DERIVATIVE_RENDITIONS
+            content_type: MIME type of the rendition
+        
+        Returns:
+            S3 key in the form derived/{s3_key}/{rendition}.{ext}
+        """
+        extension = "png" if content_type == "image/png" else "jpg"
+        return f"derived/{s3_key}/{rendition}.{extension}"
+    
+    def generate_for_assets(self, asset_ids: Iterable[str]) -> None:
+        """
+        Generate, upload and record renditions for newly uploaded assets.
+        
+        Intended to run as a background task after the upload response is sent.
+        Deduplicated assets share one S3 object, so each object is rendered
+        once and renditions already recorded on another asset are reused.
+        Renditions that are not smaller than the original are discarded.
+        
+        Args:
+            asset_ids: IDs of the assets to process
+        """
+        db = SessionLocal()
+        try:
+            assets = db.query(Asset).filter(
+                Asset.id.in_(list(asset_ids)),
+                Asset.derivatives.is_(None)
+            ).all()
+            assets = [asset for asset in assets if self.supports(asset.file_type)]
+            if not assets:
+                return
+            
+            # Reuse renditions already generated for the same S3 object
+            s3_keys = {asset.s3_key for asset in assets}
+            existing = dict(db.query(Asset.s3_key, Asset.derivatives).filter(
+                Asset.s3_key.in_(s3_keys),
+                Asset.derivatives.is_not(None)
+            ).all())
+            
+            pending = {}
+            for asset in assets:
+                if asset.s3_key in existing:
+                    asset.derivatives = existing[asset.s3_key]
+                else:
+                    pending.setdefault(asset.s3_key, asset.file_size_bytes)
+            
+            start_time = time.time()
+            derived_bytes = 0
+            futures = {
+                s3_key: self.executor.submit(render_object_derivatives, s3_key)
+                for s3_key in pending
+            }
+            
+            for s3_key, future in futures.items():
+                try:
+                    renditions = future.result()
+                except Exception as e:
+                    print(f"[Derivatives] Failed to render {s3_key}: {e}")
+                    renditions = {}
+                
+                derivatives = {}
+                stored_sizes = {}
+                for name, rendition in renditions.items():
+                    size_bytes = len(rendition["data"])
+                    if size_bytes >= pending[s3_key]:
+                        continue
+                    
+                    # Small sources produce identical renditions; store each size once
+                    dimensions = (rendition["width"], rendition["height"])
+                    if dimensions in stored_sizes:
+                        derivatives[name] = stored_sizes[dimensions]
+                        continue
+                    
+                    derived_key = self.build_key(s3_key, name, rendition["content_type"])
+                    s3_service.put_file(derived_key, rendition["data"], rendition["content_type"])
+                    derived_bytes += size_bytes
+                    derivatives[name] = {
+                        "s3_key": derived_key,
+                        "content_type": rendition["content_type"],
+                        "width": rendition["width"],
+                        "height": rendition["height"],
+                        "size_bytes": size_bytes,
+                    }
+                    stored_sizes[dimensions] = derivatives[name]
+                existing[s3_key] = derivatives
+            
+            for asset in assets:
+                asset.derivatives = existing[asset.s3_key]
+            
+            if pending:
+                processing_time = time.time() - start_time
+                source_bytes = sum(pending.values())
+                record_metric(
+                    db=db,
+                    metric_type="derivative_processing_throughput",
+                    metric_value=round(source_bytes / 1024 / max(processing_time, 0.001), 2),  # KB/s
+                    metadata={
+                        "image_count": len(pending),
+                        "source_bytes": source_bytes,
+                        "derived_bytes": derived_bytes,
+                        "processing_time": round(processing_time, 3)
+                    }
+                )
+            
+            db.commit()
+        
+        except Exception as e:
+            db.rollback()
+            print(f"[Derivatives] Failed to generate renditions: {e}")
+        finally:
+            db.close()
+    
+    def get_rendition(self, asset: Asset, rendition: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a recorded rendition of an asset.
+        
+        Args:
+            asset: Asset record
+            rendition: Rendition name from DERIVATIVE_RENDITIONS
+        
+        Returns:
+            Rendition dict (s3_key, content_type, width, height, size_bytes) or None
+        """
+        return (asset.derivatives or {}).get(rendition)
+    
+    def derived_keys(self, assets: List[Asset]) -> List[str]:
+        """
+        List the S3 keys of all renditions recorded on the given assets.
+        
+        Args:
+            assets: Asset records
+        
+        Returns:
+            List of unique derived S3 keys
+        """
+        return list(dict.fromkeys(
+            derivative["s3_key"]
+            for asset in assets
+            for derivative in (asset.derivatives or {}).values()
+        ))
+
+
+# Global derivative service instance
+derivative_service = DerivativeService(max_workers=settings.DERIVATIVE_WORKERS)
@@ -0,0 +1,80 @@
+"""Event loop monitor recording stalls caused by blocking calls."""
+from typing import Optional
+import asyncio
+
+from config import settings
+from database import SessionLocal
+from crud.metrics import record_metric
+
+
+class EventLoopMonitor:
+    """
+    Measure event loop lag and record stalls as event_loop_lag metrics.
+    
+    A task sleeps for a fixed interval and compares when it actually woke up
+    with when it should have; the difference is time the loop spent running
+    something that did not yield (a blocking call in an async handler). Lags
+    above the threshold are recorded in milliseconds.
+    """
+    
+    def __init__(self, interval: float, threshold: float):
+        """Initialize the monitor; the task is started by start()."""
+        self.interval = interval
+        self.threshold = threshold
+        self.stall_count = 0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the monitoring task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - expected
+            if lag >= self.threshold:
+                self.stall_count += 1
+                self.max_lag = max(self.max_lag, lag)
+                # Record from a worker thread without waiting, so sampling continues
+                loop.run_in_executor(None, self._record_stall, lag)
+    
+    def _record_stall(self, lag: float) -> None:
+        db = SessionLocal()
+        try:
+            record_metric(
+                db=db,
+                metric_type="event_loop_lag",
+                metric_value=round(lag * 1000, 2),  # ms
+                metadata={
+                    "threshold_ms": round(self.threshold * 1000, 2),
+                    "interval_ms": round(self.interval * 1000, 2)
+                }
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"[EventLoopMonitor] Failed to record lag: {e}")
+        finally:
+            db.close()
+
+
+# Global event loop monitor instance
+event_loop_monitor = EventLoopMonitor(
+    interval=settings.EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+    threshold=settings.EVENT_LOOP_LAG_THRESHOLD_SECONDS
+)
@@ -12,7 +12,7 @@ from database import engine
 
 def check_s3_health() -> Dict[str, Any]:
     """
-    Check S3 service health by attempting to list bucket contents.
+    Check storage health by attempting to list bucket contents.
     
     Returns:
         Dict with status ("healthy", "degraded", "down"), response_time_ms, and optional error_message
@@ -21,10 +21,7 @@ def check_s3_health() -> Dict[str, Any]:
     
     try:
         # Try to list bucket contents (lightweight operation)
-        s3_service.s3_client.list_objects_v2(
-            Bucket=s3_service.bucket_name,
-            MaxKeys=1
-        )
+        s3_service.list_files_page("", max_keys=1)
         
         response_time_ms = int((time.time() - start_time) * 1000)
         
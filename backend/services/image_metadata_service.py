@@ -0,0 +1,327 @@
+"""Image header parsing service for extracting dimensions without decoding images."""
+import math
+import re
+import struct
+from typing import Any, BinaryIO, Dict, Optional
+
+
+# PNG color types that carry an alpha channel (grayscale+alpha, RGBA)
+PNG_ALPHA_COLOR_TYPES = {4, 6}
+
+# Channels per PNG color type, used to compute bits per pixel
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# JPEG start-of-frame markers (SOF0-SOF15 excluding DHT, JPG and DAC)
+JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+}
+
+# Maximum number of bytes inspected when looking for the root <svg> element
+SVG_HEADER_BYTES = 4096
+
+# Upper bound on header blocks walked before giving up on a malformed file
+MAX_HEADER_BLOCKS = 1024
+
+
+def extract_image_metadata(file_obj: BinaryIO, filename: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Extract image dimensions and pixel format from a file's header.
+
+    Only the bytes needed to locate the header are read; chunks and segments
+    that precede it are skipped with seeks, so the cost is proportional to the
+    header size rather than the file size. The file position is restored
+    before returning.
+
+    Args:
+        file_obj: Seekable binary file object positioned anywhere
+        filename: Original filename (used to recognize SVG documents)
+
+    Returns:
+        Dict with width, height, aspect_ratio, has_transparency and color_depth,
+        or None if the format is unsupported or the header is malformed
+    """
+    start_position = file_obj.tell()
+
+    try:
+        file_obj.seek(0)
+        signature = file_obj.read(16)
+
+        if signature.startswith(b"\x89PNG\r\n\x1a\n"):
+            metadata = _parse_png(file_obj)
+        elif signature.startswith(b"\xff\xd8"):
+            metadata = _parse_jpeg(file_obj)
+        elif signature[:6] in (b"GIF87a", b"GIF89a"):
+            metadata = _parse_gif(file_obj)
+        elif signature[:4] == b"RIFF" and signature[8:12] == b"WEBP":
+            metadata = _parse_webp(file_obj)
+        elif filename.lower().endswith(".svg") or b"<svg" in signature or b"<?xml" in signature:
+            metadata = _parse_svg(file_obj)
+        else:
+            metadata = None
+    except (struct.error, ValueError, OverflowError, OSError):
+        metadata = None
+    finally:
+        file_obj.seek(start_position)
+
+    if not metadata or not metadata.get("width") or not metadata.get("height"):
+        return None
+
+    metadata["aspect_ratio"] = round(metadata["width"] / metadata["height"], 4)
+    return metadata
+
+
+def _read_exact(file_obj: BinaryIO, size: int) -> bytes:
+    """
+    Read exactly size bytes from a file object.
+
+    Args:
+        file_obj: Binary file object
+        size: Number of bytes to read
+
+    Returns:
+        The bytes read
+
+    Raises:
+        ValueError: If the file ends before size bytes are available
+    """
+    data = file_obj.read(size)
+    if len(data) != size:
+        raise ValueError("Unexpected end of image header")
+    return data
+
+
+def _parse_png(file_obj: BinaryIO) -> Dict[str, Any]:
+    """
+    Parse a PNG IHDR chunk and scan ancillary chunks for transparency.
+
+    Args:
+        file_obj: Binary file object containing a PNG image
+
+    Returns:
+        Dict with width, height, has_transparency and color_depth
+    """
+    file_obj.seek(8)
+    length, chunk_type = struct.unpack(">I4s", _read_exact(file_obj, 8))
+    if chunk_type != b"IHDR" or length < 13:
+        raise ValueError("PNG is missing IHDR chunk")
+
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", _read_exact(file_obj, 10))
+    has_transparency = color_type in PNG_ALPHA_COLOR_TYPES
+
+    # Skip the rest of IHDR (3 bytes) plus its CRC, then walk chunk headers
+    # until image data begins; a tRNS chunk marks palette/key transparency.
+    file_obj.seek(length - 10 + 4, 1)
+    for _ in range(MAX_HEADER_BLOCKS):
+        if has_transparency:
+            break
+        header = file_obj.read(8)
+        if len(header) < 8:
+            break
+        length, chunk_type = struct.unpack(">I4s", header)
+        if chunk_type == b"tRNS":
+            has_transparency = True
+        elif chunk_type in (b"IDAT", b"IEND"):
+            break
+        file_obj.seek(length + 4, 1)
+
+    return {
+        "width": width,
+        "height": height,
+        "has_transparency": has_transparency,
+        "color_depth": bit_depth * PNG_CHANNELS.get(color_type, 1),
+    }
+
+
+def _parse_jpeg(file_obj: BinaryIO) -> Dict[str, Any]:
+    """
+    Walk JPEG marker segments until the start-of-frame segment.
+
+    Args:
+        file_obj: Binary file object containing a JPEG image
+
+    Returns:
+        Dict with width, height, has_transparency and color_depth
+    """
+    file_obj.seek(2)
+    for _ in range(MAX_HEADER_BLOCKS):
+        marker_prefix = _read_exact(file_obj, 1)
+        if marker_prefix != b"\xff":
+            raise ValueError("Invalid JPEG marker")
+
+        marker = _read_exact(file_obj, 1)[0]
+        # Fill bytes and standalone markers carry no length field
+        if marker == 0xFF:
+            file_obj.seek(-1, 1)
+            continue
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker in (0xD9, 0xDA):
+            break
+
+        (segment_length,) = struct.unpack(">H", _read_exact(file_obj, 2))
+        if marker in JPEG_SOF_MARKERS:
+            precision, height, width, components = struct.unpack(">BHHB", _read_exact(file_obj, 6))
+            return {
+                "width": width,
+                "height": height,
+                "has_transparency": False,
+                "color_depth": precision * components,
+            }
+        file_obj.seek(segment_length - 2, 1)
+
+    raise ValueError("JPEG start-of-frame segment not found")
+
+
+def _parse_gif(file_obj: BinaryIO) -> Dict[str, Any]:
+    """
+    Parse a GIF logical screen descriptor and its first graphic control block.
+
+    Args:
+        file_obj: Binary file object containing a GIF image
+
+    Returns:
+        Dict with width, height, has_transparency and color_depth
+    """
+    file_obj.seek(6)
+    width, height, packed = struct.unpack("<HHB", _read_exact(file_obj, 5))
+    file_obj.seek(2, 1)  # Background color index and pixel aspect ratio
+
+    color_depth = (packed & 0x07) + 1
+    if packed & 0x80:
+        file_obj.seek(3 * (1 << color_depth), 1)  # Global color table
+
+    has_transparency = False
+    for _ in range(MAX_HEADER_BLOCKS):
+        introducer = file_obj.read(1)
+        if introducer != b"\x21":  # Stop at image descriptor, trailer or EOF
+            break
+        label = _read_exact(file_obj, 1)
+        if label == b"\xf9":
+            block_size, flags = struct.unpack("<BB", _read_exact(file_obj, 2))
+            has_transparency = bool(flags & 0x01)
+            file_obj.seek(block_size - 1, 1)
+            break
+        # Skip data sub-blocks of any other extension
+        while True:
+            (sub_block_size,) = struct.unpack("<B", _read_exact(file_obj, 1))
+            if sub_block_size == 0:
+                break
+            file_obj.seek(sub_block_size, 1)
+
+    return {
+        "width": width,
+        "height": height,
+        "has_transparency": has_transparency,
+        "color_depth": color_depth,
+    }
+
+
+def _parse_webp(file_obj: BinaryIO) -> Dict[str, Any]:
+    """
+    Parse the first chunk of a WebP RIFF container (VP8, VP8L or VP8X).
+
+    Args:
+        file_obj: Binary file object containing a WebP image
+
+    Returns:
+        Dict with width, height, has_transparency and color_depth
+    """
+    file_obj.seek(12)
+    chunk_type = _read_exact(file_obj, 4)
+    file_obj.seek(4, 1)  # Chunk size
+
+    if chunk_type == b"VP8X":
+        data = _read_exact(file_obj, 10)
+        width = int.from_bytes(data[4:7], "little") + 1
+        height = int.from_bytes(data[7:10], "little") + 1
+        has_alpha = bool(data[0] & 0x10)
+        return {
+            "width": width,
+            "height": height,
+            "has_transparency": has_alpha,
+            "color_depth": 32 if has_alpha else 24,
+        }
+
+    if chunk_type == b"VP8L":
+        data = _read_exact(file_obj, 5)
+        if data[0] != 0x2F:
+            raise ValueError("Invalid VP8L signature")
+        bits = int.from_bytes(data[1:5], "little")
+        has_alpha = bool((bits >> 28) & 0x01)
+        return {
+            "width": (bits & 0x3FFF) + 1,
+            "height": ((bits >> 14) & 0x3FFF) + 1,
+            "has_transparency": has_alpha,
+            "color_depth": 32 if has_alpha else 24,
+        }
+
+    if chunk_type == b"VP8 ":
+        data = _read_exact(file_obj, 10)
+        if data[3:6] != b"\x9d\x01\x2a":
+            raise ValueError("Invalid VP8 start code")
+        width, height = struct.unpack("<HH", data[6:10])
+        return {
+            "width": width & 0x3FFF,
+            "height": height & 0x3FFF,
+            "has_transparency": False,
+            "color_depth": 24,
+        }
+
+    raise ValueError("Unsupported WebP chunk")
+
+
+def _parse_svg(file_obj: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Parse width/height or viewBox attributes from the root <svg> element.
+
+    Args:
+        file_obj: Binary file object containing an SVG document
+
+    Returns:
+        Dict with width, height, has_transparency and color_depth, or None
+        if the root element has no usable size attributes
+    """
+    file_obj.seek(0)
+    head = file_obj.read(SVG_HEADER_BYTES).decode("utf-8", errors="ignore")
+
+    match = re.search(r"<svg\b[^>]*>", head, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return None
+    tag = match.group(0)
+
+    def attribute(name: str) -> Optional[str]:
+        attr_match = re.search(rf'\b{name}\s*=\s*["\']([^"\']+)["\']', tag)
+        return attr_match.group(1) if attr_match else None
+
+    def dimension(number: str) -> Optional[float]:
+        # Sizes must be positive and finite (rejects "inf", "nan" and overflowing digit runs)
+        value = float(number)
+        return value if math.isfinite(value) and value > 0 else None
+
+    def length(value: Optional[str]) -> Optional[float]:
+        # Percentages and relative units cannot be resolved without a viewport
+        if not value or value.strip().endswith("%"):
+            return None
+        number_match = re.match(r"\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$", value)
+        return dimension(number_match.group(1)) if number_match else None
+
+    width = length(attribute("width"))
+    height = length(attribute("height"))
+
+    if not (width and height):
+        view_box = attribute("viewBox")
+        if view_box:
+            parts = re.split(r"[\s,]+", view_box.strip())
+            if len(parts) == 4:
+                width, height = dimension(parts[2]), dimension(parts[3])
+
+    if not (width and height):
+        return None
+
+    return {
+        "width": int(round(width)),
+        "height": int(round(height)),
+        "has_transparency": True,  # SVG canvases are transparent by default
+        "color_depth": None,
+    }
@@ -0,0 +1,308 @@
+"""Local filesystem storage backend for development and offline benchmarks."""
+import base64
+import hashlib
+import hmac
+import json
+import mmap
+import os
+import secrets
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from services.storage_backend import StorageBackend
+
+
+# Buffer size used when copying upload streams to disk
+COPY_BUFFER_SIZE = 1024 * 1024  # 1MB
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Storage backend keeping objects as files under a root directory.
+    
+    Objects live under {root}/objects/{key} with their content type in
+    {root}/metadata/{key}.json. Reads are memory-mapped. Signed URLs point at
+    the /api/storage routes and carry an HMAC-SHA256 signature and expiry,
+    mirroring S3 pre-signed GET URLs and POST policies.
+    """
+    
+    name = "local"
+    
+    def __init__(self, root: str, base_url: str, signing_key: Optional[str] = None):
+        """
+        Initialize the backend.
+        
+        Args:
+            root: Directory holding objects and metadata
+            base_url: Public base URL of this API, used in signed URLs
+            signing_key: Secret used to sign URLs and upload policies (random
+                per instance when not given)
+        """
+        self.root = Path(root).resolve()
+        self.objects_root = self.root / "objects"
+        self.metadata_root = self.root / "metadata"
+        self.base_url = base_url.rstrip("/")
+        self._signing_key = signing_key.encode() if signing_key else secrets.token_bytes(32)
+        self.objects_root.mkdir(parents=True, exist_ok=True)
+        self.metadata_root.mkdir(parents=True, exist_ok=True)
+    
+    def _object_path(self, key: str) -> Path:
+        path = (self.objects_root / key).resolve()
+        if self.objects_root not in path.parents:
+            raise Exception(f"Invalid storage key: {key}")
+        return path
+    
+    def _metadata_path(self, key: str) -> Path:
+        return self.metadata_root / f"{key}.json"
+    
+    def _remove_empty_parents(self, path: Path, root: Path) -> None:
+        parent = path.parent
+        while parent != root:
+            try:
+                parent.rmdir()
+            except OSError:
+                return
+            parent = parent.parent
+    
+    def _write_metadata(self, key: str, content_type: str, etag: str) -> None:
+        metadata_path = self._metadata_path(key)
+        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(metadata_path, "w") as f:
+            json.dump({"content_type": content_type, "etag": etag}, f)
+    
+    def sign(self, payload: str) -> str:
+        """
+        Sign a payload with the backend signing key.
+        
+        Args:
+            payload: String to sign
+        
+        Returns:
+            URL-safe base64 HMAC-SHA256 signature
+        """
+        digest = hmac.new(self._signing_key, payload.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+    
+    def verify_get_signature(self, key: str, expires: int, signature: str) -> bool:
+        """
+        Check a signed download URL.
+        
+        Args:
+            key: Object key from the URL path
+            expires: Expiry timestamp from the URL
+            signature: Signature from the URL
+        
+        Returns:
+            True if the signature matches and has not expired
+        """
+        return expires >= time.time() and hmac.compare_digest(self.sign(f"GET\n{key}\n{expires}"), signature)
+    
+    def verify_post_policy(self, policy: str, signature: str) -> Optional[Dict[str, Any]]:
+        """
+        Check and decode a signed upload policy.
+        
+        Args:
+            policy: Base64-encoded JSON policy from the form
+            signature: Signature from the form
+        
+        Returns:
+            Decoded policy (key, content_type, max_size, expires), or None if
+            the signature does not match or the policy has expired
+        """
+        if not hmac.compare_digest(self.sign(f"POST\n{policy}"), signature):
+            return None
+        decoded = json.loads(base64.b64decode(policy))
+        if decoded["expires"] < time.time():
+            return None
+        return decoded
+    
+    def put_stream(
+        self,
+        key: str,
+        file_obj: BinaryIO,
+        content_type: str,
+        size_bytes: Optional[int] = None,
+        sha256: Optional[str] = None
+    ) -> None:
+        """
+        Copy a file object to disk in chunks and atomically move it into place.
+        
+        Raises:
+            Exception: If the content does not match the expected SHA-256
+        """
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                while True:
+                    chunk = file_obj.read(COPY_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    tmp_file.write(chunk)
+            if sha256 and digest.hexdigest() != sha256:
+                raise Exception("Failed to upload file to local storage: checksum mismatch")
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        
+        self._write_metadata(key, content_type, digest.hexdigest())
+    
+    def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        """Write bytes to disk atomically."""
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".upload-{path.name}")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._write_metadata(key, content_type, hashlib.sha256(data).hexdigest())
+    
+    def _mapped(self, key: str) -> Tuple[BinaryIO, Optional[mmap.mmap]]:
+        try:
+            f = open(self._object_path(key), "rb")
+        except FileNotFoundError:
+            raise Exception(f"Failed to read file from local storage: {key} not found")
+        if os.fstat(f.fileno()).st_size == 0:
+            return f, None
+        return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def get(self, key: str) -> bytes:
+        """Read a whole object through a memory map."""
+        f, mapped = self._mapped(key)
+        with f:
+            if mapped is None:
+                return b""
+            with mapped:
+                return mapped[:]
+    
+    def get_range(self, key: str, length: int) -> bytes:
+        """Read leading bytes through a memory map (only those pages are touched)."""
+        f, mapped = self._mapped(key)
+        with f:
+            if mapped is None:
+                return b""
+            with mapped:
+                return mapped[:length]
+    
+    def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream an object in chunks sliced from a memory map."""
+        f, mapped = self._mapped(key)
+        with f:
+            if mapped is None:
+                return
+            with mapped:
+                for offset in range(0, len(mapped), chunk_size):
+                    yield mapped[offset:offset + chunk_size]
+    
+    def head(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get object size from the filesystem and content type from metadata."""
+        try:
+            size_bytes = self._object_path(key).stat().st_size
+        except FileNotFoundError:
+            return None
+        
+        metadata = {}
+        try:
+            with open(self._metadata_path(key), "r") as f:
+                metadata = json.load(f)
+        except FileNotFoundError:
+            pass
+        
+        return {
+            "size_bytes": size_bytes,
+            "content_type": metadata.get("content_type"),
+            "etag": metadata.get("etag", ""),
+        }
+    
+    def delete(self, key: str) -> None:
+        """Delete an object, its metadata and any directories left empty."""
+        path = self._object_path(key)
+        metadata_path = self._metadata_path(key)
+        try:
+            path.unlink(missing_ok=True)
+            metadata_path.unlink(missing_ok=True)
+        except OSError as e:
+            raise Exception(f"Failed to delete file from local storage: {str(e)}")
+        self._remove_empty_parents(path, self.objects_root)
+        self._remove_empty_parents(metadata_path, self.metadata_root)
+    
+    def delete_many(self, keys: List[str]) -> Dict[str, str]:
+        """Delete objects one by one, collecting failures."""
+        errors = {}
+        for key in keys:
+            try:
+                self.delete(key)
+            except Exception as e:
+                errors[key] = str(e)
+        return errors
+    
+    def _iter_keys(self, directory: Path, relative: str, prefix: str, start_after: str) -> Iterator[str]:
+        # Directories sort as "name/" so the walk yields keys in binary key order
+        entries = sorted(
+            (entry.name + "/" if entry.is_dir() else entry.name, entry)
+            for entry in os.scandir(directory)
+            if not entry.name.startswith(".upload-")
+        )
+        for name, entry in entries:
+            key = relative + name
+            if not (key.startswith(prefix) or prefix.startswith(key)):
+                continue
+            if entry.is_dir():
+                # Skip subtrees whose keys all sort before start_after
+                if key < start_after and not start_after.startswith(key):
+                    continue
+                yield from self._iter_keys(Path(entry.path), key, prefix, start_after)
+            elif key > start_after and key.startswith(prefix):
+                yield key
+    
+    def list_page(
+        self,
+        prefix: str,
+        continuation_token: Optional[str] = None,
+        max_keys: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List objects in key order; the continuation token is the last key returned."""
+        objects = []
+        for key in self._iter_keys(self.objects_root, "", prefix, continuation_token or ""):
+            if len(objects) == max_keys:
+                return objects, objects[-1]["s3_key"]
+            stat = self._object_path(key).stat()
+            objects.append({
+                "s3_key": key,
+                "size_bytes": stat.st_size,
+                "last_modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            })
+        return objects, None
+    
+    def presign_get(self, key: str, expires_in: int) -> str:
+        """Generate a signed URL served by GET /api/storage/objects/{key}."""
+        expires = int(time.time()) + expires_in
+        query = urlencode({"expires": expires, "signature": self.sign(f"GET\n{key}\n{expires}")})
+        return f"{self.base_url}/api/storage/objects/{quote(key)}?{query}"
+    
+    def presign_post(self, key: str, content_type: str, max_size: int, expires_in: int) -> Dict[str, Any]:
+        """Generate a signed form upload policy accepted by POST /api/storage/upload."""
+        policy = base64.b64encode(json.dumps({
+            "key": key,
+            "content_type": content_type,
+            "max_size": max_size,
+            "expires": int(time.time()) + expires_in,
+        }).encode()).decode()
+        return {
+            "url": f"{self.base_url}/api/storage/upload",
+            "fields": {
+                "key": key,
+                "Content-Type": content_type,
+                "policy": policy,
+                "signature": self.sign(f"POST\n{policy}"),
+            },
+        }
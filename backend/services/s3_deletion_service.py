@@ -0,0 +1,211 @@
+"""S3 deletion service draining the s3_deletions outbox."""
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+import threading
+
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from models.asset import Asset
+from models.s3_deletion import S3Deletion
+from services.s3_service import s3_service, DELETE_OBJECTS_MAX_KEYS
+from services.derivative_service import derivative_service
+
+
+# Exponential backoff for failed deletions: 30s, 60s, 120s, ... capped at 1 hour
+RETRY_BACKOFF_BASE_SECONDS = 30
+RETRY_BACKOFF_MAX_SECONDS = 3600
+
+# Session.info flag set when a transaction enqueued deletions
+ENQUEUED_FLAG = "s3_deletions_enqueued"
+
+
+def enqueue_s3_deletions(db: Session, s3_keys: Iterable[str]) -> None:
+    """
+    Record S3 objects to delete in the session's current transaction.
+    
+    The objects are deleted by the background worker only if the transaction
+    commits, so a rolled-back request never removes data.
+    
+    Args:
+        db: Database session
+        s3_keys: S3 object keys to delete
+    """
+    rows = [{"s3_key": s3_key} for s3_key in dict.fromkeys(s3_keys)]
+    if rows:
+        db.connection().execute(insert(S3Deletion.__table__), rows)
+        db.info[ENQUEUED_FLAG] = True
+
+
+def cancel_s3_deletions(db: Session, s3_keys: Iterable[str]) -> None:
+    """
+    Drop pending deletions of S3 objects that are about to be referenced again.
+    
+    Upload keys are content-addressed, so a re-upload can target an object
+    that is still queued for deletion. Call this in the transaction that
+    inserts the referencing asset rows, before the objects are written. On
+    PostgreSQL the DELETE waits for a worker batch holding any of the rows,
+    so once it returns the objects are either kept or already gone (and
+    written again by the caller); the worker does not remove them later.
+    
+    Args:
+        db: Database session
+        s3_keys: S3 object keys the caller will reference
+    """
+    s3_keys = list(dict.fromkeys(s3_keys))
+    if not s3_keys:
+        return
+    
+    # Only write when something is queued, so ordinary uploads take no write lock here
+    pending = list(db.scalars(select(S3Deletion.id).where(S3Deletion.s3_key.in_(s3_keys))))
+    if pending:
+        db.execute(delete(S3Deletion).where(S3Deletion.id.in_(pending)))
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _enqueue_deleted_asset_objects(session: Session, flush_context) -> None:
+    """Enqueue S3 objects of deleted assets, including ORM cascade deletes."""
+    deleted_assets = [obj for obj in session.deleted if isinstance(obj, Asset)]
+    if not deleted_assets:
+        return
+    
+    # Deduplicated uploads share one S3 object; keep it while any row references it
+    s3_keys = {asset.s3_key for asset in deleted_assets}
+    still_referenced = set(session.connection().scalars(
+        select(Asset.s3_key).where(Asset.s3_key.in_(s3_keys))
+    ))
+    orphaned = {asset.s3_key: asset for asset in deleted_assets if asset.s3_key not in still_referenced}
+    
+    enqueue_s3_deletions(
+        session,
+        list(orphaned) + derivative_service.derived_keys(list(orphaned.values()))
+    )
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _notify_deletion_worker(session: Session) -> None:
+    """Wake the deletion worker once enqueued deletions are committed."""
+    if session.info.pop(ENQUEUED_FLAG, False):
+        s3_deletion_service.notify()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _clear_enqueued_flag(session: Session) -> None:
+    """Forget enqueued deletions that were rolled back."""
+    session.info.pop(ENQUEUED_FLAG, None)
+
+
+class S3DeletionService:
+    """Background worker deleting outbox objects with batched DeleteObjects calls."""
+    
+    def __init__(self, poll_interval: float, batch_size: int = DELETE_OBJECTS_MAX_KEYS):
+        """Initialize the worker; the thread is started by start()."""
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Start the background worker thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="s3-deletions", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the background worker thread.
+        
+        Args:
+            timeout: Seconds to wait for an in-flight batch to finish
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def notify(self) -> None:
+        """Wake the worker to drain newly committed deletions."""
+        self._wakeup.set()
+    
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            try:
+                self.drain()
+            except Exception as e:
+                print(f"[S3Deletions] Failed to drain outbox: {e}")
+            self._wakeup.wait(self.poll_interval)
+    
+    def drain(self) -> int:
+        """
+        Process due outbox rows until none are left.
+        
+        Returns:
+            Number of outbox rows processed
+        """
+        processed = 0
+        while not self._stopping.is_set():
+            batch_count = self.process_batch()
+            processed += batch_count
+            if batch_count < self.batch_size:
+                break
+        return processed
+    
+    def process_batch(self) -> int:
+        """
+        Delete one batch of due outbox objects from S3.
+        
+        Deleted keys are removed from the outbox. Failed keys stay queued with
+        exponential backoff. Keys referenced again by an asset since they were
+        enqueued are dropped without being deleted. Rows stay locked until the
+        batch commits, so uploads cancelling them (cancel_s3_deletions) wait
+        for the S3 call instead of racing it.
+        
+        Returns:
+            Number of outbox rows processed
+        """
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            rows = db.query(S3Deletion).filter(
+                S3Deletion.next_attempt_at <= now
+            ).order_by(S3Deletion.next_attempt_at).limit(self.batch_size).with_for_update(skip_locked=True).all()
+            if not rows:
+                return 0
+            
+            s3_keys = list(dict.fromkeys(row.s3_key for row in rows))
+            referenced = set(db.scalars(select(Asset.s3_key).where(Asset.s3_key.in_(s3_keys))))
+            errors = s3_service.delete_files([s3_key for s3_key in s3_keys if s3_key not in referenced])
+            
+            for row in rows:
+                error = errors.get(row.s3_key)
+                if error is None:
+                    db.delete(row)
+                    continue
+                row.attempts += 1
+                row.last_error = error
+                row.next_attempt_at = now + timedelta(
+                    seconds=min(RETRY_BACKOFF_BASE_SECONDS * 2 ** (row.attempts - 1), RETRY_BACKOFF_MAX_SECONDS)
+                )
+            
+            db.commit()
+            
+            if errors:
+                print(f"[S3Deletions] {len(errors)} of {len(s3_keys)} objects failed to delete, retrying later")
+            return len(rows)
+        
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# Global S3 deletion worker instance
+s3_deletion_service = S3DeletionService(poll_interval=settings.S3_DELETION_POLL_SECONDS)
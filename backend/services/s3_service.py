@@ -1,96 +1,504 @@
 """S3 service for file uploads and management."""
-import boto3
-from botocore.exceptions import ClientError, BotoCoreError
-from typing import Tuple, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple, Optional
+from collections import OrderedDict
+import hashlib
+import io
 import mimetypes
-import os
+import threading
+import time
+import uuid
 
 from config import settings
+from services.storage_backend import StorageBackend, create_storage_backend
+
+
+# Block size used when hashing upload streams
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Maximum number of keys accepted by one DeleteObjects request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+
+class FileTooLargeError(Exception):
+    """Raised when a streamed upload exceeds the maximum allowed size."""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"File size exceeds maximum allowed size of {max_size} bytes")
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Read-only stream wrapper that hashes and counts bytes as they are read.
+    
+    Raises FileTooLargeError as soon as more than max_size bytes have been read,
+    so oversized uploads are rejected without reading the rest of the stream.
+    The wrapper is deliberately not seekable so transfers consume it sequentially.
+    """
+    
+    def __init__(self, file_obj: BinaryIO, max_size: Optional[int] = None):
+        self._file = file_obj
+        self._max_size = max_size
+        self._hash = hashlib.sha256()
+        self.size_bytes = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self.size_bytes += len(data)
+        if self._max_size is not None and self.size_bytes > self._max_size:
+            raise FileTooLargeError(self._max_size)
+        self._hash.update(data)
+        return data
+    
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    
+    @property
+    def sha256(self) -> str:
+        """Hex digest of the bytes read so far."""
+        return self._hash.hexdigest()
+
+
+
+class PresignedUrlCache:
+    """
+    Bounded in-process cache of pre-signed GET URLs keyed by S3 key.
+    
+    A cached URL is returned while it has at least min_remaining seconds of
+    validity left; otherwise it is re-signed. Least recently used entries are
+    evicted once max_entries is reached.
+    """
+    
+    def __init__(
+        self,
+        sign: Callable[[str, int], str],
+        expires_in: int,
+        min_remaining: int,
+        max_entries: int
+    ):
+        self._sign = sign
+        self._expires_in = expires_in
+        self._min_remaining = min_remaining
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_many(self, s3_keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Get URLs for many keys, signing all misses in one pass.
+        
+        Args:
+            s3_keys: S3 object keys
+        
+        Returns:
+            Dict mapping each S3 key to a pre-signed URL
+        """
+        now = time.time()
+        urls = {}
+        missing = []
+        
+        with self._lock:
+            for s3_key in s3_keys:
+                if s3_key in urls:
+                    continue
+                entry = self._entries.get(s3_key)
+                if entry and entry[1] - now >= self._min_remaining:
+                    self._entries.move_to_end(s3_key)
+                    urls[s3_key] = entry[0]
+                    self.hits += 1
+                else:
+                    missing.append(s3_key)
+                    self.misses += 1
+        
+        if not missing:
+            return urls
+        
+        # Sign outside the lock; signing is pure CPU and needs no coordination
+        expires_at = now + self._expires_in
+        signed = [(s3_key, self._sign(s3_key, self._expires_in)) for s3_key in missing]
+        
+        with self._lock:
+            for s3_key, url in signed:
+                self._entries[s3_key] = (url, expires_at)
+                self._entries.move_to_end(s3_key)
+                urls[s3_key] = url
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        
+        return urls
+    
+    def get(self, s3_key: str) -> str:
+        """
+        Get the URL for a single key.
+        
+        Args:
+            s3_key: S3 object key
+        
+        Returns:
+            Pre-signed URL
+        """
+        return self.get_many([s3_key])[s3_key]
+    
+    def invalidate(self, s3_key: str) -> None:
+        """
+        Drop the cached URL for a key.
+        
+        Args:
+            s3_key: S3 object key
+        """
+        with self._lock:
+            self._entries.pop(s3_key, None)
 
 
 class S3Service:
-    """Service for interacting with AWS S3."""
-    
-    def __init__(self):
-        """Initialize S3 client with credentials from settings."""
-        self.bucket_name = settings.AWS_S3_BUCKET
-        self.region = settings.AWS_REGION
-        
-        # Initialize S3 client
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=self.region
+    """
+    Service for storing asset files.
+    
+    Key layout, hashing, size limits and URL caching live here; object
+    operations are delegated to the configured StorageBackend (AWS S3, or
+    the local filesystem when STORAGE_BACKEND is "local").
+    """
+    
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        """Initialize the storage backend selected in settings."""
+        self.backend = backend or create_storage_backend(settings.STORAGE_BACKEND)
+        
+        # Pre-signed GET URLs are generated on read and cached until close to expiry
+        self.url_cache = PresignedUrlCache(
+            sign=self.generate_presigned_url,
+            expires_in=settings.PRESIGNED_URL_EXPIRATION_SECONDS,
+            min_remaining=settings.PRESIGNED_URL_MIN_REMAINING_SECONDS,
+            max_entries=settings.PRESIGNED_URL_CACHE_SIZE
         )
     
-    def upload_file(
+    def hash_file(self, file_obj: BinaryIO, max_size: Optional[int] = None) -> Tuple[int, str]:
+        """
+        Compute size and SHA-256 of a seekable file in one streaming pass.
+        
+        The file position is restored afterwards so the file can be uploaded.
+        
+        Args:
+            file_obj: Seekable binary file object positioned at the start of the content
+            max_size: Optional maximum allowed size in bytes
+        
+        Returns:
+            Tuple of (size_bytes, sha256_hex)
+        
+        Raises:
+            FileTooLargeError: As soon as more than max_size bytes have been read
+        """
+        start_position = file_obj.tell()
+        reader = HashingReader(file_obj, max_size=max_size)
+        try:
+            while reader.read(HASH_CHUNK_SIZE):
+                pass
+        finally:
+            file_obj.seek(start_position)
+        return reader.size_bytes, reader.sha256
+    
+    def hash_stored_file(self, s3_key: str) -> str:
+        """
+        Compute the SHA-256 of a stored object by streaming it in chunks.
+        
+        Args:
+            s3_key: S3 object key
+        
+        Returns:
+            SHA-256 hex digest of the object content
+        """
+        digest = hashlib.sha256()
+        for chunk in self.iter_file(s3_key, HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        return digest.hexdigest()
+    
+    def build_key(self, user_id: str, filename: str, unique_id: Optional[str] = None) -> str:
+        """
+        Build the S3 key for an uploaded file.
+        
+        Keys have the form users/{user_id}/{unique_id}/{filename}, where unique_id
+        is the content SHA-256 for deduplicated uploads (or a random ID when the
+        hash is not known up front), so same-named files never overwrite each other.
+        
+        Args:
+            user_id: ID of the user uploading the file
+            filename: Original filename
+            unique_id: Content hash or other unique ID (random if not provided)
+        
+        Returns:
+            S3 object key
+        """
+        return f"users/{user_id}/{unique_id or uuid.uuid4().hex}/{filename}"
+    
+    def upload_stream(
         self,
-        file_content: bytes,
+        file_obj: BinaryIO,
         filename: str,
         user_id: str,
-        content_type: Optional[str] = None
-    ) -> Tuple[str, str]:
+        content_type: Optional[str] = None,
+        max_size: Optional[int] = None,
+        size_bytes: Optional[int] = None,
+        sha256: Optional[str] = None
+    ) -> Tuple[str, str, int, str]:
         """
-        Upload file to S3 and generate pre-signed URL.
+        Stream a file object to storage in chunks and generate pre-signed URL.
+        
+        The file is never fully loaded into memory. Seekable files (such as the
+        spooled temp files behind FastAPI uploads) are hashed in one pass that
+        enforces max_size before any storage traffic (skipped when size_bytes
+        and sha256 were already computed with hash_file), then stored under a
+        content-addressed key with the hash as integrity checksum. The hash is
+        needed before the transfer (it names the key, lets callers skip content
+        they already stored and is sent as the PUT checksum), so it cannot come
+        from the read loop that feeds the upload; the extra pass reads the local
+        spooled file, not the network.
+        Non-seekable streams are hashed, size-checked and uploaded in a single pass.
         
         Args:
-            file_content: File content as bytes
+            file_obj: Readable binary file object positioned at the start of the content
             filename: Original filename
             user_id: ID of the user uploading the file
             content_type: MIME type of the file (auto-detected if not provided)
-            
+            max_size: Optional maximum allowed size in bytes
+            size_bytes: Size from a previous hash_file call
+            sha256: SHA-256 hex digest from a previous hash_file call
+        
         Returns:
-            Tuple of (s3_key, s3_url) where s3_url is a pre-signed URL (7 day expiration)
-            
+            Tuple of (s3_key, s3_url, size_bytes, sha256_hex) where s3_url is a
+            cached pre-signed URL
+        
         Raises:
-            Exception: If S3 upload fails
+            FileTooLargeError: If the stream exceeds max_size
+            Exception: If the upload fails
         """
-        # Generate unique S3 key: users/{user_id}/{filename}
-        s3_key = f"users/{user_id}/{filename}"
-        
         # Determine content type if not provided
         if not content_type:
             content_type = self._get_content_type(filename)
         
-        try:
-            # Upload file to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_content,
-                ContentType=content_type
-            )
-            
-            # Generate pre-signed URL (7 day expiration)
-            s3_url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=604800  # 7 days in seconds
-            )
+        if file_obj.seekable():
+            if size_bytes is None or sha256 is None:
+                size_bytes, sha256 = self.hash_file(file_obj, max_size=max_size)
             
-            return s3_key, s3_url
-            
-        except (ClientError, BotoCoreError) as e:
-            raise Exception(f"Failed to upload file to S3: {str(e)}")
+            # Content-addressed key: users/{user_id}/{sha256}/{filename}
+            s3_key = self.build_key(user_id, filename, sha256)
+            self.backend.put_stream(s3_key, file_obj, content_type, size_bytes=size_bytes, sha256=sha256)
+        else:
+            # Hash is only known after streaming, so use a random key
+            s3_key = self.build_key(user_id, filename)
+            reader = HashingReader(file_obj, max_size=max_size)
+            self.backend.put_stream(s3_key, reader, content_type)
+            size_bytes, sha256 = reader.size_bytes, reader.sha256
+        
+        return s3_key, self.get_presigned_url(s3_key), size_bytes, sha256
+    
+    def generate_presigned_post(
+        self,
+        filename: str,
+        user_id: str,
+        content_type: str,
+        max_size: int,
+        expires_in: int = 900
+    ) -> Dict[str, Any]:
+        """
+        Generate a presigned POST policy for uploading directly to storage.
+        
+        The policy pins the object key under users/{user_id}/, the content type
+        and the allowed content length, so clients cannot upload elsewhere or
+        exceed the size limit.
+        
+        Args:
+            filename: Original filename
+            user_id: ID of the user uploading the file
+            content_type: MIME type the client must send
+            max_size: Maximum allowed size in bytes
+            expires_in: Policy lifetime in seconds (default: 15 minutes)
+        
+        Returns:
+            Dict with url, fields and s3_key
+        
+        Raises:
+            Exception: If the policy cannot be generated
+        """
+        s3_key = self.build_key(user_id, filename)
+        presigned_post = self.backend.presign_post(s3_key, content_type, max_size, expires_in)
+        
+        return {
+            "url": presigned_post["url"],
+            "fields": presigned_post["fields"],
+            "s3_key": s3_key,
+        }
+    
+    def head_file(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get object metadata without downloading it.
+        
+        Args:
+            s3_key: S3 object key
+        
+        Returns:
+            Dict with size_bytes, content_type and etag, or None if the object does not exist
+        
+        Raises:
+            Exception: If the request fails for any other reason
+        """
+        return self.backend.head(s3_key)
+    
+    def read_file_head(self, s3_key: str, length: int) -> bytes:
+        """
+        Download only the first bytes of an object.
+        
+        Args:
+            s3_key: S3 object key
+            length: Number of leading bytes to fetch
+        
+        Returns:
+            Up to length bytes from the start of the object
+        
+        Raises:
+            Exception: If the request fails
+        """
+        return self.backend.get_range(s3_key, length)
+    
+    def list_files_page(
+        self,
+        prefix: str,
+        continuation_token: Optional[str] = None,
+        max_keys: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List one page of objects under a prefix in key order.
+        
+        Args:
+            prefix: Key prefix to list
+            continuation_token: Token returned for the previous page (None for the first page)
+            max_keys: Maximum number of objects in the page (S3 caps this at 1000)
+        
+        Returns:
+            Tuple of (objects, next_continuation_token) where each object has
+            s3_key, size_bytes and last_modified; the token is None on the last page
+        
+        Raises:
+            Exception: If the request fails
+        """
+        return self.backend.list_page(prefix, continuation_token, max_keys)
+    
+    def download_file(self, s3_key: str) -> bytes:
+        """
+        Download a whole object.
+        
+        Args:
+            s3_key: S3 object key
+        
+        Returns:
+            Object content as bytes
+        
+        Raises:
+            Exception: If the request fails
+        """
+        return self.backend.get(s3_key)
+    
+    def iter_file(self, s3_key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Stream an object in chunks.
+        
+        Args:
+            s3_key: S3 object key
+            chunk_size: Maximum chunk size in bytes
+        
+        Returns:
+            Iterator over consecutive chunks of the object content
+        """
+        return self.backend.iter_chunks(s3_key, chunk_size)
+    
+    def put_file(self, s3_key: str, file_content: bytes, content_type: str) -> None:
+        """
+        Upload bytes under a caller-chosen key.
+        
+        Args:
+            s3_key: S3 object key
+            file_content: File content as bytes
+            content_type: MIME type of the file
+        
+        Raises:
+            Exception: If the upload fails
+        """
+        self.backend.put_bytes(s3_key, file_content, content_type)
+    
+    def generate_presigned_url(self, s3_key: str, expires_in: int = 604800) -> str:
+        """
+        Generate a pre-signed GET URL for an object.
+        
+        Args:
+            s3_key: S3 object key
+            expires_in: URL lifetime in seconds (default: 7 days)
+        
+        Returns:
+            Pre-signed URL string
+        """
+        return self.backend.presign_get(s3_key, expires_in)
+    
+    def get_presigned_url(self, s3_key: str) -> str:
+        """
+        Get a pre-signed GET URL for an object from the URL cache.
+        
+        Args:
+            s3_key: S3 object key
+        
+        Returns:
+            Pre-signed URL with at least PRESIGNED_URL_MIN_REMAINING_SECONDS of validity
+        """
+        return self.url_cache.get(s3_key)
+    
+    def get_presigned_urls(self, s3_keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Get pre-signed GET URLs for many objects, re-signing cache misses in bulk.
+        
+        Args:
+            s3_keys: S3 object keys
+        
+        Returns:
+            Dict mapping each S3 key to a pre-signed URL
+        """
+        return self.url_cache.get_many(s3_keys)
     
     def delete_file(self, s3_key: str) -> None:
         """
-        Delete file from S3.
+        Delete a file from storage.
         
         Args:
             s3_key: S3 object key to delete
-            
+        
         Raises:
-            Exception: If S3 deletion fails
+            Exception: If deletion fails
         """
-        try:
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
-        except (ClientError, BotoCoreError) as e:
-            raise Exception(f"Failed to delete file from S3: {str(e)}")
+        self.url_cache.invalidate(s3_key)
+        self.backend.delete(s3_key)
+    
+    def delete_files(self, s3_keys: List[str]) -> Dict[str, str]:
+        """
+        Delete many files in batches of up to DELETE_OBJECTS_MAX_KEYS.
+        
+        Deleting a key that does not exist counts as success.
+        
+        Args:
+            s3_keys: S3 object keys to delete
+        
+        Returns:
+            Dict mapping each key that could not be deleted to its error message
+        """
+        errors = {}
+        for start in range(0, len(s3_keys), DELETE_OBJECTS_MAX_KEYS):
+            batch = s3_keys[start:start + DELETE_OBJECTS_MAX_KEYS]
+            for s3_key in batch:
+                self.url_cache.invalidate(s3_key)
+            errors.update(self.backend.delete_many(batch))
+        return errors
     
     def _get_content_type(self, filename: str) -> str:
         """
@@ -98,7 +506,7 @@ class S3Service:
         
         Args:
             filename: Name of the file
-            
+        
         Returns:
             MIME type string (defaults to 'application/octet-stream')
         """
@@ -108,4 +516,3 @@ class S3Service:
 
 # Global S3 service instance
 s3_service = S3Service()
-
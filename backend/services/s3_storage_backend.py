@@ -0,0 +1,234 @@
+"""AWS S3 storage backend."""
+import base64
+import threading
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError, BotoCoreError
+
+from services.storage_backend import StorageBackend
+
+
+# Multipart transfer tuning for streams of unknown size (streams of known size
+# are sent with a single PUT, see put_stream). Parts are buffered in memory
+# while in flight, so per-upload memory is bounded by
+# multipart_chunksize * max_in_memory_upload_chunks instead of the stream size.
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,  # Streams longer than one part use multipart upload
+    multipart_chunksize=5 * 1024 * 1024,  # S3 minimum part size
+    max_concurrency=2,
+    use_threads=True,
+)
+UPLOAD_TRANSFER_CONFIG.max_in_memory_upload_chunks = 2
+
+
+class S3StorageBackend(StorageBackend):
+    """Storage backend for AWS S3 and S3-compatible endpoints."""
+    
+    name = "s3"
+    
+    def __init__(
+        self,
+        bucket_name: str,
+        region: str,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        endpoint_url: Optional[str] = None
+    ):
+        """Store connection settings; the boto3 client is created on first use."""
+        self.bucket_name = bucket_name
+        self.region = region
+        self._access_key_id = access_key_id
+        self._secret_access_key = secret_access_key
+        self._endpoint_url = endpoint_url
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def client(self):
+        """boto3 S3 client (path-style addressing for custom endpoints)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        's3',
+                        aws_access_key_id=self._access_key_id,
+                        aws_secret_access_key=self._secret_access_key,
+                        region_name=self.region,
+                        endpoint_url=self._endpoint_url,
+                        config=Config(s3={'addressing_style': 'path'}) if self._endpoint_url else None
+                    )
+        return self._client
+    
+    def put_stream(
+        self,
+        key: str,
+        file_obj: BinaryIO,
+        content_type: str,
+        size_bytes: Optional[int] = None,
+        sha256: Optional[str] = None
+    ) -> None:
+        """
+        Stream a file object to S3.
+        
+        Files of known size are sent as a single streamed PUT (with the SHA-256
+        as S3 integrity checksum): uploads are capped far below the 5GB PUT
+        limit, and for asset-sized files a streamed PUT holds less in memory
+        than multipart parts. Unsized streams use a multipart upload with
+        bounded part buffering.
+        """
+        try:
+            if size_bytes is not None:
+                params = {
+                    "Bucket": self.bucket_name,
+                    "Key": key,
+                    "Body": file_obj,
+                    "ContentLength": size_bytes,
+                    "ContentType": content_type,
+                }
+                if sha256:
+                    params["ChecksumSHA256"] = base64.b64encode(bytes.fromhex(sha256)).decode()
+                self.client.put_object(**params)
+            else:
+                self.client.upload_fileobj(
+                    file_obj,
+                    self.bucket_name,
+                    key,
+                    ExtraArgs={'ContentType': content_type},
+                    Config=UPLOAD_TRANSFER_CONFIG
+                )
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to upload file to S3: {str(e)}")
+    
+    def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        """Upload bytes to S3."""
+        try:
+            self.client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=data,
+                ContentType=content_type
+            )
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to upload file to S3: {str(e)}")
+    
+    def get(self, key: str) -> bytes:
+        """Download a whole object from S3."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=key)
+            return response["Body"].read()
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to read file from S3: {str(e)}")
+    
+    def get_range(self, key: str, length: int) -> bytes:
+        """Download only the first bytes of an object with a ranged GET."""
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Range=f"bytes=0-{length - 1}"
+            )
+            return response["Body"].read()
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to read file from S3: {str(e)}")
+    
+    def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream an object from S3 in chunks."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=key)
+            yield from response["Body"].iter_chunks(chunk_size)
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to read file from S3: {str(e)}")
+    
+    def head(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get object metadata from S3 with a HEAD request."""
+        try:
+            response = self.client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise Exception(f"Failed to read file metadata from S3: {str(e)}")
+        except BotoCoreError as e:
+            raise Exception(f"Failed to read file metadata from S3: {str(e)}")
+        
+        return {
+            "size_bytes": response["ContentLength"],
+            "content_type": response.get("ContentType"),
+            "etag": response.get("ETag", "").strip('"'),
+        }
+    
+    def delete(self, key: str) -> None:
+        """Delete an object from S3."""
+        try:
+            self.client.delete_object(Bucket=self.bucket_name, Key=key)
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to delete file from S3: {str(e)}")
+    
+    def delete_many(self, keys: List[str]) -> Dict[str, str]:
+        """Delete up to 1000 objects with one DeleteObjects request."""
+        try:
+            response = self.client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+            )
+        except (ClientError, BotoCoreError) as e:
+            return {key: str(e) for key in keys}
+        
+        return {
+            error["Key"]: f"{error.get('Code')}: {error.get('Message')}"
+            for error in response.get("Errors", [])
+        }
+    
+    def list_page(
+        self,
+        prefix: str,
+        continuation_token: Optional[str] = None,
+        max_keys: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of objects with list_objects_v2."""
+        params = {"Bucket": self.bucket_name, "Prefix": prefix, "MaxKeys": max_keys}
+        if continuation_token:
+            params["ContinuationToken"] = continuation_token
+        
+        try:
+            response = self.client.list_objects_v2(**params)
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to list files in S3: {str(e)}")
+        
+        objects = [
+            {
+                "s3_key": item["Key"],
+                "size_bytes": item["Size"],
+                "last_modified": item["LastModified"],
+            }
+            for item in response.get("Contents", [])
+        ]
+        return objects, response.get("NextContinuationToken") if response.get("IsTruncated") else None
+    
+    def presign_get(self, key: str, expires_in: int) -> str:
+        """Generate a pre-signed GET URL (signed locally, no network)."""
+        return self.client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': key},
+            ExpiresIn=expires_in
+        )
+    
+    def presign_post(self, key: str, content_type: str, max_size: int, expires_in: int) -> Dict[str, Any]:
+        """Generate a presigned POST policy pinning key, content type and size."""
+        try:
+            presigned_post = self.client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=key,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    {'Content-Type': content_type},
+                    ['content-length-range', 1, max_size],
+                ],
+                ExpiresIn=expires_in
+            )
+        except (ClientError, BotoCoreError) as e:
+            raise Exception(f"Failed to generate presigned upload policy: {str(e)}")
+        
+        return {"url": presigned_post["url"], "fields": presigned_post["fields"]}
@@ -0,0 +1,199 @@
+"""Storage backend interface shared by the S3 and local filesystem backends."""
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+
+class StorageBackend(ABC):
+    """
+    Object storage primitives used by S3Service.
+    
+    Keys are opaque strings (users/{user_id}/{id}/{filename}). Backends raise
+    Exception with a descriptive message on failure, matching the existing
+    S3 error handling in the routers.
+    """
+    
+    name: str = "storage"
+    
+    @abstractmethod
+    def put_stream(
+        self,
+        key: str,
+        file_obj: BinaryIO,
+        content_type: str,
+        size_bytes: Optional[int] = None,
+        sha256: Optional[str] = None
+    ) -> None:
+        """
+        Store an object from a file object without loading it into memory.
+        
+        Args:
+            key: Object key
+            file_obj: Readable binary file object positioned at the start of the content
+            content_type: MIME type of the object
+            size_bytes: Content length if known (seekable files)
+            sha256: SHA-256 hex digest to verify the stored content against, if known
+        """
+    
+    @abstractmethod
+    def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        """
+        Store an object from bytes.
+        
+        Args:
+            key: Object key
+            data: Object content
+            content_type: MIME type of the object
+        """
+    
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """
+        Read a whole object.
+        
+        Args:
+            key: Object key
+        
+        Returns:
+            Object content
+        """
+    
+    @abstractmethod
+    def get_range(self, key: str, length: int) -> bytes:
+        """
+        Read the leading bytes of an object.
+        
+        Args:
+            key: Object key
+            length: Number of leading bytes to read
+        
+        Returns:
+            Up to length bytes from the start of the object
+        """
+    
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Stream an object in chunks.
+        
+        Args:
+            key: Object key
+            chunk_size: Maximum chunk size in bytes
+        
+        Yields:
+            Consecutive chunks of the object content
+        """
+    
+    @abstractmethod
+    def head(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get object metadata without reading the content.
+        
+        Args:
+            key: Object key
+        
+        Returns:
+            Dict with size_bytes, content_type and etag, or None if the object does not exist
+        """
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Delete an object (deleting a missing object succeeds).
+        
+        Args:
+            key: Object key
+        """
+    
+    @abstractmethod
+    def delete_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Delete up to 1000 objects in one call.
+        
+        Args:
+            keys: Object keys
+        
+        Returns:
+            Dict mapping each key that could not be deleted to its error message
+        """
+    
+    @abstractmethod
+    def list_page(
+        self,
+        prefix: str,
+        continuation_token: Optional[str] = None,
+        max_keys: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List one page of objects under a prefix in UTF-8 binary key order.
+        
+        Args:
+            prefix: Key prefix to list
+            continuation_token: Token returned for the previous page (None for the first page)
+            max_keys: Maximum number of objects in the page
+        
+        Returns:
+            Tuple of (objects, next_continuation_token) where each object has
+            s3_key, size_bytes and last_modified; the token is None on the last page
+        """
+    
+    @abstractmethod
+    def presign_get(self, key: str, expires_in: int) -> str:
+        """
+        Generate a signed download URL.
+        
+        Args:
+            key: Object key
+            expires_in: URL lifetime in seconds
+        
+        Returns:
+            Signed URL
+        """
+    
+    @abstractmethod
+    def presign_post(self, key: str, content_type: str, max_size: int, expires_in: int) -> Dict[str, Any]:
+        """
+        Generate a signed form upload policy pinned to one key.
+        
+        Args:
+            key: Object key the client must upload to
+            content_type: MIME type the client must send
+            max_size: Maximum allowed size in bytes
+            expires_in: Policy lifetime in seconds
+        
+        Returns:
+            Dict with url and fields to send as multipart form data with the file
+        """
+
+
+def create_storage_backend(backend_name: str) -> StorageBackend:
+    """
+    Create the storage backend selected in settings.
+    
+    Args:
+        backend_name: "s3" or "local"
+    
+    Returns:
+        StorageBackend instance
+    
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    from config import settings
+    
+    if backend_name == "s3":
+        from services.s3_storage_backend import S3StorageBackend
+        return S3StorageBackend(
+            bucket_name=settings.AWS_S3_BUCKET,
+            region=settings.AWS_REGION,
+            access_key_id=settings.AWS_ACCESS_KEY_ID,
+            secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL
+        )
+    if backend_name == "local":
+        from services.local_storage_backend import LocalStorageBackend
+        return LocalStorageBackend(
+            root=settings.LOCAL_STORAGE_ROOT,
+            base_url=settings.LOCAL_STORAGE_BASE_URL,
+            signing_key=settings.LOCAL_STORAGE_SIGNING_KEY
+        )
+    raise ValueError(f"Unknown storage backend: {backend_name}")
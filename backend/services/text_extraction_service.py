@@ -0,0 +1,349 @@
+"""Text extraction service caching the content of copy assets for prompts."""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+import codecs
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+import zipfile
+
+from pypdf import PdfReader
+
+from config import settings
+from database import SessionLocal
+from models.asset import Asset
+from services.s3_service import s3_service
+from crud.metrics import record_metric
+
+
+# Document kinds text can be extracted from, by file extension and MIME type
+TEXT_EXTRACTION_EXTENSIONS = {".txt": "text", ".md": "text", ".docx": "docx", ".pdf": "pdf"}
+TEXT_EXTRACTION_TYPES = {
+    "text/plain": "text",
+    "text/markdown": "text",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "application/pdf": "pdf",
+}
+
+# Longest excerpt stored on an asset and sent to the model
+TEXT_EXCERPT_MAX_CHARS = 4000
+
+# Buffer size used when streaming plain text and spooling downloads
+READ_CHUNK_SIZE = 64 * 1024  # 64KB
+
+# Downloads above this size are spooled to a temporary file instead of memory
+SPOOL_MAX_MEMORY_BYTES = 2 * 1024 * 1024  # 2MB
+
+# Upper bound on the uncompressed size of a .docx body (guards against zip bombs)
+MAX_DOCX_XML_BYTES = 64 * 1024 * 1024  # 64MB
+
+# Pages read from a PDF; longer documents are counted up to this page
+MAX_PDF_PAGES = 200
+
+WORDPROCESSING_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Control characters other than tab and newline
+CONTROL_CHARACTERS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f-\x9f]")
+
+
+class TextCollector:
+    """
+    Build a normalized, size-capped excerpt and a word count from lines of text.
+    
+    Text is NFKC-normalized, control characters are dropped, runs of
+    whitespace within a line collapse to one space and consecutive blank lines
+    collapse to one. Words are counted over the whole document; only the
+    first max_chars characters are kept.
+    """
+    
+    def __init__(self, max_chars: int = TEXT_EXCERPT_MAX_CHARS):
+        """Initialize an empty collector."""
+        self.max_chars = max_chars
+        self.word_count = 0
+        self.truncated = False
+        self._lines: List[str] = []
+        self._length = 0
+        self._blank_pending = False
+    
+    def add_line(self, line: str) -> None:
+        """
+        Add one line (or paragraph) of text.
+        
+        Args:
+            line: Text without a trailing newline
+        """
+        words = CONTROL_CHARACTERS.sub(" ", unicodedata.normalize("NFKC", line)).split()
+        if not words:
+            self._blank_pending = bool(self._lines)
+            return
+        
+        self.word_count += len(words)
+        if self.truncated:
+            return
+        
+        if self._blank_pending:
+            self._lines.append("")
+            self._length += 1
+            self._blank_pending = False
+        
+        text = " ".join(words)
+        remaining = self.max_chars - self._length - (1 if self._lines else 0)
+        if len(text) > remaining:
+            # Cut at a word boundary (the character after the cut shows whether it falls inside a word)
+            cut = text[:max(remaining, 0) + 1]
+            text = cut.rsplit(" ", 1)[0] if " " in cut else ""
+            self.truncated = True
+        if text:
+            self._lines.append(text)
+            self._length += len(text) + 1
+    
+    @property
+    def excerpt(self) -> str:
+        """Collected excerpt, ending with an ellipsis if the document was longer."""
+        excerpt = "\n".join(self._lines)
+        return excerpt + " …" if self.truncated and excerpt else excerpt
+
+
+def document_kind(filename: str, file_type: Optional[str]) -> Optional[str]:
+    """
+    Get the document kind text can be extracted from.
+    
+    Args:
+        filename: Original filename
+        file_type: MIME type of the file
+    
+    Returns:
+        "text", "docx" or "pdf", or None if extraction is not supported
+    """
+    extension = os.path.splitext(filename.lower())[1]
+    return TEXT_EXTRACTION_EXTENSIONS.get(extension) or TEXT_EXTRACTION_TYPES.get((file_type or "").lower())
+
+
+def _collect_plain_text(file_obj: BinaryIO, collector: TextCollector) -> None:
+    # Decode incrementally so only one chunk and one partial line are in memory
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    while True:
+        chunk = file_obj.read(READ_CHUNK_SIZE)
+        pending += decoder.decode(chunk, final=not chunk)
+        lines = pending.splitlines()
+        if chunk and lines and not pending.endswith(("\n", "\r")):
+            pending = lines.pop()
+            # Flush overlong lines at a space so a file without newlines stays bounded
+            if len(pending) > READ_CHUNK_SIZE and " " in pending:
+                head, pending = pending.rsplit(" ", 1)
+                lines.append(head)
+        else:
+            pending = ""
+        for line in lines:
+            collector.add_line(line)
+        if not chunk:
+            return
+
+
+def _collect_docx_text(file_obj: BinaryIO, collector: TextCollector) -> None:
+    with zipfile.ZipFile(file_obj) as archive:
+        if archive.getinfo("word/document.xml").file_size > MAX_DOCX_XML_BYTES:
+            raise ValueError("Document body is too large to extract")
+        
+        with archive.open("word/document.xml") as document:
+            parts = []
+            for _, element in ET.iterparse(document, events=("end",)):
+                tag = element.tag
+                if tag == f"{WORDPROCESSING_NAMESPACE}t":
+                    parts.append(element.text or "")
+                elif tag in (f"{WORDPROCESSING_NAMESPACE}tab", f"{WORDPROCESSING_NAMESPACE}br"):
+                    parts.append(" ")
+                elif tag == f"{WORDPROCESSING_NAMESPACE}p":
+                    collector.add_line("".join(parts))
+                    parts = []
+                    element.clear()
+
+
+def _collect_pdf_text(file_obj: BinaryIO, collector: TextCollector) -> None:
+    reader = PdfReader(file_obj)
+    if reader.is_encrypted:
+        reader.decrypt("")
+    for page in reader.pages[:MAX_PDF_PAGES]:
+        for line in (page.extract_text() or "").splitlines():
+            collector.add_line(line)
+        collector.add_line("")
+
+
+def extract_text(file_obj: BinaryIO, kind: str, max_chars: int = TEXT_EXCERPT_MAX_CHARS) -> Dict[str, Any]:
+    """
+    Extract a normalized excerpt and word count from a document.
+    
+    Plain text is decoded as a stream; .docx bodies are parsed incrementally
+    with iterparse; PDFs are read page by page.
+    
+    Args:
+        file_obj: Readable binary file object (seekable for docx and pdf)
+        kind: Document kind from document_kind
+        max_chars: Longest excerpt to keep
+    
+    Returns:
+        Dict with text_excerpt and text_word_count
+    
+    Raises:
+        ValueError: If the kind is unknown or the document cannot be parsed
+    """
+    collectors = {"text": _collect_plain_text, "docx": _collect_docx_text, "pdf": _collect_pdf_text}
+    if kind not in collectors:
+        raise ValueError(f"Unsupported document kind: {kind}")
+    
+    collector = TextCollector(max_chars)
+    try:
+        collectors[kind](file_obj, collector)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to parse {kind} document: {str(e)}")
+    
+    return {"text_excerpt": collector.excerpt, "text_word_count": collector.word_count}
+
+
+def extract_object_text(s3_key: str, kind: str) -> Dict[str, Any]:
+    """
+    Download an object from S3 and extract its text.
+    
+    Runs in a worker process. The download is spooled to a temporary file
+    once it exceeds SPOOL_MAX_MEMORY_BYTES, so large documents are never held
+    in memory.
+    
+    Args:
+        s3_key: S3 key of the original object
+        kind: Document kind from document_kind
+    
+    Returns:
+        Dict as returned by extract_text
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES) as spool:
+        for chunk in s3_service.iter_file(s3_key, chunk_size=READ_CHUNK_SIZE):
+            spool.write(chunk)
+        spool.seek(0)
+        return extract_text(spool, kind)
+
+
+class TextExtractionService:
+    """Service extracting and caching the text of copy assets."""
+    
+    def __init__(self, max_workers: int):
+        """Initialize the service; the process pool is started on first use."""
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Process pool used for parsing (spawned, not forked)."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+    
+    def supports(self, filename: str, file_type: Optional[str]) -> bool:
+        """
+        Check whether text can be extracted from a file.
+        
+        Args:
+            filename: Original filename
+            file_type: MIME type of the file
+        
+        Returns:
+            True for plain text, .docx and PDF documents
+        """
+        return document_kind(filename, file_type) is not None
+    
+    def extract_for_assets(self, asset_ids: Iterable[str]) -> None:
+        """
+        Extract and record the text of newly uploaded documents.
+        
+        Intended to run as a background task after the upload response is sent.
+        Deduplicated assets share one S3 object, so each object is parsed once
+        and text already recorded on another asset is reused. Assets whose
+        documents cannot be parsed are left without text.
+        
+        Args:
+            asset_ids: IDs of the assets to process
+        """
+        db = SessionLocal()
+        try:
+            assets = db.query(Asset).filter(
+                Asset.id.in_(list(asset_ids)),
+                Asset.text_word_count.is_(None)
+            ).all()
+            assets = [asset for asset in assets if self.supports(asset.filename, asset.file_type)]
+            if not assets:
+                return
+            
+            # Reuse text already extracted from the same S3 object
+            s3_keys = {asset.s3_key for asset in assets}
+            existing = {
+                s3_key: {"text_excerpt": text_excerpt, "text_word_count": text_word_count}
+                for s3_key, text_excerpt, text_word_count in db.query(
+                    Asset.s3_key, Asset.text_excerpt, Asset.text_word_count
+                ).filter(
+                    Asset.s3_key.in_(s3_keys),
+                    Asset.text_word_count.is_not(None)
+                ).all()
+            }
+            
+            pending = {}
+            for asset in assets:
+                if asset.s3_key not in existing:
+                    pending.setdefault(asset.s3_key, asset)
+            
+            start_time = time.time()
+            futures = {
+                s3_key: self.executor.submit(
+                    extract_object_text, s3_key, document_kind(asset.filename, asset.file_type)
+                )
+                for s3_key, asset in pending.items()
+            }
+            
+            for s3_key, future in futures.items():
+                try:
+                    existing[s3_key] = future.result()
+                except Exception as e:
+                    print(f"[TextExtraction] Failed to extract {s3_key}: {e}")
+            
+            for asset in assets:
+                extracted = existing.get(asset.s3_key)
+                if extracted:
+                    asset.text_excerpt = extracted["text_excerpt"]
+                    asset.text_word_count = extracted["text_word_count"]
+            
+            if pending:
+                processing_time = time.time() - start_time
+                source_bytes = sum(asset.file_size_bytes for asset in pending.values())
+                record_metric(
+                    db=db,
+                    metric_type="text_extraction_throughput",
+                    metric_value=round(source_bytes / 1024 / max(processing_time, 0.001), 2),  # KB/s
+                    metadata={
+                        "document_count": len(pending),
+                        "source_bytes": source_bytes,
+                        "processing_time": round(processing_time, 3)
+                    }
+                )
+            
+            db.commit()
+        
+        except Exception as e:
+            db.rollback()
+            print(f"[TextExtraction] Failed to extract text: {e}")
+        finally:
+            db.close()
+
+
+# Global text extraction service instance
+text_extraction_service = TextExtractionService(max_workers=settings.TEXT_EXTRACTION_WORKERS)
@@ -0,0 +1,139 @@
+"""In-process cache of authenticated users for the get_current_user dependencies."""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.user import User
+from schemas.user import AuthenticatedUser
+
+# Session.info key collecting IDs of users changed in the current transaction
+CHANGED_USERS_KEY = "user_cache_changed_ids"
+
+
+class UserCache:
+    """
+    Bounded TTL cache of user identities keyed by user ID.
+    
+    Entries expire ttl seconds after they were loaded; least recently used
+    entries are evicted once max_entries is reached. Loads racing with an
+    invalidation are discarded (see generation), so a role change is never
+    overwritten by a lookup that read the old row.
+    """
+    
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[AuthenticatedUser, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get(self, user_id: str) -> Optional[AuthenticatedUser]:
+        """
+        Get a cached user.
+        
+        Args:
+            user_id: User ID from the X-User-ID header
+        
+        Returns:
+            Cached user, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry and entry[1] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+    
+    def put(self, user: AuthenticatedUser, generation: int) -> None:
+        """
+        Cache a user loaded from the database.
+        
+        Args:
+            user: User identity
+            generation: Value of self.generation read before the user was
+                loaded; the entry is dropped if users were invalidated since
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[user.id] = (user, time.monotonic() + self.ttl)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop a user, e.g. after a role change made outside the ORM.
+        
+        Args:
+            user_id: User ID
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self.generation += 1
+            self.invalidations += 1
+    
+    def clear(self) -> None:
+        """Drop all users."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self.invalidations += 1
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl,
+            }
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_users(session: Session, flush_context) -> None:
+    """Invalidate users updated or deleted through the ORM, at flush and again at commit."""
+    user_ids = {
+        obj.id for obj in list(session.dirty) + list(session.deleted)
+        if isinstance(obj, User)
+    }
+    if not user_ids:
+        return
+    for user_id in user_ids:
+        user_cache.invalidate(user_id)
+    session.info.setdefault(CHANGED_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    # Lookups between the flush and the commit may have cached the old row
+    for user_id in session.info.pop(CHANGED_USERS_KEY, ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(CHANGED_USERS_KEY, None)
+
+
+# Global user cache instance
+user_cache = UserCache(
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_USER_CACHE_SIZE
+)
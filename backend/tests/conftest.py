@@ -0,0 +1,21 @@
+"""Shared fixtures for the backend test suite."""
+import pytest
+
+from scripts.benchmark_support import temporary_database, use_temporary_environment
+
+# Application modules create their engines and storage backend from settings
+# at import time, so the environment is set before any test module imports them
+use_temporary_environment("backend-tests-")
+
+
+@pytest.fixture
+def engine_and_db():
+    """Engine and session of a fresh SQLite database created from the models."""
+    with temporary_database() as (engine, db):
+        yield engine, db
+
+
+@pytest.fixture
+def db(engine_and_db):
+    """Session of a fresh SQLite database created from the models."""
+    return engine_and_db[1]
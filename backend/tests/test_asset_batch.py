@@ -0,0 +1,37 @@
+"""Batch asset loading applies the same owner-only access as GET /assets/{asset_id}."""
+from sqlalchemy import insert
+
+from crud.asset import get_assets_by_ids
+from models.campaign import Campaign
+from models.campaign_asset import CampaignAsset
+from scripts.benchmark_support import create_assets, create_users
+
+
+def test_only_owned_assets_are_returned(db):
+    owner_id, other_id = create_users(db, 2)
+    owned_ids = create_assets(db, owner_id, 3)
+    other_ids = create_assets(db, other_id, 2)
+    
+    assets = get_assets_by_ids(db, owned_ids + other_ids + ["not-a-uuid"], owner_id)
+    
+    assert sorted(assets) == sorted(owned_ids)
+    assert all(assets[asset_id].id == asset_id for asset_id in owned_ids)
+
+
+def test_managers_do_not_read_assets_of_pending_campaigns(db):
+    advertiser_id = create_users(db, 1)[0]
+    manager_id = create_users(db, 1, role="campaign_manager", prefix="manager")[0]
+    asset_ids = create_assets(db, advertiser_id, 2)
+    campaign_id = db.scalar(insert(Campaign).returning(Campaign.id), {
+        "advertiser_id": advertiser_id,
+        "campaign_name": "Spring launch",
+        "status": "pending_approval",
+    })
+    db.execute(insert(CampaignAsset), [{"campaign_id": campaign_id, "asset_id": asset_id} for asset_id in asset_ids])
+    db.commit()
+    
+    assert get_assets_by_ids(db, asset_ids, manager_id) == {}
+
+
+def test_no_ids_runs_no_query(db):
+    assert get_assets_by_ids(db, [], "00000000-0000-7000-8000-000000000000") == {}
@@ -0,0 +1,30 @@
+"""Filename search returns matches in listing order (newest upload first)."""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, update
+
+from crud.asset import search_assets
+from models.asset import Asset
+from scripts.benchmark_support import asset_row, create_users
+
+
+def test_renamed_asset_keeps_its_position(db):
+    user_id = create_users(db, 1)[0]
+    uploaded_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    asset_ids = db.scalars(insert(Asset).returning(Asset.id, sort_by_parameter_order=True), [
+        asset_row(user_id, f"summer-{i}.png", uploaded_at=uploaded_at + timedelta(days=i))
+        for i in range(3)
+    ]).all()
+    db.execute(update(Asset).where(Asset.id == asset_ids[0]).values(filename="summer-hero.png"))
+    db.commit()
+    
+    assert [asset.id for asset in search_assets(db, user_id, "summer", 10)] == asset_ids[::-1]
+    assert [asset.id for asset in search_assets(db, user_id, "summer", 2)] == asset_ids[:0:-1]
+
+
+def test_other_users_assets_are_not_matched(db):
+    owner_id, other_id = create_users(db, 2)
+    db.execute(insert(Asset), [asset_row(owner_id, "summer.png"), asset_row(other_id, "summer-sale.png")])
+    db.commit()
+    
+    assert [asset.filename for asset in search_assets(db, owner_id, "sum", 10)] == ["summer.png"]
@@ -0,0 +1,41 @@
+"""Asset URLs are signed by the router, not while validating the schema."""
+from datetime import datetime
+
+from routers.asset import sign_asset_urls
+from schemas.asset import AssetResponse
+from services.derivative_service import THUMBNAIL_RENDITION
+from services.s3_service import s3_service
+
+
+def asset_response(filename: str, **values) -> AssetResponse:
+    """Serialized asset carrying a stored (legacy) URL."""
+    return AssetResponse(
+        id=f"id-{filename}",
+        user_id="user",
+        filename=filename,
+        s3_key=f"users/user/{filename}",
+        s3_url="https://legacy.example.com/stored-url",
+        file_type="image/png",
+        file_size_bytes=1024,
+        category="image",
+        uploaded_at=datetime(2026, 3, 1),
+        **values
+    )
+
+
+def test_validation_keeps_stored_values():
+    assert asset_response("logo.png").s3_url == "https://legacy.example.com/stored-url"
+
+
+def test_object_and_thumbnail_urls_are_signed():
+    thumbnail_key = "users/user/derived/hero-thumbnail.webp"
+    assets = sign_asset_urls([
+        asset_response("logo.png"),
+        asset_response("hero.png", derivatives={THUMBNAIL_RENDITION: {"s3_key": thumbnail_key}}),
+    ])
+    
+    assert [asset.s3_url for asset in assets] == [
+        s3_service.get_presigned_url("users/user/logo.png"),
+        s3_service.get_presigned_url("users/user/hero.png"),
+    ]
+    assert [asset.thumbnail_url for asset in assets] == [None, s3_service.get_presigned_url(thumbnail_key)]
@@ -0,0 +1,56 @@
+"""BinaryUUID column storage and uuid7 generation."""
+import time
+import uuid
+
+from sqlalchemy import select, text
+
+from models.asset import Asset
+from models.types import uuid7
+from models.user import User
+from scripts.benchmark_support import asset_row, create_users
+
+
+def test_ids_are_stored_as_16_bytes_and_read_back_canonical(db):
+    user_id = create_users(db, 1)[0]
+    
+    stored = db.execute(text("SELECT id FROM users")).scalar_one()
+    
+    assert stored == uuid.UUID(user_id).bytes
+    assert user_id == str(uuid.UUID(user_id))
+    assert db.scalar(select(User.id)) == user_id
+
+
+def test_other_spellings_of_an_id_match_the_row(db):
+    user_id = create_users(db, 1)[0]
+    spellings = [user_id.upper(), user_id.replace("-", ""), f"{{{user_id}}}", f"urn:uuid:{user_id}", uuid.UUID(user_id)]
+    
+    for spelling in spellings:
+        assert db.scalar(select(User.id).where(User.id == spelling)) == user_id
+
+
+def test_invalid_ids_match_no_row(db):
+    create_users(db, 1)
+    
+    for invalid in ["", "not-a-uuid", "1234", "g" * 32]:
+        assert db.scalar(select(User.id).where(User.id == invalid)) is None
+
+
+def test_foreign_keys_round_trip(db):
+    user_id = create_users(db, 1)[0]
+    db.add(Asset(**asset_row(user_id.upper(), "logo.png")))
+    db.commit()
+    
+    assert db.scalar(select(Asset.user_id)) == user_id
+
+
+def test_uuid7_is_version_7_and_time_ordered():
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    
+    parsed = uuid.UUID(first)
+    assert str(parsed) == first
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+    assert abs(int.from_bytes(parsed.bytes[:6], "big") - time.time_ns() // 1_000_000) < 1000
+    assert first < second
@@ -0,0 +1,69 @@
+"""Compare-and-set campaign status transitions (crud.campaign.transition_campaign_status)."""
+from sqlalchemy import insert
+
+from crud.campaign import transition_campaign_status
+from models.campaign import Campaign
+from scripts.benchmark_support import create_users
+
+
+def create_campaign(db, status: str) -> str:
+    advertiser_id = create_users(db, 1, prefix=f"advertiser-{status}")[0]
+    campaign_id = db.scalar(insert(Campaign).returning(Campaign.id), {
+        "advertiser_id": advertiser_id,
+        "campaign_name": "Spring launch",
+        "status": status,
+    })
+    db.commit()
+    return campaign_id
+
+
+def test_submit_moves_draft_to_pending_approval(db):
+    campaign_id = create_campaign(db, "draft")
+    
+    row = transition_campaign_status(db, campaign_id, "submit")
+    db.commit()
+    
+    assert (row.id, row.campaign_name, row.status) == (campaign_id, "Spring launch", "pending_approval")
+    assert db.get(Campaign, campaign_id).status == "pending_approval"
+
+
+def test_transition_from_another_status_matches_no_row(db):
+    campaign_id = create_campaign(db, "draft")
+    
+    assert transition_campaign_status(db, campaign_id, "submit") is not None
+    assert transition_campaign_status(db, campaign_id, "submit") is None
+    assert transition_campaign_status(db, campaign_id, "submit") is None
+
+
+def test_only_the_first_of_two_reviews_wins(db):
+    campaign_id = create_campaign(db, "pending_approval")
+    manager_ids = create_users(db, 2, role="campaign_manager", prefix="manager")
+    
+    first = transition_campaign_status(db, campaign_id, "approve", {"reviewed_by": manager_ids[0]})
+    second = transition_campaign_status(db, campaign_id, "reject", {
+        "reviewed_by": manager_ids[1],
+        "rejection_reason": "Too late",
+    })
+    db.commit()
+    
+    assert first.status == "approved"
+    assert second is None
+    campaign = db.get(Campaign, campaign_id)
+    assert (campaign.status, campaign.reviewed_by, campaign.rejection_reason) == ("approved", manager_ids[0], None)
+
+
+def test_failed_condition_leaves_campaign_unchanged(db):
+    campaign_id = create_campaign(db, "pending_approval")
+    
+    row = transition_campaign_status(
+        db, campaign_id, "approve", conditions=[Campaign.generated_email_html.isnot(None)]
+    )
+    db.commit()
+    
+    assert row is None
+    assert db.get(Campaign, campaign_id).status == "pending_approval"
+
+
+def test_unknown_campaign_matches_no_row(db):
+    assert transition_campaign_status(db, "00000000-0000-7000-8000-000000000000", "approve") is None
+    assert transition_campaign_status(db, "not-a-uuid", "approve") is None
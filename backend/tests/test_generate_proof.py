@@ -0,0 +1,65 @@
+"""Proof generation holds no database connection while the proof is generated."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, insert
+
+import main
+import routers.campaign as campaign_router
+from database import Base, SessionLocal, async_engine, engine
+from models.asset import Asset
+from models.campaign import Campaign
+from models.campaign_asset import CampaignAsset
+from scripts.benchmark_support import asset_row, create_users
+
+
+@pytest.fixture
+def campaign(request, monkeypatch):
+    """(advertiser ID, campaign ID) of a campaign with one asset on the application database."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    advertiser_id = create_users(db, 1, prefix=request.node.name)[0]
+    asset_id = db.scalar(insert(Asset).returning(Asset.id), asset_row(advertiser_id, "logo.png", category="logo"))
+    campaign_id = db.scalar(insert(Campaign).returning(Campaign.id), {
+        "advertiser_id": advertiser_id,
+        "campaign_name": "Spring launch",
+    })
+    db.execute(insert(CampaignAsset), [{"campaign_id": campaign_id, "asset_id": asset_id}])
+    db.commit()
+    db.close()
+    monkeypatch.setattr(campaign_router, "compile_mjml_to_html", lambda mjml: "<html></html>")
+    return advertiser_id, campaign_id
+
+
+def test_no_connection_is_held_during_generation(campaign, monkeypatch):
+    advertiser_id, campaign_id = campaign
+    checked_out = []
+    
+    def generate_email_mjml(campaign_details, assets):
+        checked_out.append(async_engine.pool.checkedout())
+        return "<mjml></mjml>"
+    
+    monkeypatch.setattr(campaign_router.openai_service, "generate_email_mjml", generate_email_mjml)
+    with TestClient(main.app) as client:
+        response = client.post(f"/api/campaigns/{campaign_id}/generate-proof", headers={"X-User-ID": advertiser_id})
+    
+    assert response.status_code == 200
+    assert checked_out == [0]
+    db = SessionLocal()
+    assert db.get(Campaign, campaign_id).generated_email_html == "<html></html>"
+    db.close()
+
+
+def test_campaign_deleted_during_generation_returns_404(campaign, monkeypatch):
+    advertiser_id, campaign_id = campaign
+    
+    def generate_email_mjml(campaign_details, assets):
+        with SessionLocal() as db:
+            db.execute(delete(Campaign).where(Campaign.id == campaign_id))
+            db.commit()
+        return "<mjml></mjml>"
+    
+    monkeypatch.setattr(campaign_router.openai_service, "generate_email_mjml", generate_email_mjml)
+    with TestClient(main.app) as client:
+        response = client.post(f"/api/campaigns/{campaign_id}/generate-proof", headers={"X-User-ID": advertiser_id})
+    
+    assert response.status_code == 404
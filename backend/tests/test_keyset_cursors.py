@@ -0,0 +1,80 @@
+"""Keyset pagination of asset listings and the approval queue."""
+import pytest
+from sqlalchemy import insert
+
+from crud.asset import get_assets_page
+from crud.campaign import get_approval_queue_page
+from models.campaign import Campaign
+from scripts.benchmark_support import create_assets, create_users
+
+
+def collect_pages(fetch_page, limit: int):
+    """Follow next cursors from the first page to the last; return the IDs and page sizes."""
+    ids, sizes, cursor = [], [], None
+    while True:
+        rows, cursor = fetch_page(limit, cursor)
+        ids.extend(row.id for row in rows)
+        sizes.append(len(rows))
+        if cursor is None:
+            return ids, sizes
+
+
+def test_asset_pages_cover_every_asset_newest_first(db):
+    user_id, other_user_id = create_users(db, 2)
+    # One bulk INSERT, so every asset shares the same uploaded_at second
+    asset_ids = create_assets(db, user_id, 23)
+    create_assets(db, other_user_id, 5)
+    
+    ids, sizes = collect_pages(lambda limit, cursor: get_assets_page(db, user_id, limit, cursor), 5)
+    
+    assert sizes == [5, 5, 5, 5, 3]
+    assert ids == sorted(asset_ids, reverse=True)
+
+
+def test_asset_page_filters_apply_across_pages(db):
+    user_id = create_users(db, 1)[0]
+    logo_ids = create_assets(db, user_id, 7, category="logo")
+    create_assets(db, user_id, 7)
+    
+    ids, _ = collect_pages(
+        lambda limit, cursor: get_assets_page(db, user_id, limit, cursor, category="logo"), 3
+    )
+    
+    assert ids == sorted(logo_ids, reverse=True)
+
+
+def test_last_full_asset_page_has_no_cursor(db):
+    user_id = create_users(db, 1)[0]
+    create_assets(db, user_id, 4)
+    
+    assets, cursor = get_assets_page(db, user_id, 4)
+    
+    assert len(assets) == 4
+    assert cursor is None
+
+
+def test_approval_queue_pages_cover_pending_campaigns_oldest_first(db):
+    advertiser_id = create_users(db, 1)[0]
+    campaign_ids = db.scalars(insert(Campaign).returning(Campaign.id, sort_by_parameter_order=True), [
+        {
+            "advertiser_id": advertiser_id,
+            "campaign_name": f"Campaign {i}",
+            "status": "pending_approval" if i % 3 else "draft",
+        }
+        for i in range(30)
+    ]).all()
+    db.commit()
+    pending_ids = [campaign_id for i, campaign_id in enumerate(campaign_ids) if i % 3]
+    
+    ids, sizes = collect_pages(lambda limit, cursor: get_approval_queue_page(db, limit, cursor), 6)
+    
+    assert sizes == [6, 6, 6, 2]
+    assert ids == sorted(pending_ids)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "WyJub3QgYSBkYXRlIiwgIngiXQ", "WzFd"])
+def test_malformed_cursor_raises_value_error(db, cursor):
+    with pytest.raises(ValueError):
+        get_assets_page(db, "00000000-0000-7000-8000-000000000000", 10, cursor)
+    with pytest.raises(ValueError):
+        get_approval_queue_page(db, 10, cursor)
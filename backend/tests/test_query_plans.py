@@ -0,0 +1,31 @@
+"""Query plans of the hot queries use their composite indexes."""
+import random
+
+import pytest
+
+from scripts.benchmark_support import temporary_database
+from scripts.query_plans import explain_query, hot_queries, seed
+
+# Query name -> index its plan must use
+EXPECTED_INDEXES = {name: expected_index for name, expected_index, _ in hot_queries("")}
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    """Engine, session and advertiser ID of a database seeded and analyzed once for all plans."""
+    with temporary_database() as (engine, db):
+        advertiser_id = seed(engine, 5000, random.Random(42))
+        # Plans depend on table statistics
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+        yield engine, db, advertiser_id
+
+
+@pytest.mark.parametrize("name", list(EXPECTED_INDEXES))
+def test_hot_query_uses_its_index(seeded, name):
+    engine, db, advertiser_id = seeded
+    run = next(run for query_name, _, run in hot_queries(advertiser_id) if query_name == name)
+    
+    plan = explain_query(engine, db, run)
+    
+    assert any(EXPECTED_INDEXES[name] in line for line in plan), "\n".join(plan)
@@ -0,0 +1,158 @@
+"""Read replica routing (database.ReplicaRouter) and sticky reads after writes."""
+import sqlite3
+import time
+
+import pytest
+from sqlalchemy import insert
+
+import database
+from database import SESSION_USER_KEY, ReplicaRouter
+from models.user import User
+
+
+@pytest.fixture
+def replica_paths(tmp_path):
+    """Two SQLite replica files that can be opened."""
+    paths = [tmp_path / "replica-1.db", tmp_path / "replica-2.db"]
+    for path in paths:
+        sqlite3.connect(path).close()
+    return paths
+
+
+def make_router(urls, eject_seconds: float = 30.0, sticky_seconds: float = 5.0) -> ReplicaRouter:
+    return ReplicaRouter(replica_urls=urls, eject_seconds=eject_seconds, sticky_seconds=sticky_seconds)
+
+
+def names(replicas) -> list:
+    return [replica.name for replica in replicas]
+
+
+def test_reads_rotate_over_the_replicas(replica_paths):
+    router = make_router([f"sqlite:///{path}" for path in replica_paths])
+    
+    firsts = [router.candidates(None)[0].name for _ in range(4)]
+    
+    assert firsts == ["replica-1", "replica-2", "replica-1", "replica-2"]
+    assert names(router.candidates("user")) == ["replica-1", "replica-2"]
+
+
+def test_without_replicas_every_read_uses_the_primary():
+    router = make_router([])
+    router.record_write("user")
+    
+    assert router.candidates(None) == []
+    assert router.session().get_bind() is database.engine
+
+
+def test_ejected_replica_is_skipped_until_it_recovers(replica_paths):
+    router = make_router([f"sqlite:///{path}" for path in replica_paths], eject_seconds=0.05)
+    
+    router.eject(router.replicas[0])
+    
+    assert names(router.candidates(None)) == ["replica-2"]
+    assert names(router.candidates(None)) == ["replica-2"]
+    assert router.replicas[0].ejections == 1
+    time.sleep(0.06)
+    assert sorted(names(router.candidates(None))) == ["replica-1", "replica-2"]
+
+
+def test_unreachable_replica_is_ejected_and_reads_fall_back_to_the_primary(tmp_path):
+    router = make_router([f"sqlite:///{tmp_path}/missing/replica.db"])
+    
+    db = router.session()
+    
+    assert db.get_bind() is database.engine
+    assert router.replicas[0].ejections == 1
+    assert router.candidates(None) == []
+    db.close()
+
+
+def test_session_connects_to_a_healthy_replica(tmp_path, replica_paths):
+    router = make_router([f"sqlite:///{tmp_path}/missing/replica.db", f"sqlite:///{replica_paths[0]}"])
+    
+    db = router.session()
+    
+    assert db.get_bind() is router.replicas[1].engine
+    db.close()
+
+
+def test_writer_reads_from_the_primary_for_sticky_seconds(replica_paths):
+    router = make_router([f"sqlite:///{path}" for path in replica_paths], sticky_seconds=0.05)
+    
+    router.record_write("writer")
+    
+    assert router.candidates("writer") == []
+    assert router.session("writer").get_bind() is database.engine
+    assert len(router.candidates("reader")) == 2
+    assert len(router.candidates(None)) == 2
+    time.sleep(0.06)
+    assert len(router.candidates("writer")) == 2
+
+
+def test_expired_writers_are_pruned(replica_paths):
+    router = make_router([f"sqlite:///{replica_paths[0]}"], sticky_seconds=0.01)
+    for number in range(100):
+        router.record_write(f"writer-{number}")
+    time.sleep(0.02)
+    
+    router.record_write("latest")
+    
+    assert list(router._recent_writers) == ["latest"]
+
+
+@pytest.mark.parametrize("sticky_seconds", [0.0, -1.0])
+def test_disabled_stickiness_keeps_writers_on_the_replicas(replica_paths, sticky_seconds):
+    router = make_router([f"sqlite:///{replica_paths[0]}"], sticky_seconds=sticky_seconds)
+    
+    router.record_write("writer")
+    router.record_write("writer")
+    
+    assert names(router.candidates("writer")) == ["replica-1"]
+
+
+@pytest.fixture
+def router(replica_paths, monkeypatch):
+    """Router installed as database.replica_router, whose writes the session events record."""
+    router = make_router([f"sqlite:///{path}" for path in replica_paths])
+    monkeypatch.setattr(database, "replica_router", router)
+    return router
+
+
+def add_user(db, email: str) -> None:
+    db.execute(insert(User), [{"email": email, "password": "test", "full_name": "Test", "role": "advertiser"}])
+
+
+def test_committed_write_makes_the_session_user_sticky(router, db):
+    db.info[SESSION_USER_KEY] = "writer"
+    
+    add_user(db, "writer@example.com")
+    db.commit()
+    
+    assert router.candidates("writer") == []
+
+
+def test_flushed_orm_write_makes_the_session_user_sticky(router, db):
+    db.info[SESSION_USER_KEY] = "writer"
+    
+    db.add(User(email="writer@example.com", password="test", full_name="Test", role="advertiser"))
+    db.commit()
+    
+    assert router.candidates("writer") == []
+
+
+def test_rolled_back_or_read_only_transactions_are_not_recorded(router, db):
+    db.info[SESSION_USER_KEY] = "writer"
+    
+    add_user(db, "writer@example.com")
+    db.rollback()
+    db.query(User).all()
+    db.commit()
+    
+    assert len(router.candidates("writer")) == 2
+
+
+def test_writes_without_a_session_user_are_not_recorded(router, db):
+    add_user(db, "anonymous@example.com")
+    db.commit()
+    
+    assert router._recent_writers == {}
@@ -0,0 +1,36 @@
+"""Re-uploading content whose object is queued for deletion keeps the object."""
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+import main
+from database import Base, SessionLocal, engine
+from models.s3_deletion import S3Deletion
+from scripts.benchmark_support import create_users
+from services.s3_deletion_service import S3DeletionService
+from services.s3_service import s3_service
+
+
+def test_reupload_cancels_queued_deletion(request):
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    user_id = create_users(db, 1, prefix=request.node.name)[0]
+    db.close()
+    headers = {"X-User-ID": user_id}
+    files = {"file": ("notes.txt", b"spring launch copy", "text/plain")}
+    
+    client = TestClient(main.app)
+    first = client.post("/api/assets/upload", files=files, headers=headers).json()
+    assert client.delete(f"/api/assets/{first['id']}", headers=headers).status_code == 204
+    
+    db = SessionLocal()
+    assert db.scalars(select(S3Deletion.s3_key)).all() == [first["s3_key"]]
+    db.close()
+    
+    second = client.post("/api/assets/upload", files=files, headers=headers).json()
+    assert second["s3_key"] == first["s3_key"]
+    
+    db = SessionLocal()
+    assert db.scalars(select(S3Deletion.s3_key)).all() == []
+    db.close()
+    assert S3DeletionService(poll_interval=60).drain() == 0
+    assert s3_service.head_file(second["s3_key"]) is not None
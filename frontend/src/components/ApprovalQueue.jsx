@@ -13,8 +13,18 @@ import EmptyState from '@/components/EmptyState';
  * @param {Array} props.campaigns - Array of campaigns to display
  * @param {boolean} props.loading - Whether data is loading
  * @param {Function} props.onRefresh - Optional callback when queue should be refreshed
+ * @param {boolean} props.hasMore - Whether another page of the queue can be loaded
+ * @param {Function} props.onLoadMore - Optional callback loading the next page
+ * @param {boolean} props.loadingMore - Whether the next page is loading
  */
-export default function ApprovalQueue({ campaigns = [], loading = false, onRefresh }) {
+export default function ApprovalQueue({
+  campaigns = [],
+  loading = false,
+  onRefresh,
+  hasMore = false,
+  onLoadMore,
+  loadingMore = false,
+}) {
   const navigate = useNavigate();
   const [error, setError] = useState(null);
 
@@ -33,8 +43,8 @@ export default function ApprovalQueue({ campaigns = [], loading = false, onRefre
         setInternalLoading(true);
         setError(null);
         try {
-          const data = await fetchApprovalQueue();
-          setInternalCampaigns(data || []);
+          const page = await fetchApprovalQueue();
+          setInternalCampaigns(page.items);
         } catch (err) {
           setError(err.message || 'Failed to load approval queue');
         } finally {
@@ -61,19 +71,6 @@ export default function ApprovalQueue({ campaigns = [], loading = false, onRefre
     navigate(`/approval-queue/${campaignId}`);
   };
 
-  // Create thumbnail preview from HTML (simple approach - show first image or placeholder)
-  const getThumbnail = (html) => {
-    if (!html) return null;
-    
-    // Try to extract first image src
-    const imgMatch = html.match(/<img[^>]+src=["']([^"']+)["']/i);
-    if (imgMatch && imgMatch[1]) {
-      return imgMatch[1];
-    }
-    
-    return null;
-  };
-
   if (displayLoading && displayCampaigns.length === 0) {
     return (
       <Card>
@@ -97,8 +94,8 @@ export default function ApprovalQueue({ campaigns = [], loading = false, onRefre
               setInternalLoading(true);
               setError(null);
               try {
-                const data = await fetchApprovalQueue();
-                setInternalCampaigns(data || []);
+                const page = await fetchApprovalQueue();
+                setInternalCampaigns(page.items);
               } catch (err) {
                 setError(err.message || 'Failed to load approval queue');
               } finally {
@@ -125,84 +122,87 @@ export default function ApprovalQueue({ campaigns = [], loading = false, onRefre
   }
 
   return (
-    <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-      {displayCampaigns.map((campaign) => {
-        const thumbnail = getThumbnail(campaign.generated_email_html);
-        
-        return (
-          <Card
-            key={campaign.id}
-            className="cursor-pointer hover:shadow-md transition-shadow focus-within:ring-2 focus-within:ring-primary focus-within:ring-offset-2"
-            onClick={() => handleCampaignClick(campaign.id)}
-            onKeyDown={(e) => {
-              if (e.key === 'Enter' || e.key === ' ') {
-                e.preventDefault();
-                handleCampaignClick(campaign.id);
-              }
-            }}
-            tabIndex={0}
-            role="button"
-            aria-label={`Review campaign: ${campaign.campaign_name}`}
-          >
-            <CardHeader>
-              <div className="flex items-start justify-between gap-2">
-                <CardTitle className="text-lg line-clamp-2 flex-1">
-                  {campaign.campaign_name}
-                </CardTitle>
-              </div>
-              <CardDescription className="flex items-center gap-4 mt-2">
-                <span className="flex items-center gap-1 text-xs">
-                  <User className="h-3 w-3" />
-                  Advertiser ID: {campaign.advertiser_id.slice(0, 8)}...
-                </span>
-              </CardDescription>
-            </CardHeader>
-            <CardContent>
-              {/* Thumbnail Preview */}
-              {thumbnail ? (
-                <div className="mb-4 rounded-md overflow-hidden border border-border bg-muted">
-                  <img
-                    src={thumbnail}
-                    alt="Email preview"
-                    className="w-full h-32 object-cover"
-                    onError={(e) => {
-                      e.target.style.display = 'none';
-                    }}
-                  />
-                </div>
-              ) : campaign.generated_email_html ? (
-                <div className="mb-4 rounded-md border border-border bg-muted h-32 flex items-center justify-center">
-                  <Mail className="h-8 w-8 text-muted-foreground" />
+    <div className="space-y-6">
+      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
+        {displayCampaigns.map((campaign) => {
+          return (
+            <Card
+              key={campaign.id}
+              className="cursor-pointer hover:shadow-md transition-shadow focus-within:ring-2 focus-within:ring-primary focus-within:ring-offset-2"
+              onClick={() => handleCampaignClick(campaign.id)}
+              onKeyDown={(e) => {
+                if (e.key === 'Enter' || e.key === ' ') {
+                  e.preventDefault();
+                  handleCampaignClick(campaign.id);
+                }
+              }}
+              tabIndex={0}
+              role="button"
+              aria-label={`Review campaign: ${campaign.campaign_name}`}
+            >
+              <CardHeader>
+                <div className="flex items-start justify-between gap-2">
+                  <CardTitle className="text-lg line-clamp-2 flex-1">
+                    {campaign.campaign_name}
+                  </CardTitle>
                 </div>
-              ) : null}
+                <CardDescription className="flex items-center gap-4 mt-2">
+                  <span className="flex items-center gap-1 text-xs">
+                    <User className="h-3 w-3" />
+                    Advertiser ID: {campaign.advertiser_id.slice(0, 8)}...
+                  </span>
+                </CardDescription>
+              </CardHeader>
+              <CardContent>
+                {/* Proof placeholder (the queue lists summaries without the generated email) */}
+                {campaign.has_proof ? (
+                  <div className="mb-4 rounded-md border border-border bg-muted h-32 flex items-center justify-center">
+                    <Mail className="h-8 w-8 text-muted-foreground" />
+                  </div>
+                ) : null}
 
-              <div className="space-y-2">
-                <div className="flex items-center gap-1 text-xs text-muted-foreground">
-                  <Calendar className="h-3 w-3" />
-                  Submitted: {formatDate(campaign.created_at)}
-                </div>
-                {campaign.target_audience && (
-                  <div>
-                    <p className="text-xs font-medium text-muted-foreground">Target Audience</p>
-                    <p className="text-sm line-clamp-2">{campaign.target_audience}</p>
+                <div className="space-y-2">
+                  <div className="flex items-center gap-1 text-xs text-muted-foreground">
+                    <Calendar className="h-3 w-3" />
+                    Submitted: {formatDate(campaign.created_at)}
                   </div>
-                )}
-              </div>
-              <Button
-                variant="outline"
-                className="w-full mt-4 focus:outline-none focus:ring-2 focus:ring-primary focus:ring-offset-2"
-                onClick={(e) => {
-                  e.stopPropagation();
-                  handleCampaignClick(campaign.id);
-                }}
-                aria-label={`Review campaign: ${campaign.campaign_name}`}
-              >
-                Review Campaign
-              </Button>
-            </CardContent>
-          </Card>
-        );
-      })}
+                  {campaign.target_audience && (
+                    <div>
+                      <p className="text-xs font-medium text-muted-foreground">Target Audience</p>
+                      <p className="text-sm line-clamp-2">{campaign.target_audience}</p>
+                    </div>
+                  )}
+                </div>
+                <Button
+                  variant="outline"
+                  className="w-full mt-4 focus:outline-none focus:ring-2 focus:ring-primary focus:ring-offset-2"
+                  onClick={(e) => {
+                    e.stopPropagation();
+                    handleCampaignClick(campaign.id);
+                  }}
+                  aria-label={`Review campaign: ${campaign.campaign_name}`}
+                >
+                  Review Campaign
+                </Button>
+              </CardContent>
+            </Card>
+          );
+        })}
+      </div>
+      {hasMore && onLoadMore && (
+        <div className="flex justify-center">
+          <Button variant="outline" onClick={onLoadMore} disabled={loadingMore}>
+            {loadingMore ? (
+              <>
+                <Loader2 className="h-4 w-4 mr-2 animate-spin" />
+                Loading...
+              </>
+            ) : (
+              'Load more'
+            )}
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
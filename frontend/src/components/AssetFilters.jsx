@@ -0,0 +1,102 @@
+import { X } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { Input } from '@/components/ui/input';
+import { Label } from '@/components/ui/label';
+import { hasAssetFilters } from '@/hooks/useAssets';
+
+const CATEGORY_OPTIONS = [
+  { value: '', label: 'All categories' },
+  { value: 'logo', label: 'Logo' },
+  { value: 'image', label: 'Image' },
+  { value: 'copy', label: 'Copy' },
+  { value: 'url', label: 'URL' },
+];
+
+const FILE_TYPE_OPTIONS = [
+  { value: '', label: 'All file types' },
+  { value: 'image/png', label: 'PNG' },
+  { value: 'image/jpeg', label: 'JPEG' },
+  { value: 'image/gif', label: 'GIF' },
+  { value: 'image/webp', label: 'WebP' },
+  { value: 'image/svg+xml', label: 'SVG' },
+  { value: 'application/pdf', label: 'PDF' },
+  { value: 'text/plain', label: 'Text' },
+];
+
+const SELECT_CLASS_NAME =
+  'flex h-9 w-full rounded-md border border-input bg-transparent px-3 py-1 text-sm shadow-sm transition-colors focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-ring disabled:cursor-not-allowed disabled:opacity-50';
+
+/**
+ * AssetFilters component for the server-side asset listing filters
+ */
+export default function AssetFilters({ filters = {}, onChange, disabled = false }) {
+  const update = (key) => (e) => onChange({ ...filters, [key]: e.target.value });
+
+  return (
+    <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-5 gap-4 items-end">
+      <div className="space-y-2">
+        <Label htmlFor="asset-filter-category">Category</Label>
+        <select
+          id="asset-filter-category"
+          className={SELECT_CLASS_NAME}
+          value={filters.category || ''}
+          onChange={update('category')}
+          disabled={disabled}
+        >
+          {CATEGORY_OPTIONS.map((option) => (
+            <option key={option.value} value={option.value}>
+              {option.label}
+            </option>
+          ))}
+        </select>
+      </div>
+      <div className="space-y-2">
+        <Label htmlFor="asset-filter-file-type">File type</Label>
+        <select
+          id="asset-filter-file-type"
+          className={SELECT_CLASS_NAME}
+          value={filters.fileType || ''}
+          onChange={update('fileType')}
+          disabled={disabled}
+        >
+          {FILE_TYPE_OPTIONS.map((option) => (
+            <option key={option.value} value={option.value}>
+              {option.label}
+            </option>
+          ))}
+        </select>
+      </div>
+      <div className="space-y-2">
+        <Label htmlFor="asset-filter-uploaded-from">Uploaded from</Label>
+        <Input
+          id="asset-filter-uploaded-from"
+          type="date"
+          value={filters.uploadedFrom || ''}
+          max={filters.uploadedTo || undefined}
+          onChange={update('uploadedFrom')}
+          disabled={disabled}
+        />
+      </div>
+      <div className="space-y-2">
+        <Label htmlFor="asset-filter-uploaded-to">Uploaded to</Label>
+        <Input
+          id="asset-filter-uploaded-to"
+          type="date"
+          value={filters.uploadedTo || ''}
+          min={filters.uploadedFrom || undefined}
+          onChange={update('uploadedTo')}
+          disabled={disabled}
+        />
+      </div>
+      <Button
+        variant="ghost"
+        size="sm"
+        onClick={() => onChange({})}
+        disabled={disabled || !hasAssetFilters(filters)}
+      >
+        <X className="h-4 w-4 mr-2" />
+        Clear filters
+      </Button>
+    </div>
+  );
+}
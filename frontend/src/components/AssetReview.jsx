@@ -5,7 +5,9 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/com
 import { Checkbox } from '@/components/ui/checkbox';
 import { cn } from '@/lib/utils.js';
 import AssetCard from './AssetCard';
+import AssetFilters from './AssetFilters';
 import EmptyState from '@/components/EmptyState';
+import { hasAssetFilters } from '@/hooks/useAssets';
 
 /**
  * AssetReview component for reviewing and managing uploaded assets
@@ -19,6 +21,12 @@ export default function AssetReview({
   selectable = false,
   selectedAssetIds = [],
   onAssetToggle = null,
+  filters = null,
+  onFiltersChange = null,
+  totalCount = null,
+  hasMore = false,
+  onLoadMore = null,
+  loadingMore = false,
 }) {
   const [internalSelectedAssets, setInternalSelectedAssets] = useState([]);
   const [isRecategorizing, setIsRecategorizing] = useState(false);
@@ -95,7 +103,10 @@ export default function AssetReview({
   };
 
 
-  if (loading && assets.length === 0) {
+  // Keep the filter bar on screen while a filtered listing loads
+  const filtering = hasAssetFilters(filters || {});
+
+  if (loading && assets.length === 0 && !filtering) {
     return (
       <Card>
         <CardContent className="p-12">
@@ -108,7 +119,7 @@ export default function AssetReview({
     );
   }
 
-  if (assets.length === 0) {
+  if (assets.length === 0 && !filtering) {
     return (
       <EmptyState
         icon={Upload}
@@ -129,7 +140,9 @@ export default function AssetReview({
             <div>
               <CardTitle>Review Assets</CardTitle>
               <CardDescription>
-                {assets.length} asset{assets.length !== 1 ? 's' : ''} uploaded
+                {totalCount !== null && totalCount > assets.length
+                  ? `Showing ${assets.length} of ${totalCount} assets`
+                  : `${assets.length} asset${assets.length !== 1 ? 's' : ''}${filtering ? ' found' : ' uploaded'}`}
               </CardDescription>
             </div>
             <div className="flex items-center gap-2">
@@ -157,15 +170,28 @@ export default function AssetReview({
                 variant="outline"
                 size="sm"
                 onClick={handleSelectAll}
-                disabled={isRecategorizing}
+                disabled={isRecategorizing || assets.length === 0}
               >
-                {selectedAssets.length === assets.length ? 'Deselect All' : 'Select All'}
+                {assets.length > 0 && selectedAssets.length === assets.length ? 'Deselect All' : 'Select All'}
               </Button>
             </div>
           </div>
         </CardHeader>
+        {onFiltersChange && (
+          <CardContent>
+            <AssetFilters filters={filters || {}} onChange={onFiltersChange} disabled={loading} />
+          </CardContent>
+        )}
       </Card>
 
+      {assets.length === 0 && (
+        <EmptyState
+          icon={Upload}
+          title={loading ? 'Loading assets...' : 'No assets match these filters'}
+          description={loading ? undefined : 'Change or clear the filters to see more assets.'}
+        />
+      )}
+
       {/* Assets by Category */}
       {categories.map((category) => {
         const categoryAssets = groupedAssets[category] || [];
@@ -205,6 +231,21 @@ export default function AssetReview({
           </div>
         );
       })}
+
+      {hasMore && onLoadMore && (
+        <div className="flex justify-center">
+          <Button variant="outline" onClick={onLoadMore} disabled={loadingMore}>
+            {loadingMore ? (
+              <>
+                <Loader2 className="h-4 w-4 mr-2 animate-spin" />
+                Loading...
+              </>
+            ) : (
+              'Load more'
+            )}
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
@@ -1,6 +1,43 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef } from 'react';
 import apiClient from '@/lib/axios.js';
 
+// Assets requested per page of GET /assets
+const ASSET_PAGE_SIZE = 50;
+
+/**
+ * Start of a local calendar day as an ISO timestamp
+ * @param {string} day - Date in YYYY-MM-DD form
+ * @param {number} offsetDays - Days to add
+ */
+function startOfDay(day, offsetDays = 0) {
+  const date = new Date(`${day}T00:00:00`);
+  date.setDate(date.getDate() + offsetDays);
+  return date.toISOString();
+}
+
+/**
+ * Convert listing filters to GET /assets query parameters, dropping unset ones
+ * @param {Object} filters - { category, fileType, uploadedFrom, uploadedTo }; the
+ *   upload dates are inclusive YYYY-MM-DD days
+ */
+function assetFilterParams({ category, fileType, uploadedFrom, uploadedTo } = {}) {
+  return {
+    ...(category && { category }),
+    ...(fileType && { file_type: fileType }),
+    ...(uploadedFrom && { uploaded_after: startOfDay(uploadedFrom) }),
+    // uploaded_before is exclusive, so the last day ends at the next midnight
+    ...(uploadedTo && { uploaded_before: startOfDay(uploadedTo, 1) }),
+  };
+}
+
+/**
+ * Check whether any asset listing filter is set
+ * @param {Object} filters - { category, fileType, uploadedFrom, uploadedTo }
+ */
+export function hasAssetFilters(filters = {}) {
+  return Object.values(filters).some(Boolean);
+}
+
 /**
  * Custom hook for managing assets
  * Provides functions for fetching, uploading, deleting, recategorizing, and updating assets
@@ -8,18 +45,31 @@ import apiClient from '@/lib/axios.js';
 export function useAssets() {
   const [assets, setAssets] = useState([]);
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [totalCount, setTotalCount] = useState(null);
+  // Filters of the loaded listing, reused for later pages and refreshes
+  const filtersRef = useRef({});
 
   /**
-   * Fetch all assets for the current user
+   * Fetch the first page of the current user's assets, newest first
+   * @param {Object} newFilters - Optional { category, fileType, uploadedFrom, uploadedTo },
+   *   applied by the server; omit to keep the current filters
    */
-  const fetchAssets = useCallback(async () => {
+  const fetchAssets = useCallback(async (newFilters) => {
     setLoading(true);
     setError(null);
     try {
-      const response = await apiClient.get('/assets');
-      setAssets(response.data);
-      return response.data;
+      const activeFilters = newFilters ?? filtersRef.current;
+      const response = await apiClient.get('/assets', {
+        params: { limit: ASSET_PAGE_SIZE, include_total: true, ...assetFilterParams(activeFilters) },
+      });
+      setAssets(response.data.items);
+      setNextCursor(response.data.next_cursor);
+      setTotalCount(response.data.total_count);
+      filtersRef.current = activeFilters;
+      return response.data.items;
     } catch (err) {
       const errorMessage = err.message || 'Failed to fetch assets';
       setError(errorMessage);
@@ -29,6 +79,29 @@ export function useAssets() {
     }
   }, []);
 
+  /**
+   * Fetch the next page with the current filters and append it to the loaded assets
+   */
+  const loadMoreAssets = useCallback(async () => {
+    if (!nextCursor) return [];
+    setLoadingMore(true);
+    setError(null);
+    try {
+      const response = await apiClient.get('/assets', {
+        params: { limit: ASSET_PAGE_SIZE, cursor: nextCursor, ...assetFilterParams(filtersRef.current) },
+      });
+      setAssets((prev) => [...prev, ...response.data.items]);
+      setNextCursor(response.data.next_cursor);
+      return response.data.items;
+    } catch (err) {
+      const errorMessage = err.message || 'Failed to fetch more assets';
+      setError(errorMessage);
+      throw err;
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [nextCursor]);
+
   /**
    * Upload a new asset file
    * @param {File} file - The file to upload
@@ -56,7 +129,8 @@ export function useAssets() {
       });
 
       const newAsset = response.data;
-      setAssets((prev) => [...prev, newAsset]);
+      // Newest first, as in the listing
+      setAssets((prev) => [newAsset, ...prev]);
       return newAsset;
     } catch (err) {
       const errorMessage = err.message || 'Failed to upload asset';
@@ -77,6 +151,7 @@ export function useAssets() {
     try {
       await apiClient.delete(`/assets/${assetId}`);
       setAssets((prev) => prev.filter((asset) => asset.id !== assetId));
+      setTotalCount((prev) => (prev === null ? prev : prev - 1));
     } catch (err) {
       const errorMessage = err.message || 'Failed to delete asset';
       setError(errorMessage);
@@ -153,8 +228,12 @@ export function useAssets() {
   return {
     assets,
     loading,
+    loadingMore,
     error,
+    totalCount,
+    hasMore: nextCursor !== null,
     fetchAssets,
+    loadMoreAssets,
     uploadAsset,
     deleteAsset,
     recategorizeAssets,
@@ -1,6 +1,9 @@
 import { useState, useCallback } from 'react';
 import apiClient from '@/lib/axios.js';
 
+// Campaigns requested per page of GET /campaigns/approval-queue
+const APPROVAL_QUEUE_PAGE_SIZE = 50;
+
 /**
  * Custom hook for managing campaigns
  * Provides functions for fetching, creating, updating, and deleting campaigns
@@ -201,15 +204,20 @@ export function useCampaigns() {
   }, [fetchCampaign]);
 
   /**
-   * Fetch approval queue (campaign manager only)
+   * Fetch one page of approval queue summaries (campaign manager only), oldest first
+   * @param {string|null} cursor - next_cursor of the previous page, or null for the first page
+   * @returns {Promise<{items: Array, next_cursor: string|null}>} The page; pass next_cursor to get the following one
    */
-  const fetchApprovalQueue = useCallback(async () => {
+  const fetchApprovalQueue = useCallback(async (cursor = null) => {
     setLoading(true);
     setError(null);
     try {
-      const response = await apiClient.get('/campaigns/approval-queue');
-      setCampaigns(response.data);
-      return response.data;
+      const response = await apiClient.get('/campaigns/approval-queue', {
+        params: { limit: APPROVAL_QUEUE_PAGE_SIZE, ...(cursor && { cursor }) },
+      });
+      const page = response.data;
+      setCampaigns((prev) => (cursor ? [...prev, ...page.items] : page.items));
+      return page;
     } catch (err) {
       const errorMessage = err.response?.data?.detail || err.message || 'Failed to fetch approval queue';
       setError(errorMessage);
@@ -14,7 +14,9 @@ export default function ApprovalQueuePage() {
   const location = useLocation();
   const { fetchApprovalQueue } = useCampaigns();
   const [campaigns, setCampaigns] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [successMessage, setSuccessMessage] = useState('');
 
   // Check for success message from navigation state and refresh queue
@@ -37,8 +39,9 @@ export default function ApprovalQueuePage() {
   const loadQueue = async () => {
     setLoading(true);
     try {
-      const data = await fetchApprovalQueue();
-      setCampaigns(data || []);
+      const page = await fetchApprovalQueue();
+      setCampaigns(page.items);
+      setNextCursor(page.next_cursor);
     } catch (err) {
       console.error('Failed to load approval queue:', err);
     } finally {
@@ -46,6 +49,20 @@ export default function ApprovalQueuePage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await fetchApprovalQueue(nextCursor);
+      setCampaigns((prev) => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Failed to load more of the approval queue:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     loadQueue();
     // eslint-disable-next-line react-hooks/exhaustive-deps
@@ -107,8 +124,11 @@ export default function ApprovalQueuePage() {
         <Card>
           <CardContent className="p-4">
             <p className="text-sm text-muted-foreground">
-              <span className="font-medium text-foreground">{campaigns.length}</span>{' '}
-              {campaigns.length === 1 ? 'campaign' : 'campaigns'} pending approval
+              <span className="font-medium text-foreground">
+                {campaigns.length}
+                {nextCursor ? '+' : ''}
+              </span>{' '}
+              {campaigns.length === 1 && !nextCursor ? 'campaign' : 'campaigns'} pending approval
             </p>
           </CardContent>
         </Card>
@@ -122,7 +142,14 @@ export default function ApprovalQueuePage() {
           ))}
         </div>
       ) : (
-        <ApprovalQueue campaigns={campaigns} loading={loading} onRefresh={handleRefresh} />
+        <ApprovalQueue
+          campaigns={campaigns}
+          loading={loading}
+          onRefresh={handleRefresh}
+          hasMore={nextCursor !== null}
+          onLoadMore={loadMore}
+          loadingMore={loadingMore}
+        />
       )}
     </div>
   );
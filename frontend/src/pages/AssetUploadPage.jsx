@@ -21,12 +21,17 @@ export default function AssetUploadPage() {
   const navigate = useNavigate();
   const [currentStep, setCurrentStep] = useState(STEPS.UPLOAD);
   const [deletingAssetId, setDeletingAssetId] = useState(null);
+  const [filters, setFilters] = useState({});
 
   const {
     assets,
     loading,
+    loadingMore,
     error,
+    totalCount,
+    hasMore,
     fetchAssets,
+    loadMoreAssets,
     uploadAsset,
     deleteAsset,
     recategorizeAssets,
@@ -53,6 +58,23 @@ export default function AssetUploadPage() {
     }
   };
 
+  const handleFiltersChange = async (newFilters) => {
+    setFilters(newFilters);
+    try {
+      await fetchAssets(newFilters);
+    } catch (err) {
+      console.error('Filtering assets failed:', err);
+    }
+  };
+
+  const handleLoadMore = async () => {
+    try {
+      await loadMoreAssets();
+    } catch (err) {
+      console.error('Loading more assets failed:', err);
+    }
+  };
+
   const handleDelete = async (assetId) => {
     setDeletingAssetId(assetId);
     try {
@@ -161,7 +183,7 @@ export default function AssetUploadPage() {
           {assets.length > 0 && (
             <div className="mt-6">
               <Button onClick={() => setCurrentStep(STEPS.REVIEW)}>
-                Continue to Review ({assets.length} asset{assets.length !== 1 ? 's' : ''})
+                Continue to Review ({totalCount ?? assets.length} asset{(totalCount ?? assets.length) !== 1 ? 's' : ''})
               </Button>
             </div>
           )}
@@ -187,6 +209,12 @@ export default function AssetUploadPage() {
             onRecategorize={handleRecategorize}
             loading={loading}
             deletingAssetId={deletingAssetId}
+            filters={filters}
+            onFiltersChange={handleFiltersChange}
+            totalCount={totalCount}
+            hasMore={hasMore}
+            onLoadMore={handleLoadMore}
+            loadingMore={loadingMore}
           />
           {assets.length > 0 && (
             <div className="flex justify-end">
@@ -225,6 +253,13 @@ export default function AssetUploadPage() {
             onCategoryUpdate={handleCategoryUpdate}
             loading={loading}
           />
+          {hasMore && (
+            <div className="flex justify-center">
+              <Button variant="outline" onClick={handleLoadMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more assets'}
+              </Button>
+            </div>
+          )}
         </div>
       )}
     </div>
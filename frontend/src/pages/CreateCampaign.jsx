@@ -3,7 +3,7 @@ import { useNavigate, Link } from 'react-router-dom';
 import { Upload, FileText } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent } from '@/components/ui/card';
-import { useAssets } from '@/hooks/useAssets';
+import { useAssets, hasAssetFilters } from '@/hooks/useAssets';
 import { useCampaigns } from '@/hooks/useCampaigns';
 import AssetReview from '@/components/AssetReview';
 import CampaignForm from '@/components/CampaignForm';
@@ -21,12 +21,17 @@ export default function CreateCampaign() {
   const [currentStep, setCurrentStep] = useState(STEPS.ASSETS);
   const [selectedAssetIds, setSelectedAssetIds] = useState([]);
   const [deletingAssetId, setDeletingAssetId] = useState(null);
+  const [assetFilters, setAssetFilters] = useState({});
 
   const {
     assets,
     loading: assetsLoading,
+    loadingMore: assetsLoadingMore,
     error: assetsError,
+    totalCount: assetsTotalCount,
+    hasMore: hasMoreAssets,
     fetchAssets,
+    loadMoreAssets,
     deleteAsset,
   } = useAssets();
 
@@ -41,6 +46,23 @@ export default function CreateCampaign() {
     fetchAssets();
   }, [fetchAssets]);
 
+  const handleFiltersChange = async (newFilters) => {
+    setAssetFilters(newFilters);
+    try {
+      await fetchAssets(newFilters);
+    } catch (err) {
+      console.error('Filtering assets failed:', err);
+    }
+  };
+
+  const handleLoadMore = async () => {
+    try {
+      await loadMoreAssets();
+    } catch (err) {
+      console.error('Loading more assets failed:', err);
+    }
+  };
+
   const handleDelete = async (assetId) => {
     setDeletingAssetId(assetId);
     try {
@@ -172,12 +194,12 @@ export default function CreateCampaign() {
             </p>
           </div>
 
-          {assets.length > 0 ? (
+          {assets.length > 0 || hasAssetFilters(assetFilters) ? (
             <div className="space-y-4">
               <div className="flex items-center justify-between">
                 <h3 className="text-lg font-semibold">Your Assets</h3>
                 <p className="text-sm text-muted-foreground">
-                  {selectedAssetIds.length} of {assets.length} selected
+                  {selectedAssetIds.length} selected
                 </p>
               </div>
               <AssetReview
@@ -188,6 +210,12 @@ export default function CreateCampaign() {
                 selectable={true}
                 selectedAssetIds={selectedAssetIds}
                 onAssetToggle={handleAssetToggle}
+                filters={assetFilters}
+                onFiltersChange={handleFiltersChange}
+                totalCount={assetsTotalCount}
+                hasMore={hasMoreAssets}
+                onLoadMore={handleLoadMore}
+                loadingMore={assetsLoadingMore}
               />
               {selectedAssetIds.length > 0 && (
                 <div className="flex justify-end">
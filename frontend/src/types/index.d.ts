@@ -36,6 +36,12 @@ export interface Asset {
   uploaded_at: string; // ISO datetime string
 }
 
+export interface AssetListResponse {
+  items: Asset[];
+  next_cursor: string | null;
+  total_count: number | null;
+}
+
 export interface AssetUpdate {
   category?: AssetCategory;
 }
@@ -60,6 +66,23 @@ export interface Campaign {
   updated_at: string; // ISO datetime string
 }
 
+export interface CampaignSummary {
+  id: string;
+  advertiser_id: string;
+  campaign_name: string;
+  target_audience: string | null;
+  campaign_goal: string | null;
+  status: CampaignStatus;
+  has_proof: boolean;
+  created_at: string; // ISO datetime string
+  updated_at: string; // ISO datetime string
+}
+
+export interface ApprovalQueueResponse {
+  items: CampaignSummary[];
+  next_cursor: string | null;
+}
+
 export interface CampaignAsset {
   id: string;
   campaign_id: string;